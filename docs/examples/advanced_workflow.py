@@ -5,69 +5,77 @@ Advanced Workflow Examples
 Demonstrates complex, real-world workflows combining multiple features.
 """
 
+import os
 import sys
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from valheim_save_tools_py import ValheimSaveTools
 
 
-def complete_world_cleanup():
+# Boss defeat keys in progression order
+BOSS_KEYS = (
+    "defeated_eikthyr",
+    "defeated_gdking",
+    "defeated_bonemass",
+    "defeated_dragon",
+    "defeated_goblinking",
+    "defeated_queen",
+)
+_BOSS_SET = frozenset(BOSS_KEYS)
+
+# (output file, bosses kept defeated) for each progression stage
+MILESTONES = tuple(
+    (f"stage{i}_{name}.db", BOSS_KEYS[:i])
+    for i, name in enumerate(("eikthyr", "elder", "bonemass", "moder", "yagluth"), start=1)
+)
+
+
+def complete_world_cleanup(vst):
     """Complete world cleanup: backup, clean, reset, restore bosses."""
-    vst = ValheimSaveTools(verbose=True)
-    
-    print("Step 1: Creating backup...")
-    backup_data = vst.to_json("world.db", "world_backup.json")
-    print(f"✓ Backup created with version: {backup_data.get('version', 'unknown')}\n")
-    
-    print("Step 2: Listing current global keys...")
-    original_keys = vst.list_global_keys("world.db")
-    boss_keys = [k for k in original_keys if k.startswith("defeated_")]
-    print(f"✓ Found {len(boss_keys)} boss defeats\n")
-    
-    print("Step 3: Cleaning and resetting world...")
-    result = (vst.process("world.db")
-                 .clean_structures(threshold=30)
-                 .reset_world()
-                 .save("world_cleaned.db"))
-    print(f"✓ World cleaned and reset: {result}\n")
-    
-    print("Step 4: Restoring boss defeats...")
-    processor = vst.process("world_cleaned.db")
-    for boss_key in boss_keys:
-        processor.add_global_key(boss_key)
-    result = processor.save("world.db")
-    print(f"✓ Boss defeats restored: {result}\n")
-    
-    print("Complete! World is fresh but bosses remain defeated.")
+    # Verbose output for this example only
+    vst.verbose = True
+    try:
+        print("Step 1: Creating backup...")
+        backup_data = vst.to_json("world.db", "world_backup.json")
+        print(f"✓ Backup created with version: {backup_data.get('version', 'unknown')}\n")
+        
+        print("Step 2: Listing current global keys...")
+        original_keys = vst.list_global_keys("world.db")
+        boss_keys = sorted(_BOSS_SET.intersection(original_keys))
+        print(f"✓ Found {len(boss_keys)} boss defeats\n")
+        
+        print("Step 3: Cleaning and resetting world...")
+        result = (vst.process("world.db")
+                     .clean_structures(threshold=30)
+                     .reset_world()
+                     .save("world_cleaned.db"))
+        print(f"✓ World cleaned and reset: {result}\n")
+        
+        print("Step 4: Restoring boss defeats...")
+        processor = vst.process("world_cleaned.db")
+        for boss_key in boss_keys:
+            processor.add_global_key(boss_key)
+        result = processor.save("world.db")
+        print(f"✓ Boss defeats restored: {result}\n")
+        
+        print("Complete! World is fresh but bosses remain defeated.")
+    finally:
+        vst.verbose = False
 
 
-def migrate_world_between_servers():
+def migrate_world_between_servers(vst):
     """Migrate world data between servers."""
-    vst = ValheimSaveTools()
-    
     source_world = "server1_world.db"
     target_world = "server2_world.db"
     
-    print("Step 1: Export source world to JSON...")
-    json_export = vst.to_json(source_world, "world_transfer.json")
-    print(f"✓ Exported: {json_export}\n")
-    
-    print("Step 2: Clean structures before transfer...")
-    result = (vst.process(source_world)
-                 .clean_structures(threshold=25)
-                 .to_json("world_transfer_cleaned.json"))
-    print(f"✓ Cleaned export: {result}\n")
-    
-    print("Step 3: Import to target server...")
-    imported = vst.from_json("world_transfer_cleaned.json", target_world)
+    print("Cleaning and transferring world in one pass...")
+    imported = vst.transform(source_world, target_world, clean=25)
     print(f"✓ Imported to: {imported}\n")
     
     print("Migration complete!")
 
 
-def batch_process_multiple_worlds():
+def batch_process_multiple_worlds(vst):
     """Process multiple world files with different operations."""
-    vst = ValheimSaveTools()
-    
     worlds = [
         ("creative_world.db", {"clean": True, "threshold": 50, "reset": True}),
         ("survival_world.db", {"clean": True, "threshold": 25, "reset": False}),
@@ -92,10 +100,8 @@ def batch_process_multiple_worlds():
         print(f"  ✓ Saved to: {output}")
 
 
-def create_world_variants():
+def create_world_variants(vst):
     """Create multiple variants of a world with different settings."""
-    vst = ValheimSaveTools()
-    
     base_world = "world.db"
     
     variants = [
@@ -131,15 +137,13 @@ def create_world_variants():
         print(f"✓ Created: {output}")
 
 
-def world_analysis_and_optimization():
+def world_analysis_and_optimization(vst):
     """Analyze world and optimize based on findings."""
-    vst = ValheimSaveTools()
-    
     world_file = "world.db"
     
     print("Step 1: Analyzing world...")
     keys = vst.list_global_keys(world_file)
-    boss_keys = [k for k in keys if k.startswith("defeated_")]
+    boss_keys = _BOSS_SET.intersection(keys)
     
     print(f"  Total global keys: {len(keys)}")
     print(f"  Boss defeats: {len(boss_keys)}")
@@ -165,21 +169,11 @@ def world_analysis_and_optimization():
     print("Optimization complete!")
 
 
-def progressive_world_reset():
+def progressive_world_reset(vst):
     """Reset world progressively, preserving certain milestones."""
-    vst = ValheimSaveTools()
-    
-    milestones = [
-        ("stage1_eikthyr.db", ["defeated_eikthyr"]),
-        ("stage2_elder.db", ["defeated_eikthyr", "defeated_gdking"]),
-        ("stage3_bonemass.db", ["defeated_eikthyr", "defeated_gdking", "defeated_bonemass"]),
-        ("stage4_moder.db", ["defeated_eikthyr", "defeated_gdking", "defeated_bonemass", "defeated_dragon"]),
-        ("stage5_yagluth.db", ["defeated_eikthyr", "defeated_gdking", "defeated_bonemass", "defeated_dragon", "defeated_goblinking"]),
-    ]
-    
     base_world = "world.db"
     
-    for filename, bosses in milestones:
+    for filename, bosses in MILESTONES:
         print(f"\nCreating {filename}...")
         
         processor = vst.process(base_world)
@@ -193,10 +187,8 @@ def progressive_world_reset():
         print(f"✓ Created with {len(bosses)} boss(es) defeated")
 
 
-def error_recovery_workflow():
+def error_recovery_workflow(vst):
     """Demonstrate error recovery and validation."""
-    vst = ValheimSaveTools()
-    
     world_file = "world.db"
     
     print("Step 1: Validating file...")
@@ -228,10 +220,8 @@ def error_recovery_workflow():
     print("Workflow complete!")
 
 
-def context_manager_complex_workflow():
+def context_manager_complex_workflow(vst):
     """Complex workflow using context manager."""
-    vst = ValheimSaveTools(verbose=False)
-    
     # Get original state
     original_keys = vst.list_global_keys("world.db")
     print(f"Original state: {len(original_keys)} global keys\n")
@@ -251,37 +241,41 @@ def context_manager_complex_workflow():
     print("Keys added:", [k for k in new_keys if k not in original_keys])
 
 
-def batch_convert_and_backup():
+def batch_convert_and_backup(vst):
     """Batch convert all worlds and create organized backups."""
-    vst = ValheimSaveTools()
-    
     from datetime import datetime
-    import shutil
     
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    backup_dir = Path(f"backups_{timestamp}")
-    backup_dir.mkdir(exist_ok=True)
+    backup_dir = f"backups_{timestamp}"
+    os.makedirs(backup_dir, exist_ok=True)
     
-    world_dir = Path("./worlds")
+    world_dir = "./worlds"
     
     print(f"Creating backups in {backup_dir}/\n")
     
-    for db_file in world_dir.glob("*.db"):
-        print(f"Processing {db_file.name}...")
-        
-        # Convert to JSON for backup
-        json_name = f"{db_file.stem}_backup.json"
-        json_backup = vst.to_json(str(db_file))
-        
-        # Move to backup directory
-        shutil.move(json_backup, backup_dir / json_name)
-        print(f"✓ Backed up to {backup_dir / json_name}")
+    def backup_world(entry):
+        # Convert straight into the backup directory so no move is needed
+        stem = os.path.splitext(entry.name)[0]
+        json_backup = os.path.join(backup_dir, f"{stem}_backup.json")
+        vst.to_json(entry.path, json_backup)
+        return entry.name, json_backup
+    
+    # Each conversion runs in its own JVM process, so threads are enough to
+    # keep every core busy
+    with os.scandir(world_dir) as entries:
+        worlds = [entry for entry in entries
+                  if entry.name.endswith(".db") and entry.is_file()]
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for name, backup in executor.map(backup_world, worlds):
+            print(f"✓ Backed up {name} to {backup}")
     
     print(f"\nAll backups created in {backup_dir}/")
 
 
 def main():
     """Run all advanced workflow examples."""
+    vst = ValheimSaveTools()
+    
     print("=" * 60)
     print("Advanced Workflow Examples")
     print("=" * 60)
@@ -302,12 +296,32 @@ def main():
         print(f"\n{i}. {name}")
         print("-" * 60)
         try:
-            func()
+            func(vst)
         except Exception as e:
             print(f"Error: {e}")
         print()
 
 
+_USAGE = """\
+Advanced Workflow Examples
+============================================================
+Usage: python advanced_workflow.py <workflow>
+
+Available workflows:
+  cleanup     - Complete world cleanup with backup
+  migrate     - Migrate world between servers
+  batch       - Batch process multiple worlds
+  variants    - Create world variants
+  analyze     - Analyze and optimize world
+  progressive - Progressive world reset
+  recovery    - Error recovery workflow
+  context     - Complex context manager workflow
+  backup      - Batch convert and backup
+
+Example:
+  python advanced_workflow.py cleanup"""
+
+
 if __name__ == "__main__":
     if len(sys.argv) > 1:
         workflow = sys.argv[1]
@@ -327,23 +341,9 @@ if __name__ == "__main__":
         if workflow in workflows:
             print(f"Running: {workflow}")
             print("=" * 60)
-            workflows[workflow]()
+            workflows[workflow](ValheimSaveTools())
         else:
             print(f"Unknown workflow: {workflow}")
             print(f"Available: {', '.join(workflows.keys())}")
     else:
-        print("Advanced Workflow Examples")
-        print("=" * 60)
-        print("Usage: python advanced_workflow.py <workflow>")
-        print("\nAvailable workflows:")
-        print("  cleanup     - Complete world cleanup with backup")
-        print("  migrate     - Migrate world between servers")
-        print("  batch       - Batch process multiple worlds")
-        print("  variants    - Create world variants")
-        print("  analyze     - Analyze and optimize world")
-        print("  progressive - Progressive world reset")
-        print("  recovery    - Error recovery workflow")
-        print("  context     - Complex context manager workflow")
-        print("  backup      - Batch convert and backup")
-        print("\nExample:")
-        print("  python advanced_workflow.py cleanup")
+        print(_USAGE)
@@ -9,54 +9,41 @@ import sys
 from valheim_save_tools_py import ValheimSaveTools
 
 
-def clean_structures_default():
+def clean_structures_default(vst):
     """Clean structures with default threshold (25)."""
-    vst = ValheimSaveTools()
-    
     vst.clean_structures("world.db")
     print("Cleaned structures with default threshold (25)")
 
 
-def clean_structures_custom():
+def clean_structures_custom(vst):
     """Clean structures with custom threshold."""
-    vst = ValheimSaveTools()
-    
     # More aggressive cleaning (larger threshold)
     vst.clean_structures("world.db", threshold=50)
     print("Cleaned structures with threshold 50")
 
 
-def clean_structures_conservative():
+def clean_structures_conservative(vst):
     """Clean structures conservatively (smaller threshold)."""
-    vst = ValheimSaveTools()
-    
     # Conservative cleaning
     vst.clean_structures("world.db", threshold=10)
     print("Cleaned structures with threshold 10 (conservative)")
 
 
-def reset_world_simple():
+def reset_world_simple(vst):
     """Reset world to initial state."""
-    vst = ValheimSaveTools()
-    
     vst.reset_world("world.db")
     print("World reset to initial state")
 
 
-def clean_then_reset():
+def clean_then_reset(vst):
     """Clean structures then reset world."""
-    vst = ValheimSaveTools()
-    
-    # Old way - separate calls
-    vst.clean_structures("world.db", threshold=30)
-    vst.reset_world("world.db")
-    print("Cleaned and reset world (separate calls)")
+    # Single call - the file is read and written once for both steps
+    vst.clean_and_reset("world.db", threshold=30)
+    print("Cleaned and reset world")
 
 
-def clean_and_reset_chained():
+def clean_and_reset_chained(vst):
     """Clean and reset using method chaining."""
-    vst = ValheimSaveTools()
-    
     result = (vst.process("world.db")
                  .clean_structures(threshold=30)
                  .reset_world()
@@ -65,10 +52,8 @@ def clean_and_reset_chained():
     print(f"Cleaned and reset! Saved to: {result}")
 
 
-def clean_and_reset_context():
+def clean_and_reset_context(vst):
     """Clean and reset using context manager."""
-    vst = ValheimSaveTools()
-    
     with vst.process("world.db") as processor:
         processor.clean_structures(threshold=30)
         processor.reset_world()
@@ -76,10 +61,8 @@ def clean_and_reset_context():
     print("Cleaned and reset with automatic cleanup!")
 
 
-def clean_reset_and_bosses():
+def clean_reset_and_bosses(vst):
     """Complete world reset with boss defeats added."""
-    vst = ValheimSaveTools()
-    
     result = (vst.process("world.db")
                  .clean_structures(threshold=25)
                  .reset_world()
@@ -90,10 +73,8 @@ def clean_reset_and_bosses():
     print(f"Fresh world with boss defeats! Saved to: {result}")
 
 
-def clean_and_export_json():
+def clean_and_export_json(vst):
     """Clean structures and export to JSON."""
-    vst = ValheimSaveTools()
-    
     result = (vst.process("world.db")
                  .clean_structures(threshold=30)
                  .to_json("cleaned_world.json"))
@@ -101,24 +82,20 @@ def clean_and_export_json():
     print(f"Cleaned and exported to JSON: {result}")
 
 
-def batch_clean_worlds():
+def batch_clean_worlds(vst):
     """Clean all world files in a directory."""
     import os
-    from pathlib import Path
     
-    vst = ValheimSaveTools()
-    world_dir = Path("./worlds")
-    
-    for db_file in world_dir.glob("*.db"):
-        print(f"Cleaning {db_file.name}...")
-        vst.clean_structures(str(db_file), threshold=30)
-        print(f"✓ {db_file.name} cleaned")
+    with os.scandir("./worlds") as entries:
+        db_files = [entry.path for entry in entries
+                    if entry.name.endswith(".db") and entry.is_file()]
+    print(f"Cleaning {len(db_files)} worlds in parallel...")
+    for cleaned in vst.batch_clean(db_files, threshold=30):
+        print(f"✓ {os.path.basename(cleaned)} cleaned")
 
 
-def create_backup_before_cleaning():
+def create_backup_before_cleaning(vst):
     """Create JSON backup before cleaning."""
-    vst = ValheimSaveTools()
-    
     # Create backup
     backup = vst.to_json("world.db", "world_backup.json")
     print(f"Created backup: {backup}")
@@ -131,32 +108,38 @@ def create_backup_before_cleaning():
     # vst.from_json("world_backup.json", "world.db")
 
 
-def progressive_cleaning():
+def progressive_cleaning(vst):
     """Try different cleaning thresholds."""
-    vst = ValheimSaveTools()
-    
     thresholds = [10, 25, 50, 100]
     
-    for threshold in thresholds:
+    # Cleaning at a higher threshold removes a superset of what a lower one
+    # removes, so each pass can start from the previous (smaller) result
+    # instead of re-reading the original world
+    source = "world.db"
+    for threshold in sorted(thresholds):
         output = f"world_threshold_{threshold}.db"
         
-        result = (vst.process("world.db")
-                     .clean_structures(threshold=threshold)
-                     .save(output))
+        vst.clean_structures(source, output, threshold=threshold)
+        source = output
         
         print(f"✓ Threshold {threshold:3d} -> {output}")
 
 
-def verbose_cleaning():
+def verbose_cleaning(vst):
     """Clean with verbose output."""
-    vst = ValheimSaveTools(verbose=True)
-    
-    vst.clean_structures("world.db", threshold=30)
-    print("Cleaned with verbose output")
+    # Verbose output for this example only
+    vst.verbose = True
+    try:
+        vst.clean_structures("world.db", threshold=30)
+        print("Cleaned with verbose output")
+    finally:
+        vst.verbose = False
 
 
 def main():
     """Run all clean and reset examples."""
+    vst = ValheimSaveTools()
+    
     print("=" * 60)
     print("Clean and Reset Examples")
     print("=" * 60)
@@ -181,12 +164,28 @@ def main():
         print(f"\n{i}. {name}")
         print("-" * 60)
         try:
-            func()
+            func(vst)
         except Exception as e:
             print(f"Error: {e}")
         print()
 
 
+_USAGE = """\
+Clean and Reset Examples
+============================================================
+Usage: python clean_and_reset.py <world.db> [threshold]
+
+Examples:
+  python clean_and_reset.py world.db
+  python clean_and_reset.py world.db 50
+
+Threshold guidelines:
+  - 10  : Very conservative (minimal cleanup)
+  - 25  : Default (balanced)
+  - 50  : Aggressive (more cleanup)
+  - 100 : Very aggressive (maximum cleanup)"""
+
+
 if __name__ == "__main__":
     if len(sys.argv) > 1:
         # Run with actual file
@@ -201,14 +200,4 @@ if __name__ == "__main__":
         vst.clean_structures(world_file, threshold=threshold)
         print(f"\n✓ Done! Structures cleaned.")
     else:
-        print("Clean and Reset Examples")
-        print("=" * 60)
-        print("Usage: python clean_and_reset.py <world.db> [threshold]")
-        print("\nExamples:")
-        print("  python clean_and_reset.py world.db")
-        print("  python clean_and_reset.py world.db 50")
-        print("\nThreshold guidelines:")
-        print("  - 10  : Very conservative (minimal cleanup)")
-        print("  - 25  : Default (balanced)")
-        print("  - 50  : Aggressive (more cleanup)")
-        print("  - 100 : Very aggressive (maximum cleanup)")
+        print(_USAGE)
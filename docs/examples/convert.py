@@ -5,15 +5,14 @@ File Conversion Examples
 Demonstrates converting between Valheim save formats (.db, .fwl, .fch) and JSON.
 """
 
+import os
 import sys
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from valheim_save_tools_py import ValheimSaveTools
 
 
-def convert_to_json_auto():
+def convert_to_json_auto(vst):
     """Convert save file to JSON and get parsed data."""
-    vst = ValheimSaveTools()
-    
     # Returns parsed JSON data as dictionary
     data = vst.to_json("world.db")
     print(f"World version: {data.get('version', 'unknown')}")
@@ -21,10 +20,8 @@ def convert_to_json_auto():
     return data
 
 
-def convert_to_json_explicit():
+def convert_to_json_explicit(vst):
     """Convert save file to JSON with explicit output filename."""
-    vst = ValheimSaveTools()
-    
     # Specify custom output filename - still returns data
     data = vst.to_json("world.db", "backup_world.json")
     print(f"Saved to: backup_world.json")
@@ -32,57 +29,69 @@ def convert_to_json_explicit():
     return data
 
 
-def convert_from_json():
+def convert_from_json(vst):
     """Convert JSON back to save file format."""
-    vst = ValheimSaveTools()
-    
     # Auto-detects output format from original file extension
     output = vst.from_json("world.json")
     print(f"Converted to: {output}")
 
 
-def batch_convert_world_files():
-    """Convert all world files in a directory to JSON and save them."""
-    vst = ValheimSaveTools()
+def _saves_in(directory, suffix):
+    """List files with the given suffix in a single scandir pass (no per-entry Path objects)."""
+    with os.scandir(directory) as entries:
+        return [entry.path for entry in entries
+                if entry.name.endswith(suffix) and entry.is_file()]
+
+
+def _convert_many(vst, save_files):
+    """Convert save files to JSON concurrently, yielding (source, json_path, data)."""
+    def convert(save_file):
+        json_path = os.path.splitext(save_file)[0] + '.json'
+        return save_file, json_path, vst.to_json(save_file, json_path)
     
-    world_dir = Path("./worlds")
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        yield from executor.map(convert, save_files)
+
+
+def batch_convert_world_files(vst):
+    """Convert all world files in a directory to JSON and save them."""
+    world_dir = "./worlds"
     
     # Convert all .db files
-    for db_file in world_dir.glob("*.db"):
-        json_path = db_file.with_suffix('.json')
-        data = vst.to_json(str(db_file), str(json_path))
-        print(f"✓ {db_file.name} -> {json_path.name} (version: {data.get('version', '?')})")
+    for db_file, json_path, data in _convert_many(vst, _saves_in(world_dir, ".db")):
+        print(f"✓ {os.path.basename(db_file)} -> {os.path.basename(json_path)} "
+              f"(version: {data.get('version', '?')})")
     
     # Convert all .fwl files
-    for fwl_file in world_dir.glob("*.fwl"):
-        json_path = fwl_file.with_suffix('.json')
-        data = vst.to_json(str(fwl_file), str(json_path))
-        print(f"✓ {fwl_file.name} -> {json_path.name}")
+    for fwl_file, json_path, data in _convert_many(vst, _saves_in(world_dir, ".fwl")):
+        print(f"✓ {os.path.basename(fwl_file)} -> {os.path.basename(json_path)}")
 
 
-def batch_convert_character_files():
+def batch_convert_character_files(vst):
     """Convert all character files to JSON."""
-    vst = ValheimSaveTools()
-    
-    char_dir = Path("./characters")
+    char_dir = "./characters"
     
-    for fch_file in char_dir.glob("*.fch"):
-        json_path = fch_file.with_suffix('.json')
-        data = vst.to_json(str(fch_file), str(json_path))
+    for fch_file, json_path, data in _convert_many(vst, _saves_in(char_dir, ".fch")):
         char_name = data.get('name', 'Unknown')
-        print(f"✓ {fch_file.name} -> {json_path.name} (Character: {char_name})")
+        print(f"✓ {os.path.basename(fch_file)} -> {os.path.basename(json_path)} "
+              f"(Character: {char_name})")
 
 
-def convert_with_verbose():
+def convert_with_verbose(vst):
     """Convert with verbose output enabled."""
-    vst = ValheimSaveTools(verbose=True)
-    
-    output = vst.to_json("world.db")
-    print(f"Converted to: {output}")
+    # Verbose output for this example only
+    vst.verbose = True
+    try:
+        output = vst.to_json("world.db")
+        print(f"Converted to: {output}")
+    finally:
+        vst.verbose = False
 
 
 def main():
     """Run all conversion examples."""
+    vst = ValheimSaveTools()
+    
     print("=" * 60)
     print("File Conversion Examples")
     print("=" * 60)
@@ -100,12 +109,29 @@ def main():
         print(f"\n{i}. {name}")
         print("-" * 60)
         try:
-            func()
+            func(vst)
         except Exception as e:
             print(f"Error: {e}")
         print()
 
 
+_USAGE = """\
+File Conversion Examples
+============================================================
+Usage: python convert.py <file_path>
+
+Supported file types:
+  - .db  (world data)
+  - .fwl (world metadata)
+  - .fch (character)
+  - .json (converted files)
+
+Examples:
+  python convert.py world.db
+  python convert.py world.json
+  python convert.py character.fch"""
+
+
 if __name__ == "__main__":
     if len(sys.argv) > 1:
         # Run with actual file
@@ -119,15 +145,4 @@ if __name__ == "__main__":
             output = vst.to_json(file_path)
             print(f"Converted {file_path} -> {output}")
     else:
-        print("File Conversion Examples")
-        print("=" * 60)
-        print("Usage: python convert.py <file_path>")
-        print("\nSupported file types:")
-        print("  - .db  (world data)")
-        print("  - .fwl (world metadata)")
-        print("  - .fch (character)")
-        print("  - .json (converted files)")
-        print("\nExamples:")
-        print("  python convert.py world.db")
-        print("  python convert.py world.json")
-        print("  python convert.py character.fch")
+        print(_USAGE)
@@ -15,13 +15,11 @@ vst = ValheimSaveTools()
 print("Example 1: Converting .db file to JSON using file-like objects")
 print("-" * 60)
 
-# Read a .db file into memory
-with open("world.db", "rb") as f:
-    db_data = BytesIO(f.read())
-
-# Convert to JSON (returns dict, can also write to file-like object)
+# Open file handles can be passed directly; they are streamed to the
+# JAR without loading the whole world into memory first
 json_output = BytesIO()
-json_data = vst.to_json(db_data, json_output)
+with open("world.db", "rb") as db_data:
+    json_data = vst.to_json(db_data, json_output)
 
 print(f"Converted to JSON, got {len(json_data)} top-level keys")
 print(f"JSON output size: {json_output.tell()} bytes")
@@ -43,10 +41,9 @@ print(f"Converted back to .db format, size: {db_output.tell()} bytes")
 print("\nExample 3: Listing global keys from file-like object")
 print("-" * 60)
 
-with open("world.db", "rb") as f:
-    db_data = BytesIO(f.read())
+with open("world.db", "rb") as db_data:
+    keys = vst.list_global_keys(db_data)
 
-keys = vst.list_global_keys(db_data)
 print(f"Found {len(keys)} global keys:")
 for key in keys[:5]:  # Show first 5
     print(f"  - {key}")
@@ -65,10 +62,10 @@ vst.add_global_key(db_data, "defeated_eikthyr")
 # The db_data BytesIO now contains the modified data
 print(f"Added global key, modified data size: {db_data.tell()} bytes")
 
-# You can now write it back to a file or use it further
-db_data.seek(0)
-with open("world_modified.db", "wb") as f:
-    f.write(db_data.read())
+# You can now write it back to a file or use it further.
+# getbuffer() exposes the BytesIO contents without copying them into a new bytes object
+with open("world_modified.db", "wb") as f, db_data.getbuffer() as view:
+    f.write(view)
 
 print("Saved modified data to world_modified.db")
 
@@ -76,12 +73,10 @@ print("Saved modified data to world_modified.db")
 print("\nExample 5: Cleaning structures using file-like object")
 print("-" * 60)
 
-with open("world.db", "rb") as f:
-    db_data = BytesIO(f.read())
-
 # Clean structures and get result in a new BytesIO
 output = BytesIO()
-vst.clean_structures(db_data, output, threshold=30)
+with open("world.db", "rb") as db_data:
+    vst.clean_structures(db_data, output, threshold=30)
 
 print(f"Cleaned structures, output size: {output.tell()} bytes")
 
@@ -9,10 +9,20 @@ import sys
 from valheim_save_tools_py import ValheimSaveTools
 
 
-def list_all_keys():
+# Boss display names and their defeat keys, in progression order
+BOSSES = (
+    ("Eikthyr", "defeated_eikthyr"),
+    ("The Elder", "defeated_gdking"),
+    ("Bonemass", "defeated_bonemass"),
+    ("Moder", "defeated_dragon"),
+    ("Yagluth", "defeated_goblinking"),
+    ("The Queen", "defeated_queen"),
+)
+BOSS_KEYS = tuple(key for _, key in BOSSES)
+
+
+def list_all_keys(vst):
     """List all global keys in a world."""
-    vst = ValheimSaveTools()
-    
     keys = vst.list_global_keys("world.db")
     
     print("Current global keys:")
@@ -22,28 +32,16 @@ def list_all_keys():
     return keys
 
 
-def add_boss_defeats():
+def add_boss_defeats(vst):
     """Add all boss defeat keys."""
-    vst = ValheimSaveTools()
-    
-    bosses = [
-        "defeated_eikthyr",
-        "defeated_gdking",
-        "defeated_bonemass",
-        "defeated_dragon",
-        "defeated_goblinking",
-        "defeated_queen"
-    ]
-    
-    for boss in bosses:
-        vst.add_global_key("world.db", boss)
+    # One pass over the file for all keys
+    vst.add_global_keys("world.db", BOSS_KEYS)
+    for boss in BOSS_KEYS:
         print(f"✓ Added: {boss}")
 
 
-def add_boss_defeats_chained():
+def add_boss_defeats_chained(vst):
     """Add all boss defeats using method chaining."""
-    vst = ValheimSaveTools()
-    
     result = (vst.process("world.db")
                  .add_global_key("defeated_eikthyr")
                  .add_global_key("defeated_gdking")
@@ -56,36 +54,25 @@ def add_boss_defeats_chained():
     print(f"All bosses defeated! Saved to: {result}")
 
 
-def remove_specific_key():
+def remove_specific_key(vst):
     """Remove a specific global key."""
-    vst = ValheimSaveTools()
-    
     vst.remove_global_key("world.db", "defeated_eikthyr")
     print("Removed: defeated_eikthyr")
 
 
-def reset_all_bosses():
+def reset_all_bosses(vst):
     """Remove all boss defeat keys."""
-    vst = ValheimSaveTools()
-    
-    bosses = [
-        "defeated_eikthyr",
-        "defeated_gdking",
-        "defeated_bonemass",
-        "defeated_dragon",
-        "defeated_goblinking",
-        "defeated_queen"
-    ]
-    
-    for boss in bosses:
-        vst.remove_global_key("world.db", boss)
+    # Only rewrite the world if any of the keys are actually present
+    keys = vst.peek_global_keys("world.db")
+    present = [boss for boss in BOSS_KEYS if boss in keys]
+    if present:
+        vst.remove_global_keys("world.db", present)
+    for boss in present:
         print(f"✓ Removed: {boss}")
 
 
-def clear_all_keys():
+def clear_all_keys(vst):
     """Clear all global keys from a world."""
-    vst = ValheimSaveTools()
-    
     # Get current keys before clearing
     keys_before = vst.list_global_keys("world.db")
     print(f"Keys before: {len(keys_before)}")
@@ -99,46 +86,31 @@ def clear_all_keys():
     print(f"Keys after: {len(keys_after)}")
 
 
-def check_specific_boss():
+def check_specific_boss(vst):
     """Check if a specific boss has been defeated."""
-    vst = ValheimSaveTools()
-    
-    keys = vst.list_global_keys("world.db")
-    
-    bosses_to_check = [
-        ("Eikthyr", "defeated_eikthyr"),
-        ("The Elder", "defeated_gdking"),
-        ("Bonemass", "defeated_bonemass"),
-        ("Moder", "defeated_dragon"),
-        ("Yagluth", "defeated_goblinking"),
-        ("The Queen", "defeated_queen")
-    ]
+    keys = vst.peek_global_keys("world.db")
     
     print("Boss Status:")
-    for name, key in bosses_to_check:
+    for name, key in BOSSES:
         status = "✓ Defeated" if key in keys else "✗ Not defeated"
         print(f"  {name:15s} {status}")
 
 
-def add_tutorial_keys():
+def add_tutorial_keys(vst):
     """Add useful tutorial/progression keys."""
-    vst = ValheimSaveTools()
-    
     tutorial_keys = [
         "defeated_eikthyr",     # Unlocks antler pickaxe
         "KilledTroll",          # Troll kill achievement
         "killed_surtling",      # Surtling kill
     ]
     
+    vst.add_global_keys("world.db", tutorial_keys)
     for key in tutorial_keys:
-        vst.add_global_key("world.db", key)
         print(f"✓ Added: {key}")
 
 
-def backup_and_modify():
+def backup_and_modify(vst):
     """Create a backup before modifying global keys."""
-    vst = ValheimSaveTools()
-    
     # Create JSON backup
     backup = vst.to_json("world.db", "world_backup.json")
     print(f"Created backup: {backup}")
@@ -152,10 +124,8 @@ def backup_and_modify():
     print(f"Current keys: {len(keys)}")
 
 
-def context_manager_example():
+def context_manager_example(vst):
     """Use context manager for key management."""
-    vst = ValheimSaveTools()
-    
     with vst.process("world.db") as processor:
         processor.add_global_key("defeated_eikthyr") \
                  .add_global_key("defeated_gdking") \
@@ -166,6 +136,8 @@ def context_manager_example():
 
 def main():
     """Run all global keys examples."""
+    vst = ValheimSaveTools()
+    
     print("=" * 60)
     print("Global Keys Management Examples")
     print("=" * 60)
@@ -187,12 +159,29 @@ def main():
         print(f"\n{i}. {name}")
         print("-" * 60)
         try:
-            func()
+            func(vst)
         except Exception as e:
             print(f"Error: {e}")
         print()
 
 
+_USAGE = """\
+Global Keys Management Examples
+============================================================
+Usage: python global_keys.py <world.db>
+
+Example:
+  python global_keys.py world.db
+
+Common global keys:
+  - defeated_eikthyr    (Eikthyr)
+  - defeated_gdking     (The Elder)
+  - defeated_bonemass   (Bonemass)
+  - defeated_dragon     (Moder)
+  - defeated_goblinking (Yagluth)
+  - defeated_queen      (The Queen)"""
+
+
 if __name__ == "__main__":
     if len(sys.argv) > 1:
         # Run with actual file
@@ -208,15 +197,4 @@ if __name__ == "__main__":
         
         print(f"\nTotal: {len(keys)} keys")
     else:
-        print("Global Keys Management Examples")
-        print("=" * 60)
-        print("Usage: python global_keys.py <world.db>")
-        print("\nExample:")
-        print("  python global_keys.py world.db")
-        print("\nCommon global keys:")
-        print("  - defeated_eikthyr    (Eikthyr)")
-        print("  - defeated_gdking     (The Elder)")
-        print("  - defeated_bonemass   (Bonemass)")
-        print("  - defeated_dragon     (Moder)")
-        print("  - defeated_goblinking (Yagluth)")
-        print("  - defeated_queen      (The Queen)")
+        print(_USAGE)
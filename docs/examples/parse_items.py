@@ -10,7 +10,14 @@ This example demonstrates how to:
 
 from valheim_save_tools_py import parse_items_from_base64, ValheimItemReader
 from collections import Counter
-import base64
+from functools import lru_cache
+import math
+import re
+
+try:
+    from pybase64 import b64decode  # SIMD-accelerated, from the "fast" extra
+except ImportError:
+    from base64 import b64decode
 
 
 def display_item(item, index=None):
@@ -34,39 +41,53 @@ def analyze_inventory(items):
     print("INVENTORY ANALYSIS")
     print("=" * 60)
     
+    # Gather every statistic in a single pass over the items
+    item_counts = Counter()
+    quality_counts = Counter()
+    crafter_counts = Counter()
+    equipped_count = 0
+    durability_total = 0.0
+    durability_count = 0
+    min_durability = math.inf
+    for item in items:
+        item_counts[item['name']] += 1
+        quality_counts[item['quality']] += 1
+        equipped_count += item['equipped']
+        durability = item['durability']
+        if durability > 0:
+            durability_total += durability
+            durability_count += 1
+            if durability < min_durability:
+                min_durability = durability
+        crafter = item['crafter_name']
+        if crafter:
+            crafter_counts[crafter] += 1
+    
     # Basic counts
     print(f"\nTotal items: {len(items)}")
-    equipped_count = sum(1 for item in items if item['equipped'])
     print(f"Equipped items: {equipped_count}")
     
     # Item type breakdown
-    item_counts = Counter(item['name'] for item in items)
     print("\nItem breakdown:")
     for item_name, count in item_counts.most_common(10):
         print(f"  {item_name}: {count}")
     
     # Quality distribution
-    quality_counts = Counter(item['quality'] for item in items)
     print("\nQuality levels:")
     for quality in sorted(quality_counts.keys()):
         print(f"  Level {quality}: {quality_counts[quality]} items")
     
     # Durability analysis
-    items_with_durability = [i for i in items if i['durability'] > 0]
-    if items_with_durability:
-        total_durability = sum(item['durability'] for item in items_with_durability)
-        avg_durability = total_durability / len(items_with_durability)
-        min_durability = min(item['durability'] for item in items_with_durability)
+    if durability_count:
+        avg_durability = durability_total / durability_count
         print(f"\nDurability:")
         print(f"  Average: {avg_durability:.1f}%")
         print(f"  Lowest: {min_durability:.1f}%")
     
     # Crafters
-    crafters = set(item['crafter_name'] for item in items if item['crafter_name'])
-    if crafters:
+    if crafter_counts:
         print(f"\nItems crafted by:")
-        for crafter in crafters:
-            count = sum(1 for i in items if i['crafter_name'] == crafter)
+        for crafter, count in crafter_counts.items():
             print(f"  {crafter}: {count} items")
 
 
@@ -84,6 +105,19 @@ def find_damaged_items(items, threshold=50.0):
         print(f"\nNo damaged items found (all above {threshold}%)")
 
 
+def find_damaged_items_columnar(columns, threshold=50.0):
+    """Find damaged items using the columnar result of parse_items_from_base64(..., as_arrays=True)."""
+    names = columns['name']
+    damaged = sorted(
+        (durability, names[i])
+        for i, durability in enumerate(columns['durability'])
+        if 0 < durability < threshold
+    )
+    for durability, name in damaged:
+        print(f"  {name}: {durability:.1f}%")
+    return damaged
+
+
 def find_equipped_items(items):
     """Find and display equipped items."""
     equipped = [item for item in items if item['equipped']]
@@ -99,26 +133,37 @@ def find_equipped_items(items):
         print("No equipped items found.")
 
 
-def filter_by_category(items):
+CATEGORIES = {
+    'Weapons': ('Sword', 'Axe', 'Bow', 'Spear', 'Mace', 'Knife', 'Club'),
+    'Armor': ('Armor', 'Helmet', 'Legs', 'Cape'),
+    'Tools': ('Pickaxe', 'Hoe', 'Hammer', 'Cultivator'),
+    'Food': ('Meat', 'Fish', 'Berry', 'Mushroom', 'Bread', 'Pie'),
+    'Resources': ('Wood', 'Stone', 'Iron', 'Copper', 'Tin', 'Bronze')
+}
+
+
+@lru_cache(maxsize=None)
+def _category_pattern(keywords):
+    """Compile one alternation per category so each name is scanned once per category."""
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
+def filter_by_category(items, categories=CATEGORIES):
     """Filter items by common categories."""
-    categories = {
-        'Weapons': ['Sword', 'Axe', 'Bow', 'Spear', 'Mace', 'Knife', 'Club'],
-        'Armor': ['Armor', 'Helmet', 'Legs', 'Cape'],
-        'Tools': ['Pickaxe', 'Hoe', 'Hammer', 'Cultivator'],
-        'Food': ['Meat', 'Fish', 'Berry', 'Mushroom', 'Bread', 'Pie'],
-        'Resources': ['Wood', 'Stone', 'Iron', 'Copper', 'Tin', 'Bronze']
-    }
-    
     print("\n" + "=" * 60)
     print("ITEMS BY CATEGORY")
     print("=" * 60)
     
-    for category, keywords in categories.items():
-        category_items = [
-            item for item in items
-            if any(keyword in item['name'] for keyword in keywords)
-        ]
-        
+    matchers = [(category, _category_pattern(tuple(keywords)).search)
+                for category, keywords in categories.items()]
+    buckets = {category: [] for category in categories}
+    for item in items:
+        name = item['name']
+        for category, search in matchers:
+            if search(name):
+                buckets[category].append(item)
+    
+    for category, category_items in buckets.items():
         if category_items:
             print(f"\n{category} ({len(category_items)}):")
             for item in category_items:
@@ -159,7 +204,7 @@ def example_custom_parsing():
     example_data = "AQAAAAIAAAAKQXhlQnJvbnpl"
     
     try:
-        binary_data = base64.b64decode(example_data)
+        binary_data = b64decode(example_data)
         reader = ValheimItemReader(binary_data)
         
         # Read header
@@ -206,6 +251,8 @@ def main():
     # find_equipped_items(items)
     # find_damaged_items(items, threshold=50.0)
     # filter_by_category(items)
+    # columns = parse_items_from_base64(your_base64_data, as_arrays=True)
+    # find_damaged_items_columnar(columns, threshold=50.0)
 
 
 if __name__ == "__main__":
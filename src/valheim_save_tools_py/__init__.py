@@ -1,13 +1,13 @@
 """Valheim Save Tools Python API."""
 
-from .wrapper import ValheimSaveTools, SaveFileProcessor
+import importlib
+
 from .exceptions import (
     ValheimSaveToolsError,
     JarNotFoundError,
     JavaNotFoundError,
     CommandExecutionError
 )
-from .valheimItemReader import (parse_items_from_base64, ValheimItemReader)
 
 __version__ = "0.4.0"
 __all__ = [
@@ -18,5 +18,29 @@ __all__ = [
     "JavaNotFoundError",
     "CommandExecutionError",
     "parse_items_from_base64",
+    "parse_many",
     "ValheimItemReader",
-]
\ No newline at end of file
+]
+
+# Submodules are imported on first attribute access (PEP 562) so that
+# scripts only pay for the parts of the package they use
+_LAZY_ATTRS = {
+    "ValheimSaveTools": ".wrapper",
+    "SaveFileProcessor": ".wrapper",
+    "parse_items_from_base64": ".valheimItemReader",
+    "parse_many": ".valheimItemReader",
+    "ValheimItemReader": ".valheimItemReader",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
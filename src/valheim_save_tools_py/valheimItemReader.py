@@ -1,11 +1,51 @@
-import base64
+import os
 import struct
-import traceback
+import sys
+from array import array
+from functools import partial
+
+try:
+    from pybase64 import b64decode as _b64decode
+except ImportError:  # optional, installed with the "fast" extra
+    from base64 import b64decode as _b64decode
+
+# Precompiled little-endian scalar formats
+_INT32 = struct.Struct('<i')
+_INT64 = struct.Struct('<q')
+_FLOAT = struct.Struct('<f')
+
+# Fixed-layout part of an item between the name and crafter name:
+# stack, durability, pos_x, pos_y, equipped, quality, variant, crafter_id
+_ITEM_FIXED = struct.Struct('<ifii?iiq')
+
+# Smallest possible item: two empty strings, the fixed part and the 9-byte trailer
+_MIN_ITEM_SIZE = 1 + _ITEM_FIXED.size + 1 + 9
 
 class ValheimItemReader:
+    """Sequential reader over item data held in bytes or a memoryview"""
+    
+    # No per-instance __dict__; offset is touched on every field read
+    __slots__ = ('data', 'offset', '_trailer')
+    
     def __init__(self, data):
         self.data = data
         self.offset = 0
+        # Offset of the unknown trailer of the last item read
+        self._trailer = None
+    
+    @property
+    def unknown_data(self):
+        """The 8 unknown bytes after the last item read, or None before any item"""
+        if self._trailer is None:
+            return None
+        return bytes(self.data[self._trailer:self._trailer+8])
+    
+    @property
+    def unknown_byte(self):
+        """The unknown byte ending the last item read, or None before any item"""
+        if self._trailer is None:
+            return None
+        return self.data[self._trailer+8]
     
     def read_byte(self):
         """Read a single byte"""
@@ -15,19 +55,19 @@ class ValheimItemReader:
     
     def read_int32(self):
         """Read a 4-byte integer (little-endian)"""
-        value = struct.unpack('<i', self.data[self.offset:self.offset+4])[0]
+        value = _INT32.unpack_from(self.data, self.offset)[0]
         self.offset += 4
         return value
     
     def read_int64(self):
         """Read an 8-byte long (little-endian)"""
-        value = struct.unpack('<q', self.data[self.offset:self.offset+8])[0]
+        value = _INT64.unpack_from(self.data, self.offset)[0]
         self.offset += 8
         return value
     
     def read_float(self):
         """Read a 4-byte float (little-endian)"""
-        value = struct.unpack('<f', self.data[self.offset:self.offset+4])[0]
+        value = _FLOAT.unpack_from(self.data, self.offset)[0]
         self.offset += 4
         return value
     
@@ -44,52 +84,230 @@ class ValheimItemReader:
         if length == 0:
             return ""
         
-        string = self.data[self.offset:self.offset+length].decode('utf-8')
+        string = str(self.data[self.offset:self.offset+length], 'utf-8')
         self.offset += length
         return string
     
     def read_item(self):
         """Read a complete Valheim item structure"""
-        item = {}
+        # Same decode as _iter_items, inlined on local data/offset shadows:
+        # a generator per call would double the cost of a single read
+        data = self.data
+        offset = self.offset
+        length = data[offset]
+        offset += 1
+        name = str(data[offset:offset+length], 'utf-8') if length else ""
+        offset += length
         
-        item['name'] = self.read_string()
-        item['stack'] = self.read_int32()
-        item['durability'] = self.read_float()
-        item['pos_x'] = self.read_int32()
-        item['pos_y'] = self.read_int32()
-        item['equipped'] = self.read_bool()
-        item['quality'] = self.read_int32()
-        item['variant'] = self.read_int32()
-        item['crafter_id'] = self.read_int64()
-        item['crafter_name'] = self.read_string()
+        (stack, durability, pos_x, pos_y, equipped,
+         quality, variant, crafter_id) = _ITEM_FIXED.unpack_from(data, offset)
+        offset += _ITEM_FIXED.size
         
-        # There appears to be 8 bytes of unknown data after each item
-        # Possibly world coordinates or other metadata
-        self.unknown_data = self.data[self.offset:self.offset+8]
-        self.offset += 8
+        length = data[offset]
+        offset += 1
+        crafter_name = str(data[offset:offset+length], 'utf-8') if length else ""
+        offset += length
         
-        # And one more byte
-        self.unknown_byte = self.read_byte()
+        # 8 unknown bytes and one more byte follow; see unknown_data / unknown_byte
+        if offset + 9 > len(data):
+            raise IndexError("item trailer extends past end of data")
+        self._trailer = offset
+        self.offset = offset + 9
         
-        return item
+        # A dict literal is cheaper than dict(zip(_ITEM_FIELDS, ...)), and its
+        # keys are interned constants shared by every item
+        return {
+            'name': name,
+            'stack': stack,
+            'durability': durability,
+            'pos_x': pos_x,
+            'pos_y': pos_y,
+            'equipped': equipped,
+            'quality': quality,
+            'variant': variant,
+            'crafter_id': crafter_id,
+            'crafter_name': crafter_name,
+        }
+
+def _read_int32_from_bytes(self):
+    """Read a 4-byte integer (little-endian) without struct"""
+    offset = self.offset
+    if offset + 4 > len(self.data):
+        raise struct.error("unpack_from requires a buffer of at least 4 bytes")
+    value = int.from_bytes(self.data[offset:offset+4], 'little', signed=True)
+    self.offset = offset + 4
+    return value
+
+def _read_int64_from_bytes(self):
+    """Read an 8-byte long (little-endian) without struct"""
+    offset = self.offset
+    if offset + 8 > len(self.data):
+        raise struct.error("unpack_from requires a buffer of at least 8 bytes")
+    value = int.from_bytes(self.data[offset:offset+8], 'little', signed=True)
+    self.offset = offset + 8
+    return value
+
+# CPython's precompiled struct.Struct is the fastest single-integer reader
+# there, while PyPy's JIT handles int.from_bytes on a slice better
+if sys.implementation.name == 'pypy':
+    ValheimItemReader.read_int32 = _read_int32_from_bytes
+    ValheimItemReader.read_int64 = _read_int64_from_bytes
 
-def parse_items_from_base64(b64_string):
-    data = base64.b64decode(b64_string)
+# Field order of the tuples produced by _iter_items
+_ITEM_FIELDS = (
+    'name', 'stack', 'durability', 'pos_x', 'pos_y', 'equipped',
+    'quality', 'variant', 'crafter_id', 'crafter_name',
+)
+
+def _iter_items(reader, count):
+    """
+    Read up to count consecutive items, yielding field tuples (see _ITEM_FIELDS).
+
+    One tight loop over the buffer with a local offset and locally bound
+    helpers, so the per-item cost is the struct call and two string decodes
+    rather than reader method dispatch. The reader's offset is updated when
+    iteration stops and always points just past the last complete item.
+    """
+    data = reader.data
+    end = len(data)
+    unpack_fixed = _ITEM_FIXED.unpack_from
+    fixed_size = _ITEM_FIXED.size
+    offset = done = reader.offset
+    trailer = reader._trailer
+    try:
+        for _ in range(count):
+            length = data[offset]
+            offset += 1
+            name = str(data[offset:offset+length], 'utf-8') if length else ""
+            offset += length
+            
+            fixed = unpack_fixed(data, offset)
+            offset += fixed_size
+            
+            length = data[offset]
+            offset += 1
+            crafter_name = str(data[offset:offset+length], 'utf-8') if length else ""
+            offset += length
+            
+            # There appears to be 8 bytes of unknown data after each item
+            # (possibly world coordinates or other metadata) and one more byte.
+            # Only their position is kept; see unknown_data / unknown_byte
+            if offset + 9 > end:
+                raise IndexError("item trailer extends past end of data")
+            trailer = offset
+            offset = done = offset + 9
+            
+            yield (name, *fixed, crafter_name)
+    finally:
+        reader.offset = done
+        reader._trailer = trailer
+
+def _new_item_columns():
+    """Create empty per-field columns for the as_arrays result"""
+    return {
+        'name': [],
+        'stack': array('i'),
+        'durability': array('f'),
+        'pos_x': array('i'),
+        'pos_y': array('i'),
+        'equipped': array('b'),
+        'quality': array('i'),
+        'variant': array('i'),
+        'crafter_id': array('q'),
+        'crafter_name': [],
+    }
+
+def parse_items_from_base64(b64_string, as_arrays=False):
+    """
+    Parse base64-encoded inventory data.
+
+    Args:
+        b64_string: Base64-encoded inventory data
+        as_arrays: If True, return one column per field (structure of arrays)
+                   instead of a list of item dicts. Numeric fields are stored in
+                   typed array.array buffers and names in lists.
+
+    Returns:
+        List of item dicts, or a dict mapping field name to column if as_arrays
+    """
+    # Parse through a zero-copy view; fields are decoded in place
+    data = memoryview(_b64decode(b64_string))
     reader = ValheimItemReader(data)
     version = reader.read_int32()
     num_items = reader.read_int32()
 
-    # Parse each item
-    items = []
-    for i in range(num_items):
-        try:
-            item = reader.read_item()
-            items.append(item)
-        except Exception as e:
-            print(f"Error parsing item {i+1}: {e}")
-            print(f"Offset when error occurred: {reader.offset}")
-            traceback.print_exc()
-            break
+    # Parse each item; a corrupt item stops parsing and keeps those before it
+    columns = _new_item_columns() if as_arrays else None
+    parsed = 0
+    try:
+        if columns is None:
+            # Preallocate, capped by what the buffer can hold so a corrupt
+            # count cannot force a huge allocation
+            items = [None] * min(num_items, (len(data) - reader.offset) // _MIN_ITEM_SIZE)
+            for (name, stack, durability, pos_x, pos_y, equipped,
+                 quality, variant, crafter_id, crafter_name) in _iter_items(reader, num_items):
+                items[parsed] = {
+                    'name': name,
+                    'stack': stack,
+                    'durability': durability,
+                    'pos_x': pos_x,
+                    'pos_y': pos_y,
+                    'equipped': equipped,
+                    'quality': quality,
+                    'variant': variant,
+                    'crafter_id': crafter_id,
+                    'crafter_name': crafter_name,
+                }
+                parsed += 1
+        else:
+            rows = []
+            for fields in _iter_items(reader, num_items):
+                rows.append(fields)
+                parsed += 1
+    except Exception as e:
+        print(f"Error parsing item {parsed+1}: {e}")
+        print(f"Offset when error occurred: {reader.offset}")
+        # Imported here so the error path does not add to import time
+        import traceback
+        traceback.print_exc()
 
+    if columns is not None:
+        # Transpose the rows and fill each column in one bulk extend
+        for field, values in zip(_ITEM_FIELDS, zip(*rows)):
+            columns[field].extend(values)
+        return columns
+    del items[parsed:]
     return items
-    
\ No newline at end of file
+
+def parse_many(b64_strings, workers=None, as_arrays=False):
+    """
+    Parse several base64-encoded inventories in parallel worker processes.
+
+    Each inventory is parsed independently by parse_items_from_base64, so
+    bulk jobs such as reading every player's inventory scale across cores.
+
+    Args:
+        b64_strings: Iterable of base64-encoded inventory data
+        workers: Maximum number of worker processes (default: CPU count).
+                 With one worker or a single inventory, parsing runs in
+                 the calling process.
+        as_arrays: Passed through to parse_items_from_base64
+
+    Returns:
+        List of results in the same order as b64_strings
+    """
+    b64_strings = list(b64_strings)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(b64_strings)))
+    parse = partial(parse_items_from_base64, as_arrays=as_arrays)
+    if workers == 1:
+        return [parse(b64_string) for b64_string in b64_strings]
+
+    # Imported here so plain single-inventory parsing does not pay for it
+    from concurrent.futures import ProcessPoolExecutor
+
+    # A few chunks per worker keeps the pipes busy without starving any worker
+    chunksize = max(1, len(b64_strings) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(parse, b64_strings, chunksize=chunksize))
@@ -1,19 +1,440 @@
 """Wrapper for Valheim Save Tools JAR."""
 
+import errno
 import os
 import subprocess
 import shutil
 import tempfile
 from pathlib import Path
-from typing import Optional, List, Dict, Union, BinaryIO
+from typing import Optional, List, Dict, Tuple, Union, BinaryIO, Iterable, FrozenSet
 import json
 import io
+import threading
+import itertools
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 from .exceptions import JarNotFoundError, JavaNotFoundError, CommandExecutionError
 
+try:
+    import orjson
+except ImportError:  # optional, installed with the "fast" extra
+    orjson = None
+
+
+def _loads(raw: bytes):
+    """Decode a JSON document, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _read_json(file_path: str):
+    """Load a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        # A plain read is as fast as handing orjson an mmap: building the
+        # Python objects dominates, not getting the bytes into memory
+        with open(file_path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(file_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+# Free space /dev/shm needs before intermediate files are placed there
+_MIN_SHM_FREE = 1 << 30
+
+
+def _scratch_root() -> Optional[str]:
+    """
+    Return the directory that holds per-instance working directories.
+    
+    VALHEIM_SCRATCH_DIR takes precedence, so platforms without /dev/shm can
+    point at a RAM disk of their own. Otherwise the RAM-backed /dev/shm is
+    used when it is writable and has room for large world saves, so
+    intermediate .db and .json files never reach the disk. Container
+    defaults (often 64 MiB) are too small and are skipped.
+    
+    Returns:
+        Directory path, or None for the system temporary directory
+    """
+    return os.environ.get("VALHEIM_SCRATCH_DIR") or _shm_root()
+
+
+@lru_cache(maxsize=None)
+def _shm_root() -> Optional[str]:
+    """Return /dev/shm if it can hold intermediate files; checked once per process."""
+    shm = "/dev/shm"
+    try:
+        if os.access(shm, os.W_OK | os.X_OK):
+            st = os.statvfs(shm)
+            if st.f_bavail * st.f_frsize >= _MIN_SHM_FREE:
+                return shm
+    except (AttributeError, OSError):  # no statvfs on Windows
+        pass
+    return None
+
+
+# File type for each recognised extension (see detect_file_type)
+_TYPE_MAP = {
+    ".db": "db",
+    ".fwl": "fwl",
+    ".fch": "fch",
+    ".json": "json",
+}
+
+# Extensions of the binary save files the JAR converts to JSON
+_SAVE_SUFFIXES = frozenset({".db", ".fwl", ".fch"})
+
+
+@lru_cache(maxsize=1024)
+def _file_type(file_path: Union[str, Path]) -> Optional[str]:
+    """Map a path's extension to its file type; repeated paths are served from the cache."""
+    return _TYPE_MAP.get(os.path.splitext(file_path)[1].lower())
+
+
+# Default bound on the total size of the results one instance keeps cached
+_DEFAULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+def _cached_size(value: object) -> int:
+    """Approximate memory held by a cached result: raw JSON bytes or a tuple of keys."""
+    if isinstance(value, (bytes, bytearray, str)):
+        return len(value)
+    return sum(len(item) for item in value)
+
+
+# Buffer size for streaming copies between file objects
+_COPY_BUFSIZE = 256 * 1024
+
+
+def _copy_fd_range(src_fd: int, dst_fd: int, offset: int) -> bool:
+    """
+    Copy src_fd from offset to its end into dst_fd inside the kernel.
+    
+    Returns False, having copied nothing, when copy_file_range is unavailable
+    for these descriptors, so the caller can fall back to a userspace copy.
+    """
+    copy_range = getattr(os, "copy_file_range", None)
+    if copy_range is None:
+        return False
+    copied = 0
+    while True:
+        try:
+            n = copy_range(src_fd, dst_fd, 1 << 30, offset + copied)
+        except OSError:
+            if copied:
+                raise
+            return False
+        if n == 0:
+            return True
+        copied += n
+
+
+def _sendfile_all(dst_fd: int, src_fd: int) -> bool:
+    """
+    Copy all of src_fd into dst_fd at its current position inside the kernel.
+    
+    Returns False, having copied nothing, when os.sendfile is unavailable or
+    cannot write to dst_fd (macOS and the BSDs only send to sockets), so the
+    caller can fall back to a userspace copy.
+    """
+    sendfile = getattr(os, "sendfile", None)
+    if sendfile is None:
+        return False
+    offset = 0
+    while True:
+        try:
+            n = sendfile(dst_fd, src_fd, offset, 1 << 30)
+        except OSError:
+            if offset:
+                raise
+            return False
+        if n == 0:
+            return True
+        offset += n
+
+
+def _safe_unlink(path: str) -> None:
+    """Remove a file if it exists, in one system call and without a check-then-remove race."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _fast_copy(src: str, dst: str) -> None:
+    """
+    Copy a file's contents, letting the kernel clone or copy it server-side.
+    
+    os.copy_file_range allows reflinks on btrfs/XFS and server-side copies on
+    NFS; where it is unavailable this falls back to shutil.copyfile. File
+    metadata is not copied.
+    """
+    with open(src, "rb") as fsrc:
+        # Open dst without truncating it and compare the open files, so the
+        # same-file check needs no extra path lookups
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o666)
+        with open(dst_fd, "wb") as fdst:
+            src_st = os.fstat(fsrc.fileno())
+            dst_st = os.fstat(dst_fd)
+            if (src_st.st_dev, src_st.st_ino) == (dst_st.st_dev, dst_st.st_ino):
+                raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+            os.ftruncate(dst_fd, 0)
+            if _copy_fd_range(fsrc.fileno(), dst_fd, 0):
+                return
+    shutil.copyfile(src, dst)
+
+
+def _fast_copy2(src: str, dst: str) -> None:
+    """
+    Copy a file with its permission bits and timestamps, like shutil.copy2.
+    
+    The contents go through _fast_copy; on platforms without
+    copy_file_range, shutil.copyfile still uses fcopyfile (macOS) or
+    sendfile where available.
+    """
+    _fast_copy(src, dst)
+    shutil.copystat(src, dst)
+
+
+def _atomic_copy(src: str, dst: str) -> None:
+    """
+    Replace dst with a copy of src so that dst is never left half-written.
+    
+    The copy is made next to dst, on the same filesystem, and then renamed
+    over it with os.replace, which is atomic; if the copy fails, dst keeps
+    its previous contents and the partial copy is removed. A symlinked dst
+    is followed, so the link's target is updated and the link kept.
+    """
+    dst = os.path.realpath(dst)
+    # A unique name per call, so concurrent saves to one target don't collide
+    fd, tmp = tempfile.mkstemp(
+        prefix=f".{os.path.basename(dst)}.", suffix=".tmp", dir=os.path.dirname(dst)
+    )
+    os.close(fd)
+    try:
+        _fast_copy2(src, tmp)
+        os.replace(tmp, dst)
+    except BaseException:
+        _safe_unlink(tmp)
+        raise
+
+
+def _atomic_move(src: str, dst: str) -> None:
+    """
+    Move src over dst atomically, renaming it when both are on one filesystem.
+    
+    A rename copies no data; across filesystems (e.g. from /dev/shm) this
+    falls back to _atomic_copy, leaving src in place. A symlinked dst is
+    followed, so the link's target is replaced and the link kept.
+    """
+    dst = os.path.realpath(dst)
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        _atomic_copy(src, dst)
+
+
+# Single background thread removing processor temp directories, created on first use
+_cleanup_executor: Optional[ThreadPoolExecutor] = None
+_cleanup_lock = threading.Lock()
+
+
+def _remove_tree_later(path: str) -> None:
+    """
+    Remove a directory tree in a background thread, ignoring errors.
+    
+    Removals run in submission order; pending ones finish before the
+    interpreter exits, since executor threads are joined at shutdown.
+    """
+    global _cleanup_executor
+    with _cleanup_lock:
+        if _cleanup_executor is None:
+            _cleanup_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vst-cleanup")
+        _cleanup_executor.submit(shutil.rmtree, path, ignore_errors=True)
+
+
+def _flush_cleanup() -> None:
+    """Wait until every removal queued by _remove_tree_later() has finished."""
+    with _cleanup_lock:
+        executor = _cleanup_executor
+    if executor is not None:
+        executor.submit(lambda: None).result()
+
+
+def _reset_cleanup_after_fork() -> None:
+    """Drop the parent's removal thread in a forked child, which does not inherit it."""
+    global _cleanup_executor, _cleanup_lock
+    _cleanup_executor = None
+    _cleanup_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_cleanup_after_fork)
+
+
+# Order in which the JAR applies its structural processors within one invocation
+_OP_RANKS = {
+    'clean_structures': 0,
+    'reset_world': 1,
+}
+
+
+# JAR options for each queued SaveFileProcessor operation, built from its kwargs
+_OP_ARGS = {
+    'clean_structures': lambda kwargs: [
+        "--cleanStructures", "--cleanStructuresThreshold", str(kwargs.get('threshold', 25))
+    ],
+    'reset_world': lambda kwargs: ["--resetWorld"],
+    'add_global_key': lambda kwargs: ["--addGlobalKey", kwargs['key']],
+    'remove_global_key': lambda kwargs: ["--removeGlobalKey", kwargs['key']],
+    'clear_all_global_keys': lambda kwargs: ["--removeGlobalKey", "all"],
+}
+
+
+def _operation_args(operation: str, kwargs: Dict) -> List[str]:
+    """Translate a queued SaveFileProcessor operation into JAR options."""
+    try:
+        build = _OP_ARGS[operation]
+    except KeyError:
+        raise ValueError(f"Unknown operation: {operation}") from None
+    return build(kwargs)
+
+
+def _plan_invocations(operations: List[tuple]) -> List[List[str]]:
+    """
+    Group queued operations into as few JAR invocations as possible.
+    
+    Global keys are independent of structures and zones, so all key operations
+    are reduced to their net effect and run in the first invocation: only the
+    last add or remove of each key is kept, and clearing all keys discards
+    every key operation queued before it. The JAR removes keys before adding
+    them, which matches that net effect.
+    
+    Structure cleaning and world reset are merged while they follow the JAR's
+    clean-then-reset order; a new invocation starts when a reset is followed
+    by a clean, or when a clean is repeated. A reset directly following
+    another reset leaves nothing new to reset and is dropped.
+    
+    Args:
+        operations: Queued (operation, kwargs) tuples
+        
+    Returns:
+        List of option lists, one per JAR invocation
+    """
+    cleared = False
+    key_ops: Dict[str, str] = {}
+    structural = []
+    for operation, kwargs in operations:
+        if operation == 'clear_all_global_keys' or (
+                operation == 'remove_global_key' and kwargs['key'] == 'all'):
+            cleared = True
+            key_ops.clear()
+        elif operation in ('add_global_key', 'remove_global_key'):
+            key = kwargs['key']
+            key_ops.pop(key, None)
+            # Removing a key after all keys were cleared is a no-op unless
+            # the key was added again in between
+            if operation == 'add_global_key' or not cleared:
+                key_ops[key] = operation
+        else:
+            structural.append((operation, kwargs))
+    
+    current = _operation_args('clear_all_global_keys', {}) if cleared else []
+    for key, operation in key_ops.items():
+        current.extend(_operation_args(operation, {'key': key}))
+    
+    invocations = []
+    last_rank = -1
+    for operation, kwargs in structural:
+        args = _operation_args(operation, kwargs)
+        rank = _OP_RANKS[operation]
+        if operation == 'reset_world' and last_rank == rank:
+            continue
+        if rank <= last_rank:
+            invocations.append(current)
+            current = []
+        current.extend(args)
+        last_rank = rank
+    if current:
+        invocations.append(current)
+    return invocations
+
+
+@lru_cache(maxsize=None)
+def _which_java(java_path: str, search_path: Optional[str]) -> Optional[str]:
+    """
+    Look up a Java executable on the search path, once per name and PATH value.
+    
+    Args:
+        java_path: Executable name or path to resolve
+        search_path: Value of PATH to search, part of the cache key so a
+            changed PATH is searched again
+        
+    Returns:
+        Resolved executable path, or None if it was not found
+    """
+    return shutil.which(java_path, path=search_path)
+
+
+@lru_cache(maxsize=None)
+def _find_bundled_jar(package_dir: str) -> Optional[Path]:
+    """
+    Return the first JAR in the package directory or one of its subdirectories.
+    
+    The bundled JAR lives at most one level down, so deeper directories are
+    not walked. The installed package does not change while the process runs,
+    so the search is done once and shared by every ValheimSaveTools instance.
+    
+    Args:
+        package_dir: Directory to search
+        
+    Returns:
+        Path to the JAR, or None if there is none
+    """
+    # Level by level, so a JAR at the top level wins over one in a
+    # subdirectory; scandir's d_type hints answer is_file()/is_dir()
+    # without a stat per entry
+    level = [package_dir]
+    for _ in range(2):
+        subdirs = []
+        for directory in level:
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.name.endswith(".jar") and entry.is_file():
+                            return Path(entry.path)
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+            except OSError:
+                continue
+        level = subdirs
+    return None
+
 
 class ValheimSaveTools:
-    """Python wrapper for Valheim Save Tools JAR file."""
+    """
+    Python wrapper for Valheim Save Tools JAR file.
+    
+    to_json() and list_global_keys() cache results for unchanged files. Each
+    cached to_json() entry is the whole raw JSON document, which for a large
+    world runs to tens of megabytes, so the cache holds at most cache_size
+    entries and cache_max_bytes bytes in total (64 MiB by default). Pass
+    cache_size=0 to disable it.
+    """
+    
+    # JVM flags used by fast_startup=True. The JAR has no long-running mode, so
+    # every operation starts a new JVM; these trade peak JIT throughput for a
+    # shorter startup, which dominates the short runs of a save file operation.
+    FAST_STARTUP_JVM_OPTIONS: Tuple[str, ...] = (
+        "-XX:+UseSerialGC",
+        "-XX:TieredStopAtLevel=1",
+        "-Xshare:auto",
+    )
     
     def __init__(
         self, 
@@ -21,13 +442,48 @@ class ValheimSaveTools:
         java_path: Optional[str] = None,
         verbose: bool = False,
         fail_on_unsupported_version: bool = False,
-        skip_resolve_names: bool = False
+        skip_resolve_names: bool = False,
+        cache_size: int = 8,
+        jvm_options: Optional[List[str]] = None,
+        fast_startup: bool = False,
+        cache_max_bytes: int = _DEFAULT_CACHE_MAX_BYTES
     ):
         self.jar_path = self._find_jar(jar_path)
         self.java_path = self._find_java(java_path)
-        self.verbose = verbose
-        self.fail_on_unsupported_version = fail_on_unsupported_version
-        self.skip_resolve_names = skip_resolve_names
+        self._verbose = verbose
+        self._fail_on_unsupported_version = fail_on_unsupported_version
+        self._skip_resolve_names = skip_resolve_names
+        # Flags passed to every JAR command, rebuilt only when a setting changes
+        self._common_flags: Tuple[str, ...] = ()
+        self._update_common_flags()
+        # Extra JVM flags placed before -jar, e.g. ["-XX:TieredStopAtLevel=1", "-Xshare:auto"]
+        # to shorten startup of the short-lived JAR processes
+        self.jvm_options = list(jvm_options) if jvm_options else []
+        if fast_startup:
+            # User options come last so they can override the defaults
+            self.jvm_options[:0] = self.FAST_STARTUP_JVM_OPTIONS
+        # Command prefix shared by every JAR invocation, resolved once and
+        # kept immutable so no caller can alter it for later commands
+        self._cmd_prefix: Tuple[str, ...] = (
+            self.java_path, *self.jvm_options, "-jar", str(self.jar_path)
+        )
+        
+        # LRU cache of conversion results, keyed by file identity (see _cache_key).
+        # Entries hold whole raw JSON documents, so the total is bounded by
+        # cache_max_bytes as well as by entry count
+        self._cache_size = max(0, cache_size) if cache_max_bytes > 0 else 0
+        self._cache_max_bytes = max(0, cache_max_bytes)
+        self._cache_bytes = 0
+        self._cache: "OrderedDict[tuple, Tuple[object, int]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # Highest clean_structures threshold applied to each file, keyed by path
+        self._clean_marks: Dict[str, tuple] = {}
+        
+        # Working directory for intermediate files, created on first use
+        self._workdir: Optional[str] = None
+        self._workdir_cleanup: Optional[weakref.finalize] = None
+        self._workdir_lock = threading.Lock()
+        self._temp_names = itertools.count()
         
     def _find_jar(self, jar_path: Optional[str]) -> Path:
         """Locate the JAR file."""
@@ -45,13 +501,11 @@ class ValheimSaveTools:
                 return jar
         
         # Check package directory (bundled JAR)
-        package_dir = Path(__file__).parent
-        for jar_file in package_dir.glob("*.jar"):
-            return jar_file
-        
-        # Check subdirectories
-        for jar_file in package_dir.glob("**/*.jar"):
-            return jar_file
+        bundled = _find_bundled_jar(os.path.dirname(__file__))
+        if bundled is not None:
+            return bundled
+        # Don't remember a miss; a JAR may still be placed there later
+        _find_bundled_jar.cache_clear()
         
         raise JarNotFoundError(
             "JAR file not found. Provide jar_path, set VALHEIM_SAVE_TOOLS_JAR, "
@@ -60,40 +514,62 @@ class ValheimSaveTools:
     
     def _find_java(self, java_path: Optional[str]) -> str:
         """Locate Java executable."""
-        if java_path:
-            if shutil.which(java_path):
-                return java_path
-            raise JavaNotFoundError(f"Java not found: {java_path}")
-        
-        java = shutil.which("java")
-        if java:
-            return java
-        
-        raise JavaNotFoundError("Java not found in PATH.")
+        java = _which_java(java_path or "java", os.environ.get("PATH"))
+        if java is None:
+            # Don't remember a miss; Java may still be installed later
+            _which_java.cache_clear()
+            if java_path:
+                raise JavaNotFoundError(f"Java not found: {java_path}")
+            raise JavaNotFoundError("Java not found in PATH.")
+        
+        return java_path or java
     
     def run_command(
         self,
         *args: str,
         check: bool = True,
         timeout: Optional[int] = None,
-        input_data: Optional[str] = None
+        input_data: Optional[str] = None,
+        capture: bool = True
     ) -> subprocess.CompletedProcess:
-        """Run JAR command."""
-        cmd = [self.java_path, "-jar", str(self.jar_path)] + list(args)
+        """
+        Run JAR command.
+        
+        Args:
+            *args: Arguments passed to the JAR
+            check: Raise CommandExecutionError on a non-zero exit code
+            timeout: Seconds to wait before giving up
+            input_data: Text sent to the JAR's stdin
+            capture: Capture stdout in the result. Pass False when the JAR
+                     writes to a file and its stdout is not needed; stdout is
+                     then discarded (result.stdout is None) while stderr is
+                     kept as undecoded bytes and only decoded for the error
+                     message when the command fails.
+        
+        Returns:
+            The completed process
+        """
+        cmd = [*self._cmd_prefix, *args]
+        if not capture and isinstance(input_data, str):
+            input_data = input_data.encode("utf-8")
         
         try:
             result = subprocess.run(
                 cmd,
                 input=input_data,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.PIPE if capture else subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=capture,
                 timeout=timeout,
                 check=False
             )
             
             if check and result.returncode != 0:
+                stderr = result.stderr
+                if isinstance(stderr, bytes):
+                    stderr = stderr.decode("utf-8", errors="replace")
                 raise CommandExecutionError(
-                    f"Command failed (exit {result.returncode}): {result.stderr}"
+                    f"Command failed (exit {result.returncode}): {stderr}"
                 )
             
             return result
@@ -103,21 +579,212 @@ class ValheimSaveTools:
         except Exception as e:
             raise CommandExecutionError(f"Command failed: {e}")
     
-    def _build_common_flags(self) -> List[str]:
-        """Build common flags from instance settings."""
+    @property
+    def verbose(self) -> bool:
+        """Whether the JAR runs with verbose output."""
+        return self._verbose
+    
+    @verbose.setter
+    def verbose(self, value: bool) -> None:
+        self._verbose = value
+        self._update_common_flags()
+    
+    @property
+    def fail_on_unsupported_version(self) -> bool:
+        """Whether the JAR fails on unsupported file versions."""
+        return self._fail_on_unsupported_version
+    
+    @fail_on_unsupported_version.setter
+    def fail_on_unsupported_version(self, value: bool) -> None:
+        self._fail_on_unsupported_version = value
+        self._update_common_flags()
+    
+    @property
+    def skip_resolve_names(self) -> bool:
+        """Whether the JAR skips resolving player names."""
+        return self._skip_resolve_names
+    
+    @skip_resolve_names.setter
+    def skip_resolve_names(self, value: bool) -> None:
+        self._skip_resolve_names = value
+        self._update_common_flags()
+    
+    def _update_common_flags(self) -> None:
+        """Rebuild the common flags from the instance settings."""
         flags = []
-        if self.verbose:
+        if self._verbose:
             flags.append("-v")
-        if self.fail_on_unsupported_version:
+        if self._fail_on_unsupported_version:
             flags.append("--failOnUnsupportedVersion")
-        if self.skip_resolve_names:
+        if self._skip_resolve_names:
             flags.append("--skipResolveNames")
-        return flags
+        self._common_flags = tuple(flags)
+    
+    def _build_common_flags(self) -> Tuple[str, ...]:
+        """Return the common flags; kept for callers of the old builder."""
+        return self._common_flags
+    
+    def _cache_key(self, op: str, file_path: str, flags: Iterable[str]) -> Optional[tuple]:
+        """
+        Build a cache key identifying the current state of a file on disk.
+        
+        Args:
+            op: Name of the operation the cached result belongs to
+            file_path: Path to the input file
+            flags: Command flags that influence the result
+            
+        Returns:
+            Key tuple of (op, absolute path, mtime_ns, size, flags), or None if
+            caching is disabled or the file cannot be stat'ed
+        """
+        if not self._cache_size:
+            return None
+        state = self._file_state(file_path)
+        if state is None:
+            return None
+        return (op, *state, tuple(flags))
+    
+    @staticmethod
+    def _file_state(file_path: str) -> Optional[tuple]:
+        """Return (absolute path, mtime_ns, size) for a file, or None if it cannot be stat'ed."""
+        try:
+            st = os.stat(file_path)
+        except (OSError, ValueError):
+            return None
+        return (os.path.abspath(file_path), st.st_mtime_ns, st.st_size)
+    
+    def _cache_get(self, key: Optional[tuple]) -> Optional[object]:
+        """Return a cached result and mark it as most recently used."""
+        if key is None:
+            return None
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            self._cache.move_to_end(key)
+            return entry[0]
+    
+    def _cache_put(self, key: Optional[tuple], value: object) -> None:
+        """Store a result, evicting the least recently used entries."""
+        if key is None:
+            return
+        size = _cached_size(value)
+        if size > self._cache_max_bytes:
+            # Would evict everything else and still not fit
+            return
+        with self._cache_lock:
+            old = self._cache.pop(key, None)
+            if old is not None:
+                self._cache_bytes -= old[1]
+            self._cache[key] = (value, size)
+            self._cache_bytes += size
+            while (len(self._cache) > self._cache_size
+                   or self._cache_bytes > self._cache_max_bytes):
+                _, (_, evicted) = self._cache.popitem(last=False)
+                self._cache_bytes -= evicted
+    
+    def _invalidate(self, file_path: str) -> None:
+        """Drop all cached results for a file that is about to change or just changed."""
+        abs_path = os.path.abspath(file_path)
+        with self._cache_lock:
+            self._clean_marks.pop(abs_path, None)
+            for key in [k for k in self._cache if k[1] == abs_path]:
+                self._cache_bytes -= self._cache.pop(key)[1]
+    
+    def _mark_cleaned(self, file_path: str, threshold: int) -> None:
+        """Remember that a file in its current state was cleaned at threshold."""
+        state = self._file_state(file_path)
+        if state is None:
+            return
+        with self._cache_lock:
+            self._clean_marks[state[0]] = (state[1], state[2], threshold)
+    
+    def clear_cache(self) -> None:
+        """
+        Discard all cached conversion results and global key lists.
+        
+        Results are keyed on file path, modification time and size, so a
+        modified file is never served from the cache. Call this to release
+        memory or after changing a file in a way that preserves both its
+        size and mtime.
+        """
+        with self._cache_lock:
+            self._cache.clear()
+            self._cache_bytes = 0
+            self._clean_marks.clear()
+    
+    def close(self) -> None:
+        """
+        Remove the working directory holding intermediate files.
+        
+        The instance stays usable; a new working directory is created on
+        the next operation that needs one. Called automatically when the
+        instance is used as a context manager, and at interpreter exit.
+        """
+        # Let queued processor cleanups finish before the whole tree goes
+        _flush_cleanup()
+        with self._workdir_lock:
+            if self._workdir_cleanup is not None:
+                self._workdir_cleanup()
+            self._workdir = None
+            self._workdir_cleanup = None
+    
+    def __enter__(self) -> 'ValheimSaveTools':
+        """
+        Enter context manager.
+        
+        Returns:
+            Self for use in with statement
+            
+        Example:
+            >>> with ValheimSaveTools() as vst:
+            ...     data = vst.to_json("world.db")
+            ...     vst.add_global_key("world.db", "defeated_eikthyr")
+        """
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Exit context manager, removing the working directory.
+        
+        Returns:
+            False to propagate exceptions
+        """
+        self.close()
+        return False
     
     def _auto_output_path(self, input_file: str, new_extension: str) -> str:
         """Generate output filename by changing extension."""
-        input_path = Path(input_file)
-        return str(input_path.with_suffix(new_extension))
+        base, _ = os.path.splitext(input_file)
+        return base + new_extension
+    
+    def _temp_path(self, suffix: str = "") -> str:
+        """
+        Return a new path for an intermediate file.
+        
+        Paths are numbered slots in a working directory shared by all
+        operations of this instance, so no per-call temp file is created. The
+        directory is made on first use and removed, with anything left in
+        it, by close() or when the instance is garbage collected.
+        
+        Args:
+            suffix: File suffix (e.g., '.db', '.json')
+            
+        Returns:
+            Path that does not exist yet
+        """
+        # Slots must be named files: the JAR picks its input and output
+        # format from the file extension, so unnamed O_TMPFILE inodes reached
+        # through /proc/self/fd/N (which has no extension) cannot be used.
+        if self._workdir is None:
+            with self._workdir_lock:
+                if self._workdir is None:
+                    workdir = tempfile.mkdtemp(prefix="valheim_tools_", dir=_scratch_root())
+                    self._workdir_cleanup = weakref.finalize(
+                        self, shutil.rmtree, workdir, ignore_errors=True
+                    )
+                    self._workdir = workdir
+        return os.path.join(self._workdir, f"{next(self._temp_names)}{suffix}")
     
     @staticmethod
     def _is_file_like(obj) -> bool:
@@ -132,7 +799,44 @@ class ValheimSaveTools:
         """
         return hasattr(obj, 'read') and callable(getattr(obj, 'read'))
     
-    def _resolve_input(self, input_source: Union[str, BinaryIO], suffix: str = "", auto_detect_suffix: bool = True) -> tuple[str, bool]:
+    @staticmethod
+    def _direct_path(input_source, suffix: str) -> Optional[str]:
+        """
+        Return the on-disk path behind an unread, read-only binary file object.
+        
+        The JAR reads the whole file from its path, so this only applies to
+        objects opened with mode 'rb', positioned at the start, whose .name
+        still refers to the open file and carries the expected suffix.
+        
+        Args:
+            input_source: File-like object
+            suffix: Suffix the path must have (e.g., '.db')
+            
+        Returns:
+            The file's path, or None if it must be copied to a temp file
+        """
+        name = getattr(input_source, 'name', None)
+        if (not isinstance(name, str) or getattr(input_source, 'mode', None) != 'rb'
+                or os.path.splitext(name)[1] != suffix or suffix.lower() not in _SAVE_SUFFIXES):
+            return None
+        try:
+            if input_source.tell() != 0:
+                return None
+            open_st = os.fstat(input_source.fileno())
+            path_st = os.stat(name)
+        except (AttributeError, OSError, ValueError):
+            return None
+        if (open_st.st_dev, open_st.st_ino) != (path_st.st_dev, path_st.st_ino):
+            return None
+        return name
+    
+    def _resolve_input(
+        self,
+        input_source: Union[str, BinaryIO],
+        suffix: str = "",
+        auto_detect_suffix: bool = True,
+        direct: bool = False
+    ) -> tuple[str, bool]:
         """
         Resolve input to a file path, creating temp file if needed.
         
@@ -141,6 +845,9 @@ class ValheimSaveTools:
             suffix: File suffix for temp file (e.g., '.db', '.json')
             auto_detect_suffix: If True, try to detect suffix from file-like object's 
                               .filename (FastAPI UploadFile) or .name (standard files) attribute
+            direct: If True, a save file opened with mode 'rb' and not yet read
+                    is used through its own path instead of a temp copy. Only
+                    for callers that do not write back into the input.
             
         Returns:
             Tuple of (file_path, is_temp_file)
@@ -167,12 +874,17 @@ class ValheimSaveTools:
                 
                 # Extract extension if we found a filename
                 if filename_to_check and isinstance(filename_to_check, str):
-                    ext = Path(filename_to_check).suffix
+                    ext = os.path.splitext(filename_to_check)[1]
                     if ext:
                         detected_suffix = ext
             
+            if direct:
+                path = self._direct_path(input_source, detected_suffix)
+                if path is not None:
+                    return path, False
+            
             # Create temp file and write content
-            tmp = tempfile.NamedTemporaryFile(delete=False, suffix=detected_suffix)
+            tmp = open(self._temp_path(detected_suffix), "wb")
             try:
                 # Save current position if seekable
                 original_position = None
@@ -190,10 +902,21 @@ class ValheimSaveTools:
                         tmp.write(content.encode('utf-8'))
                     else:
                         tmp.write(content)
+                elif isinstance(input_source, io.BytesIO):
+                    # Write straight from the BytesIO buffer without copying it
+                    with input_source.getbuffer() as view:
+                        tmp.write(view[input_source.tell():])
                 else:
-                    # Binary mode or BytesIO
-                    content = input_source.read()
-                    tmp.write(content)
+                    # Binary mode file: copy in the kernel when it is backed by
+                    # a real file, otherwise stream in chunks instead of
+                    # holding a second full copy of the save in memory
+                    try:
+                        src_fd = input_source.fileno()
+                    except (AttributeError, OSError, ValueError):
+                        src_fd = None
+                    if (src_fd is None or original_position is None
+                            or not _copy_fd_range(src_fd, tmp.fileno(), original_position)):
+                        shutil.copyfileobj(input_source, tmp, _COPY_BUFSIZE)
                 
                 # Reset file pointer to original position for reuse
                 if original_position is not None:
@@ -206,8 +929,7 @@ class ValheimSaveTools:
                 return tmp.name, True
             except Exception as e:
                 tmp.close()
-                if os.path.exists(tmp.name):
-                    os.remove(tmp.name)
+                _safe_unlink(tmp.name)
                 raise ValueError(f"Failed to read from file-like object: {e}")
         else:
             # Assume it's a file path
@@ -228,16 +950,148 @@ class ValheimSaveTools:
             return None
         
         if self._is_file_like(output_dest):
-            # Write to file-like object
+            # Stream to the file-like object without loading the whole file
             with open(file_path, 'rb') as f:
-                output_dest.write(f.read())
+                shutil.copyfileobj(f, output_dest, _COPY_BUFSIZE)
             return None
         else:
-            # It's a file path, copy the file
+            # It's a file path; the source is a fresh temp file, so there is
+            # no metadata to keep
             if file_path != str(output_dest):
-                shutil.copy2(file_path, str(output_dest))
+                _fast_copy(file_path, str(output_dest))
             return str(output_dest)
 
+    def _run_mutator(
+        self,
+        db_file: Union[str, BinaryIO],
+        output_file: Union[str, BinaryIO, None],
+        processor_args: List[str],
+        clean_threshold: Optional[int] = None
+    ) -> Optional[str]:
+        """
+        Run JAR processors that modify a .db file and route the result.
+        
+        Shared by the key, cleaning and reset methods: the input is resolved
+        and validated, the result goes to output_file, back into a file-like
+        input, or over the input path, and temporary files are removed.
+        
+        Args:
+            db_file: Path to .db file or file-like object
+            output_file: Path to output file, file-like object, or None (overwrites input if None and input is path)
+            processor_args: JAR processor options
+            clean_threshold: Threshold to record for incremental cleaning when
+                             the arguments only clean structures
+            
+        Returns:
+            Path to the modified file (if output is a path), or None (if output is file-like or input was file-like)
+        """
+        # Resolve input to file path
+        db_path, db_is_temp = self._resolve_input(db_file, suffix=".db")
+        # db_is_temp doubles as "input is file-like"; classify the output once too
+        output_is_file_like = self._is_file_like(output_file)
+        
+        try:
+            # Check file type if path was provided
+            if not db_is_temp and not self.is_db_file(db_path):
+                raise ValueError(f"Input file is not a valid .db file: {db_path}")
+            
+            # Determine output path
+            output_is_temp = False
+            if output_file is None:
+                if db_is_temp:
+                    # For file-like input without output, create temp file
+                    output_path = self._temp_path(".db")
+                    output_is_temp = True
+                else:
+                    # For path input without output, overwrite input
+                    output_path = db_path
+            elif output_is_file_like:
+                # Create temp file for file-like output
+                output_path = self._temp_path(".db")
+                output_is_temp = True
+            else:
+                output_path = str(output_file)
+            
+            # Run command
+            flags = self._common_flags
+            self.run_command(db_path, output_path, *processor_args, *flags, capture=False)
+            if not output_is_temp:
+                self._invalidate(output_path)
+                if clean_threshold is not None:
+                    self._mark_cleaned(output_path, clean_threshold)
+            
+            # Handle output
+            result = None
+            if output_is_file_like:
+                # Stream to file-like object
+                with open(output_path, 'rb') as f:
+                    shutil.copyfileobj(f, output_file, _COPY_BUFSIZE)
+            elif db_is_temp and output_file is None:
+                # Write back to file-like input, truncating after the new end;
+                # real files are filled by the kernel without a userspace copy
+                try:
+                    dst_fd = db_file.fileno()
+                except (AttributeError, OSError, ValueError):
+                    dst_fd = None
+                with open(output_path, 'rb') as f:
+                    db_file.seek(0)
+                    if dst_fd is not None and _sendfile_all(dst_fd, f.fileno()):
+                        db_file.seek(os.fstat(f.fileno()).st_size)
+                    else:
+                        shutil.copyfileobj(f, db_file, _COPY_BUFSIZE)
+                    db_file.truncate()
+            else:
+                result = output_path
+            
+            # Cleanup temp output file if created
+            if output_is_temp:
+                _safe_unlink(output_path)
+            
+            return result
+            
+        finally:
+            # Cleanup temp input file if created
+            if db_is_temp:
+                _safe_unlink(db_path)
+    
+    @staticmethod
+    def _map_concurrently(func, *iterables, workers: Optional[int] = None) -> list:
+        """
+        Call func on each zipped set of arguments from a thread pool.
+        
+        Each call waits on its own JAR process, so threads are enough to run
+        them concurrently.
+        
+        Args:
+            func: Function to call
+            *iterables: Argument sequences, zipped together
+            workers: Maximum number of concurrent calls (default: CPU count)
+            
+        Returns:
+            Results in input order
+        """
+        calls = list(zip(*iterables))
+        if not calls:
+            return []
+        
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = max(1, min(workers, len(calls)))
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda args: func(*args), calls))
+    
+    @staticmethod
+    def _batch_outputs(inputs: list, output_files: Optional[Iterable]) -> list:
+        """Pair batch inputs with their outputs, defaulting every output to None."""
+        if output_files is None:
+            return [None] * len(inputs)
+        outputs = list(output_files)
+        if len(outputs) != len(inputs):
+            raise ValueError(
+                f"Got {len(outputs)} output files for {len(inputs)} input files"
+            )
+        return outputs
     
     # File Conversion Methods
     
@@ -271,56 +1125,76 @@ class ValheimSaveTools:
                 auto_detect = True  # Try to detect from .name attribute
         else:
             # For file paths, preserve the original extension
-            suffix = Path(str(input_file)).suffix or ".db"
+            suffix = os.path.splitext(input_file)[1] or ".db"
             auto_detect = False
         
         # Resolve input to file path
-        input_path, input_is_temp = self._resolve_input(input_file, suffix=suffix, auto_detect_suffix=auto_detect)
+        input_path, input_is_temp = self._resolve_input(
+            input_file, suffix=suffix, auto_detect_suffix=auto_detect, direct=True
+        )
+        output_is_file_like = self._is_file_like(output_file)
         
         try:
             # Check file type based on path if available
-            if not self._is_file_like(input_file):
-                if (not self.is_db_file(input_path) 
-                    and not self.is_fwl_file(input_path) 
-                    and not self.is_fch_file(input_path)):
+            if not input_is_temp:
+                if os.path.splitext(input_path)[1].lower() not in _SAVE_SUFFIXES:
                     raise ValueError(
                         f"Input file is not a valid Valheim save file: {input_path} (expected .db, .fwl, or .fch)"
                     )
             
-            # Determine output path
+            flags = self._common_flags
+            
+            # Serve unchanged files from the cache without starting the JVM
+            cache_key = None
+            if not input_is_temp:
+                cache_key = self._cache_key("to_json", input_path, flags)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                if output_file is not None:
+                    if output_is_file_like:
+                        output_file.write(cached)
+                    else:
+                        with open(output_file, "wb") as f:
+                            f.write(cached)
+                return _loads(cached)
+            
+            # Determine output path. The JAR picks the output format from the
+            # file extension and has no stdout mode, so None and file-like
+            # outputs go through a .json slot in the working directory, which
+            # is read once below
             tmp_output = None
-            if output_file is None or self._is_file_like(output_file):
-                tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".json")
-                tmp_output = tmp.name
-                tmp.close()
+            if output_file is None or output_is_file_like:
+                tmp_output = self._temp_path(".json")
                 output_path = tmp_output
             else:
                 output_path = str(output_file)
             
             # Run conversion
-            flags = self._build_common_flags()
-            self.run_command(input_path, output_path, *flags)
+            self.run_command(input_path, output_path, *flags, capture=False)
             
-            # Read JSON data
-            with open(output_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            
-            # Handle output
-            if output_file is not None and self._is_file_like(output_file):
-                # Write to file-like object
-                with open(output_path, 'rb') as f:
-                    output_file.write(f.read())
+            # Read JSON data. When the raw document is also needed for the
+            # cache or a file-like output, read it once and reuse the buffer
+            if cache_key is None and not output_is_file_like:
+                data = _read_json(output_path)
+            else:
+                with open(output_path, "rb") as f:
+                    raw = f.read()
+                data = _loads(raw)
+                if cache_key is not None:
+                    self._cache_put(cache_key, raw)
+                if output_is_file_like:
+                    output_file.write(raw)
             
             # Cleanup temp files
-            if tmp_output and os.path.exists(tmp_output):
-                os.remove(tmp_output)
+            if tmp_output is not None:
+                _safe_unlink(tmp_output)
             
             return data
             
         finally:
             # Cleanup temp input file if created
-            if input_is_temp and os.path.exists(input_path):
-                os.remove(input_path)
+            if input_is_temp:
+                _safe_unlink(input_path)
     
     def from_json(
         self, 
@@ -339,49 +1213,105 @@ class ValheimSaveTools:
         """
         # Resolve input to file path
         input_path, input_is_temp = self._resolve_input(input_file, suffix=".json")
+        output_is_temp = self._is_file_like(output_file)
         
         try:
             # Check file type if path was provided
-            if not self._is_file_like(input_file) and not self.is_json_file(input_path):
+            if not input_is_temp and not self.is_json_file(input_path):
                 raise ValueError(f"Input file is not a JSON file: {input_path}")
             
             # Determine output path
-            output_is_temp = False
             if output_file is None:
                 # Auto-generate output path
                 output_path = self._auto_output_path(input_path, ".db")
-            elif self._is_file_like(output_file):
+            elif output_is_temp:
                 # Create temp file for file-like output
-                tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
-                output_path = tmp.name
-                tmp.close()
-                output_is_temp = True
+                output_path = self._temp_path(".db")
             else:
                 output_path = str(output_file)
             
             # Run conversion
-            flags = self._build_common_flags()
-            self.run_command(input_path, output_path, *flags)
+            flags = self._common_flags
+            self.run_command(input_path, output_path, *flags, capture=False)
+            if not output_is_temp:
+                self._invalidate(output_path)
             
             # Handle output
             result = None
-            if output_file is not None and self._is_file_like(output_file):
-                # Write to file-like object
+            if output_is_temp:
+                # Stream to file-like object
                 with open(output_path, 'rb') as f:
-                    output_file.write(f.read())
+                    shutil.copyfileobj(f, output_file, _COPY_BUFSIZE)
             else:
                 result = output_path
             
             # Cleanup temp output file if created
-            if output_is_temp and os.path.exists(output_path):
-                os.remove(output_path)
+            if output_is_temp:
+                _safe_unlink(output_path)
             
             return result
             
         finally:
             # Cleanup temp input file if created
-            if input_is_temp and os.path.exists(input_path):
-                os.remove(input_path)
+            if input_is_temp:
+                _safe_unlink(input_path)
+    
+    def to_json_batch(
+        self,
+        input_files: Iterable[Union[str, Path]],
+        output_files: Optional[Iterable[Union[str, Path, None]]] = None,
+        workers: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Convert several save files to JSON in parallel.
+        
+        Each file is converted by its own to_json() call, so cached results are
+        reused and one JAR process runs per remaining file.
+        
+        Args:
+            input_files: Paths to .db, .fwl, or .fch files
+            output_files: Output JSON paths matching input_files, or None to
+                          only return the data
+            workers: Maximum number of concurrent JAR processes (default: CPU count)
+            
+        Returns:
+            Parsed JSON data, in the same order as input_files
+        """
+        inputs = [str(input_file) for input_file in input_files]
+        for path in inputs:
+            if os.path.splitext(path)[1].lower() not in _SAVE_SUFFIXES:
+                raise ValueError(
+                    f"Input file is not a valid Valheim save file: {path} (expected .db, .fwl, or .fch)"
+                )
+        outputs = self._batch_outputs(inputs, output_files)
+        
+        return self._map_concurrently(self.to_json, inputs, outputs, workers=workers)
+    
+    def from_json_batch(
+        self,
+        input_files: Iterable[Union[str, Path]],
+        output_files: Optional[Iterable[Union[str, Path, None]]] = None,
+        workers: Optional[int] = None
+    ) -> List[str]:
+        """
+        Convert several JSON files back to save files in parallel.
+        
+        Args:
+            input_files: Paths to JSON files
+            output_files: Output save file paths matching input_files, or None
+                          to derive each from its input (auto-generated)
+            workers: Maximum number of concurrent JAR processes (default: CPU count)
+            
+        Returns:
+            Paths to the created save files, in the same order as input_files
+        """
+        inputs = [str(input_file) for input_file in input_files]
+        for path in inputs:
+            if not self.is_json_file(path):
+                raise ValueError(f"Input file is not a JSON file: {path}")
+        outputs = self._batch_outputs(inputs, output_files)
+        
+        return self._map_concurrently(self.from_json, inputs, outputs, workers=workers)
     
     # Global Keys Operations
     
@@ -396,22 +1326,46 @@ class ValheimSaveTools:
             List of global key names
         """
         # Resolve input to file path
-        db_path, db_is_temp = self._resolve_input(db_file, suffix=".db")
+        db_path, db_is_temp = self._resolve_input(db_file, suffix=".db", direct=True)
         
         try:
             # Check file type if path was provided
             if not self._is_file_like(db_file) and not self.is_db_file(db_path):
                 raise ValueError(f"Input file is not a valid .db file: {db_path}")
             
+            # Unchanged files are answered from the cache
+            cache_key = None
+            if not db_is_temp:
+                cache_key = self._cache_key("list_global_keys", db_path, [])
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return list(cached)
+            
             result = self.run_command(db_path, "--listGlobalKeys")
             # Parse output - format is typically one key per line
             keys = [line.strip() for line in result.stdout.splitlines() if line.strip()]
+            self._cache_put(cache_key, tuple(keys))
             return keys
             
         finally:
             # Cleanup temp file if created
-            if db_is_temp and os.path.exists(db_path):
-                os.remove(db_path)
+            if db_is_temp:
+                _safe_unlink(db_path)
+    
+    def peek_global_keys(self, db_file: Union[str, BinaryIO]) -> FrozenSet[str]:
+        """
+        Return the global keys of a world as a set for membership checks.
+        
+        Shares the list_global_keys() cache, so repeated checks against an
+        unchanged file do not run the JAR again.
+        
+        Args:
+            db_file: Path to .db file or file-like object
+            
+        Returns:
+            Frozen set of global key names
+        """
+        return frozenset(self.list_global_keys(db_file))
     
     def add_global_key(
         self, 
@@ -430,64 +1384,26 @@ class ValheimSaveTools:
         Returns:
             Path to the modified file (if output is a path), or None (if output is file-like or input was file-like)
         """
-        # Resolve input to file path
-        db_path, db_is_temp = self._resolve_input(db_file, suffix=".db")
-        
-        try:
-            # Check file type if path was provided
-            if not self._is_file_like(db_file) and not self.is_db_file(db_path):
-                raise ValueError(f"Input file is not a valid .db file: {db_path}")
-            
-            # Determine output path
-            output_is_temp = False
-            if output_file is None:
-                if self._is_file_like(db_file):
-                    # For file-like input without output, create temp file
-                    tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
-                    output_path = tmp.name
-                    tmp.close()
-                    output_is_temp = True
-                else:
-                    # For path input without output, overwrite input
-                    output_path = db_path
-            elif self._is_file_like(output_file):
-                # Create temp file for file-like output
-                tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
-                output_path = tmp.name
-                tmp.close()
-                output_is_temp = True
-            else:
-                output_path = str(output_file)
-            
-            # Run command
-            flags = self._build_common_flags()
-            self.run_command(db_path, output_path, "--addGlobalKey", key, *flags)
-            
-            # Handle output
-            result = None
-            if output_file is not None and self._is_file_like(output_file):
-                # Write to file-like object
-                with open(output_path, 'rb') as f:
-                    output_file.write(f.read())
-            elif self._is_file_like(db_file) and output_file is None:
-                # Write back to file-like input
-                with open(output_path, 'rb') as f:
-                    db_file.seek(0)
-                    db_file.write(f.read())
-                    db_file.truncate()
-            else:
-                result = output_path
-            
-            # Cleanup temp output file if created
-            if output_is_temp and os.path.exists(output_path):
-                os.remove(output_path)
-            
-            return result
+        return self.add_global_keys(db_file, [key], output_file)
+    
+    def add_global_keys(
+        self, 
+        db_file: Union[str, BinaryIO], 
+        keys: Iterable[str], 
+        output_file: Union[str, BinaryIO, None] = None
+    ) -> Optional[str]:
+        """
+        Add several global keys to a world database file in a single pass.
+        
+        Args:
+            db_file: Path to .db file or file-like object
+            keys: Global keys to add (duplicates are ignored)
+            output_file: Path to output file, file-like object, or None (overwrites input if None and input is path)
             
-        finally:
-            # Cleanup temp input file if created
-            if db_is_temp and os.path.exists(db_path):
-                os.remove(db_path)
+        Returns:
+            Path to the modified file (if output is a path), or None (if output is file-like or input was file-like)
+        """
+        return self._modify_global_keys(db_file, "--addGlobalKey", keys, output_file)
     
     def remove_global_key(
         self, 
@@ -506,64 +1422,56 @@ class ValheimSaveTools:
         Returns:
             Path to the modified file (if output is a path), or None (if output is file-like or input was file-like)
         """
-        # Resolve input to file path
-        db_path, db_is_temp = self._resolve_input(db_file, suffix=".db")
+        return self.remove_global_keys(db_file, [key], output_file)
+    
+    def remove_global_keys(
+        self, 
+        db_file: Union[str, BinaryIO], 
+        keys: Iterable[str], 
+        output_file: Union[str, BinaryIO, None] = None
+    ) -> Optional[str]:
+        """
+        Remove several global keys from a world database file in a single pass.
         
-        try:
-            # Check file type if path was provided
-            if not self._is_file_like(db_file) and not self.is_db_file(db_path):
-                raise ValueError(f"Input file is not a valid .db file: {db_path}")
-            
-            # Determine output path
-            output_is_temp = False
-            if output_file is None:
-                if self._is_file_like(db_file):
-                    # For file-like input without output, create temp file
-                    tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
-                    output_path = tmp.name
-                    tmp.close()
-                    output_is_temp = True
-                else:
-                    # For path input without output, overwrite input
-                    output_path = db_path
-            elif self._is_file_like(output_file):
-                # Create temp file for file-like output
-                tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
-                output_path = tmp.name
-                tmp.close()
-                output_is_temp = True
-            else:
-                output_path = str(output_file)
-            
-            # Run command
-            flags = self._build_common_flags()
-            self.run_command(db_path, output_path, "--removeGlobalKey", key, *flags)
-            
-            # Handle output
-            result = None
-            if output_file is not None and self._is_file_like(output_file):
-                # Write to file-like object
-                with open(output_path, 'rb') as f:
-                    output_file.write(f.read())
-            elif self._is_file_like(db_file) and output_file is None:
-                # Write back to file-like input
-                with open(output_path, 'rb') as f:
-                    db_file.seek(0)
-                    db_file.write(f.read())
-                    db_file.truncate()
-            else:
-                result = output_path
-            
-            # Cleanup temp output file if created
-            if output_is_temp and os.path.exists(output_path):
-                os.remove(output_path)
+        Args:
+            db_file: Path to .db file or file-like object
+            keys: Global keys to remove (duplicates are ignored; 'all' removes all keys)
+            output_file: Path to output file, file-like object, or None (overwrites input if None and input is path)
             
-            return result
+        Returns:
+            Path to the modified file (if output is a path), or None (if output is file-like or input was file-like)
+        """
+        return self._modify_global_keys(db_file, "--removeGlobalKey", keys, output_file)
+    
+    def _modify_global_keys(
+        self, 
+        db_file: Union[str, BinaryIO], 
+        option: str, 
+        keys: Iterable[str], 
+        output_file: Union[str, BinaryIO, None] = None
+    ) -> Optional[str]:
+        """
+        Apply one global key option for each key in a single JAR invocation.
+        
+        Args:
+            db_file: Path to .db file or file-like object
+            option: '--addGlobalKey' or '--removeGlobalKey'
+            keys: Global keys to pass to the option
+            output_file: Path to output file, file-like object, or None (overwrites input if None and input is path)
             
-        finally:
-            # Cleanup temp input file if created
-            if db_is_temp and os.path.exists(db_path):
-                os.remove(db_path)
+        Returns:
+            Path to the modified file (if output is a path), or None (if output is file-like or input was file-like)
+        """
+        if isinstance(keys, str):
+            keys = [keys]
+        unique_keys = list(dict.fromkeys(keys))
+        if not unique_keys:
+            raise ValueError("At least one global key is required")
+        key_args = []
+        for key in unique_keys:
+            key_args += [option, key]
+        
+        return self._run_mutator(db_file, output_file, key_args)
     
     def clear_all_global_keys(
         self, 
@@ -588,7 +1496,8 @@ class ValheimSaveTools:
         self, 
         db_file: Union[str, BinaryIO], 
         output_file: Union[str, BinaryIO, None] = None,
-        threshold: int = 25
+        threshold: int = 25,
+        incremental: bool = False
     ) -> Optional[str]:
         """
         Clean up player-built structures smaller than threshold.
@@ -597,74 +1506,63 @@ class ValheimSaveTools:
             db_file: Path to .db file or file-like object
             output_file: Path to output file, file-like object, or None (overwrites input if None and input is path)
             threshold: Minimum structures to consider as a base (default 25)
+            incremental: Skip the run when this instance already cleaned the unchanged
+                         file in place at a threshold greater than or equal to this one,
+                         since such a pass cannot remove anything more
             
         Returns:
             Path to the modified file (if output is a path), or None (if output is file-like or input was file-like)
         """
-        # Resolve input to file path
-        db_path, db_is_temp = self._resolve_input(db_file, suffix=".db")
-        
-        try:
-            # Check file type if path was provided
-            if not self._is_file_like(db_file) and not self.is_db_file(db_path):
+        # Nothing left to remove if already cleaned at this threshold or higher
+        db_path = None if self._is_file_like(db_file) else str(db_file)
+        if (incremental and db_path is not None
+                and (output_file is None or str(output_file) == db_path)):
+            if not self.is_db_file(db_path):
                 raise ValueError(f"Input file is not a valid .db file: {db_path}")
+            state = self._file_state(db_path)
+            if state is not None:
+                with self._cache_lock:
+                    mark = self._clean_marks.get(state[0])
+                if mark is not None and mark[:2] == state[1:] and mark[2] >= threshold:
+                    return db_path
+        
+        return self._run_mutator(
+            db_file,
+            output_file,
+            ["--cleanStructures", "--cleanStructuresThreshold", str(threshold)],
+            clean_threshold=threshold
+        )
+    
+    def batch_clean(
+        self,
+        db_files: List[Union[str, Path]],
+        threshold: int = 25,
+        workers: Optional[int] = None
+    ) -> List[Optional[str]]:
+        """
+        Clean structures in several world files in parallel, overwriting each file.
+        
+        Each file is processed by its own JAR invocation; the Python threads only
+        wait on the child processes, so they run concurrently.
+        
+        Args:
+            db_files: Paths to .db files
+            threshold: Minimum structures to consider as a base (default 25)
+            workers: Maximum number of concurrent JAR processes (default: CPU count)
             
-            # Determine output path
-            output_is_temp = False
-            if output_file is None:
-                if self._is_file_like(db_file):
-                    # For file-like input without output, create temp file
-                    tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
-                    output_path = tmp.name
-                    tmp.close()
-                    output_is_temp = True
-                else:
-                    # For path input without output, overwrite input
-                    output_path = db_path
-            elif self._is_file_like(output_file):
-                # Create temp file for file-like output
-                tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
-                output_path = tmp.name
-                tmp.close()
-                output_is_temp = True
-            else:
-                output_path = str(output_file)
-            
-            # Run command
-            flags = self._build_common_flags()
-            self.run_command(
-                db_path, 
-                output_path, 
-                "--cleanStructures",
-                "--cleanStructuresThreshold", str(threshold),
-                *flags
-            )
-            
-            # Handle output
-            result = None
-            if output_file is not None and self._is_file_like(output_file):
-                # Write to file-like object
-                with open(output_path, 'rb') as f:
-                    output_file.write(f.read())
-            elif self._is_file_like(db_file) and output_file is None:
-                # Write back to file-like input
-                with open(output_path, 'rb') as f:
-                    db_file.seek(0)
-                    db_file.write(f.read())
-                    db_file.truncate()
-            else:
-                result = output_path
-            
-            # Cleanup temp output file if created
-            if output_is_temp and os.path.exists(output_path):
-                os.remove(output_path)
-            
-            return result
-            
-        finally:
-            # Cleanup temp input file if created
-            if db_is_temp and os.path.exists(db_path):
-                os.remove(db_path)
+        Returns:
+            Paths to the modified files, in the same order as db_files
+        """
+        paths = [str(db_file) for db_file in db_files]
+        for path in paths:
+            if not self.is_db_file(path):
+                raise ValueError(f"Input file is not a valid .db file: {path}")
+        
+        return self._map_concurrently(
+            lambda path: self.clean_structures(path, threshold=threshold),
+            paths,
+            workers=workers
+        )
     
     def reset_world(
         self, 
@@ -679,74 +1577,156 @@ class ValheimSaveTools:
         Args:
             db_file: Path to .db file or file-like object
             output_file: Path to output file, file-like object, or None (overwrites input if None and input is path)
-            clean_first: Run clean_structures before reset (recommended)
+            clean_first: Run clean_structures before reset (recommended). Both steps
+                         run in a single JAR invocation, so the file is read and
+                         written only once.
             clean_threshold: Threshold for clean_structures if clean_first=True
             
         Returns:
             Path to the modified file (if output is a path), or None (if output is file-like or input was file-like)
         """
-        # Resolve input to file path
-        db_path, db_is_temp = self._resolve_input(db_file, suffix=".db")
+        # The JAR always cleans structures before resetting, so clean_first
+        # is fused into the same invocation
+        clean_args = []
+        if clean_first:
+            clean_args = ["--cleanStructures", "--cleanStructuresThreshold", str(clean_threshold)]
+        return self._run_mutator(db_file, output_file, [*clean_args, "--resetWorld"])
+    
+    def clean_and_reset(
+        self,
+        db_file: Union[str, BinaryIO],
+        output_file: Union[str, BinaryIO, None] = None,
+        threshold: int = 25
+    ) -> Optional[str]:
+        """
+        Clean structures and reset the world in a single pass.
         
-        try:
-            # Check file type if path was provided
-            if not self._is_file_like(db_file) and not self.is_db_file(db_path):
-                raise ValueError(f"Input file is not a valid .db file: {db_path}")
-            
-            # If clean_first, run clean_structures as preprocessor
-            if clean_first:
-                db_path = self.clean_structures(db_path, db_path, clean_threshold)
-            
-            # Determine output path
-            output_is_temp = False
-            if output_file is None:
-                if self._is_file_like(db_file):
-                    # For file-like input without output, create temp file
-                    tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
-                    output_path = tmp.name
-                    tmp.close()
-                    output_is_temp = True
-                else:
-                    # For path input without output, overwrite input
-                    output_path = db_path
-            elif self._is_file_like(output_file):
-                # Create temp file for file-like output
-                tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
-                output_path = tmp.name
-                tmp.close()
-                output_is_temp = True
-            else:
-                output_path = str(output_file)
-            
-            # Run command
-            flags = self._build_common_flags()
-            self.run_command(db_path, output_path, "--resetWorld", *flags)
-            
-            # Handle output
-            result = None
-            if output_file is not None and self._is_file_like(output_file):
-                # Write to file-like object
-                with open(output_path, 'rb') as f:
-                    output_file.write(f.read())
-            elif self._is_file_like(db_file) and output_file is None:
-                # Write back to file-like input
-                with open(output_path, 'rb') as f:
-                    db_file.seek(0)
-                    db_file.write(f.read())
-                    db_file.truncate()
-            else:
-                result = output_path
-            
-            # Cleanup temp output file if created
-            if output_is_temp and os.path.exists(output_path):
-                os.remove(output_path)
+        Equivalent to calling clean_structures() followed by reset_world(), but
+        the save file is only read and written once.
+        
+        Args:
+            db_file: Path to .db file or file-like object
+            output_file: Path to output file, file-like object, or None (overwrites input if None and input is path)
+            threshold: Minimum structures to consider as a base (default 25)
             
-            return result
+        Returns:
+            Path to the modified file (if output is a path), or None (if output is file-like or input was file-like)
+        """
+        return self.reset_world(db_file, output_file, clean_first=True, clean_threshold=threshold)
+
+    def transform(
+        self,
+        src_db: Union[str, Path],
+        dst_db: Union[str, Path],
+        *,
+        clean: Optional[int] = None,
+        reset: bool = False,
+        add_keys: Iterable[str] = (),
+        remove_keys: Iterable[str] = ()
+    ) -> str:
+        """
+        Apply several world operations in a single JAR invocation, .db to .db.
+
+        The JAR removes keys, adds keys, cleans structures and resets the world
+        in that order, reading the source and writing the destination once.
+
+        Args:
+            src_db: Path to source .db file
+            dst_db: Path to write the result to (may equal src_db)
+            clean: Clean structures using this threshold (default: don't clean)
+            reset: Reset world zones without player structures
+            add_keys: Global keys to add
+            remove_keys: Global keys to remove ('all' removes all keys)
+
+        Returns:
+            Path to the written file
+        """
+        src_path = str(src_db)
+        dst_path = str(dst_db)
+        if not self.is_db_file(src_path):
+            raise ValueError(f"Input file is not a valid .db file: {src_path}")
+
+        if isinstance(add_keys, str):
+            add_keys = [add_keys]
+        if isinstance(remove_keys, str):
+            remove_keys = [remove_keys]
+
+        processor_args = []
+        for key in dict.fromkeys(remove_keys):
+            processor_args += ["--removeGlobalKey", key]
+        for key in dict.fromkeys(add_keys):
+            processor_args += ["--addGlobalKey", key]
+        if clean is not None:
+            processor_args += ["--cleanStructures", "--cleanStructuresThreshold", str(clean)]
+        if reset:
+            processor_args.append("--resetWorld")
+
+        self._run_processors(src_path, dst_path, processor_args)
+        if clean is not None and not reset:
+            self._mark_cleaned(dst_path, clean)
+        return dst_path
+
+    def _run_processors(
+        self,
+        db_path: str,
+        output_path: str,
+        processor_args: List[str],
+        invalidate: bool = True
+    ) -> None:
+        """
+        Run a single JAR invocation applying processor options to a save file.
+        
+        Inputs are not validated; callers check them once up front.
+        
+        Args:
+            db_path: Path to input .db file
+            output_path: Path to write the result to (may equal db_path)
+            processor_args: Processor options, e.g. from _plan_invocations()
+            invalidate: Drop cached results for output_path. Pass False for
+                        private working files, which are never cached.
+        """
+        flags = self._common_flags
+        self.run_command(db_path, output_path, *processor_args, *flags, capture=False)
+        if invalidate:
+            self._invalidate(output_path)
+    
+    def _run_processors_to_json(
+        self,
+        db_path: str,
+        output_file: Union[str, BinaryIO, None],
+        processor_args: List[str]
+    ) -> Dict:
+        """
+        Apply processor options and write the result as JSON in one JAR invocation.
+        
+        The JAR picks the output format from the output file extension, so the
+        processed world is never written back as a .db first.
+        
+        Args:
+            db_path: Path to input .db file (not modified)
+            output_file: Path to output JSON file, file-like object, or None
+            processor_args: Processor options, e.g. from _plan_invocations()
             
+        Returns:
+            Parsed JSON data as dictionary
+        """
+        tmp_output = None
+        if output_file is None or self._is_file_like(output_file):
+            tmp_output = self._temp_path(".json")
+            output_path = tmp_output
+        else:
+            output_path = str(output_file)
+        
+        try:
+            flags = self._common_flags
+            self.run_command(db_path, output_path, *processor_args, *flags, capture=False)
+            data = _read_json(output_path)
+            if tmp_output is not None:
+                self._write_output(output_path, output_file)
+            return data
         finally:
-            # Cleanup temp input file if created
-            if db_is_temp and os.path.exists(db_path):
-                os.remove(db_path)
+            if tmp_output is not None:
+                _safe_unlink(tmp_output)
     
     # File Type Detection Helpers
     
@@ -761,7 +1741,7 @@ class ValheimSaveTools:
         Returns:
             True if file has .db extension
         """
-        return Path(file_path).suffix.lower() == ".db"
+        return _file_type(file_path) == "db"
     
     @staticmethod
     def is_fwl_file(file_path: str) -> bool:
@@ -774,7 +1754,7 @@ class ValheimSaveTools:
         Returns:
             True if file has .fwl extension
         """
-        return Path(file_path).suffix.lower() == ".fwl"
+        return _file_type(file_path) == "fwl"
     
     @staticmethod
     def is_fch_file(file_path: str) -> bool:
@@ -787,7 +1767,7 @@ class ValheimSaveTools:
         Returns:
             True if file has .fch extension
         """
-        return Path(file_path).suffix.lower() == ".fch"
+        return _file_type(file_path) == "fch"
     
     @staticmethod
     def is_json_file(file_path: str) -> bool:
@@ -800,7 +1780,7 @@ class ValheimSaveTools:
         Returns:
             True if file has .json extension
         """
-        return Path(file_path).suffix.lower() == ".json"
+        return _file_type(file_path) == "json"
     
     @staticmethod
     def detect_file_type(file_path: str) -> Optional[str]:
@@ -813,14 +1793,7 @@ class ValheimSaveTools:
         Returns:
             File type: 'db', 'fwl', 'fch', 'json', or None if unknown
         """
-        suffix = Path(file_path).suffix.lower()
-        type_map = {
-            ".db": "db",
-            ".fwl": "fwl",
-            ".fch": "fch",
-            ".json": "json"
-        }
-        return type_map.get(suffix)
+        return _file_type(file_path)
     
     @staticmethod
     def is_valheim_file(file_path: str) -> bool:
@@ -833,7 +1806,7 @@ class ValheimSaveTools:
         Returns:
             True if file is .db, .fwl, .fch, or .json
         """
-        return ValheimSaveTools.detect_file_type(file_path) is not None
+        return _file_type(file_path) is not None
     
     def process(self, input_file: str) -> 'SaveFileProcessor':
         """
@@ -884,7 +1857,7 @@ class SaveFileProcessor:
         self._input_file = input_file
         self._current_file = input_file
         self._operations = []
-        self._temp_files = []
+        self._copies = 0  # Working copies made in the current temp directory
         self._temp_dir = None
         self._in_context = False
     
@@ -901,13 +1874,20 @@ class SaveFileProcessor:
         self._operations.append(('clean_structures', {'threshold': threshold}))
         return self
     
-    def reset_world(self) -> 'SaveFileProcessor':
+    def reset_world(self, clean_first: bool = False, clean_threshold: int = 25) -> 'SaveFileProcessor':
         """
         Queue world reset operation.
         
+        Args:
+            clean_first: Queue structure cleaning ahead of the reset. Both run
+                         in the same JAR invocation.
+            clean_threshold: Threshold for structure cleaning if clean_first=True
+            
         Returns:
             Self for chaining
         """
+        if clean_first:
+            self._operations.append(('clean_structures', {'threshold': clean_threshold}))
         self._operations.append(('reset_world', {}))
         return self
     
@@ -954,52 +1934,132 @@ class SaveFileProcessor:
         Returns:
             Path to the final processed file
         """
-        if not self._operations:
+        plan = _plan_invocations(self._operations)
+        if not plan:
             # No operations, just return input file
             return self._current_file
         
-        # Create temp directory for intermediate files
-        temp_dir = tempfile.mkdtemp(prefix="valheim_processor_")
-        self._temp_dir = temp_dir
-        
-        # Copy input file to temp directory as working copy
-        working_file = os.path.join(temp_dir, os.path.basename(self._input_file))
-        shutil.copy2(self._current_file, working_file)
-        self._temp_files.append(working_file)
-        
-        # Execute each operation in sequence
-        for operation, kwargs in self._operations:
-            if operation == 'clean_structures':
-                self._tools.clean_structures(working_file, **kwargs)
-            elif operation == 'reset_world':
-                self._tools.reset_world(working_file)
-            elif operation == 'add_global_key':
-                self._tools.add_global_key(working_file, **kwargs)
-            elif operation == 'remove_global_key':
-                self._tools.remove_global_key(working_file, **kwargs)
-            elif operation == 'clear_all_global_keys':
-                self._tools.clear_all_global_keys(working_file)
+        # The first invocation writes the working file, so the input is
+        # never staged with a separate copy
+        working_file = self._working_path()
+        self._run_operations(self._current_file, working_file, plan)
+        
+        return working_file
+    
+    def _make_working_copy(self, source: str) -> str:
+        """
+        Copy a file into the processor's temp directory.
         
+        Args:
+            source: Path to the file to copy
+            
+        Returns:
+            Path to the working copy
+        """
+        working_file = self._working_path()
+        _fast_copy2(source, working_file)
         return working_file
     
+    def _working_path(self) -> str:
+        """
+        Return a new path for a working file in the processor's temp directory.
+        
+        The directory is created on first use and shared by every working
+        file of this processor until _cleanup_temp_files() removes it. It is
+        a numbered subdirectory of the ValheimSaveTools working directory, so
+        successive processors reuse that directory instead of each making a
+        new one with mkdtemp.
+        
+        Returns:
+            Path that is not used by another working file
+        """
+        if self._temp_dir is None:
+            temp_dir = self._tools._temp_path()
+            os.mkdir(temp_dir)
+            self._temp_dir = temp_dir
+        
+        name = os.path.basename(self._input_file)
+        if self._copies:
+            # Keep copies made while another is in use distinct
+            name = f"{self._copies}_{name}"
+        self._copies += 1
+        return os.path.join(self._temp_dir, name)
+    
+    def _run_operations(self, source: str, target: str, plan: Optional[List[List[str]]] = None) -> None:
+        """
+        Apply all queued operations to source, writing the result to target.
+        
+        Operations are coalesced into as few JAR invocations as their order
+        allows (see _plan_invocations), so a typical chain such as
+        clean_structures().reset_world() reads and writes the file only once.
+        The first invocation reads source and writes target; later ones
+        update target in place. The JAR only reads and writes named files,
+        choosing formats by extension, so invocations cannot be piped into
+        each other; fusing them (see _plan_invocations) is what keeps the
+        number of intermediate writes down.
+        
+        Args:
+            source: Path to the file to read (not modified unless it is target)
+            target: Path to write the result to
+            plan: Invocations from _plan_invocations (default: planned here)
+        """
+        if plan is None:
+            plan = _plan_invocations(self._operations)
+        # Working files are never cached; the final save invalidates the result
+        invalidate = self._temp_dir is None or os.path.dirname(target) != self._temp_dir
+        for processor_args in plan:
+            self._tools._run_processors(source, target, processor_args, invalidate=invalidate)
+            source = target
+    
     def save(self, output_file: Optional[str] = None) -> str:
         """
         Execute all operations and save the result.
         
+        When output_file is a different file from the input, the JAR reads the
+        input and writes output_file directly, so no working copy is staged;
+        if a run fails, output_file may be left incomplete. Overwriting the
+        input always goes through a working copy, so a failed run leaves the
+        input untouched.
+        
         Args:
             output_file: Path to save result (default: overwrite input file)
             
         Returns:
             Path to the saved file
         """
+        plan = _plan_invocations(self._operations)
+        if plan and output_file is not None:
+            try:
+                same = os.path.samefile(output_file, self._input_file)
+            except OSError:
+                same = False  # output does not exist yet
+            if not same:
+                self._run_operations(self._current_file, output_file, plan)
+                # The JAR creates output_file with the default mode
+                shutil.copymode(self._input_file, output_file)
+                self._cleanup_temp_files()
+                return output_file
+        
         processed_file = self._execute_operations()
         
         # Determine output path
         final_output = output_file or self._input_file
         
-        # Copy processed file to final destination
+        # Move or copy processed file to final destination; the input itself
+        # is replaced atomically so a crash cannot leave it truncated
         if processed_file != final_output:
-            shutil.copy2(processed_file, final_output)
+            if processed_file != self._current_file:
+                # A working file of ours, created by the JAR with the default
+                # mode: rename it instead of copying, with the input's
+                # permission bits; the new content keeps its own
+                # mtime so mtime-keyed caches and backup tools see the change
+                shutil.copymode(self._input_file, processed_file)
+                _atomic_move(processed_file, final_output)
+            elif final_output == self._input_file:
+                _atomic_copy(processed_file, final_output)
+            else:
+                _fast_copy2(processed_file, final_output)
+            self._tools._invalidate(final_output)
         
         # Cleanup temp files
         self._cleanup_temp_files()
@@ -1010,26 +2070,47 @@ class SaveFileProcessor:
         """
         Execute all operations and convert result to JSON.
         
+        The last group of operations and the conversion share one JAR
+        invocation, so a typical chain runs the JAR once and never writes an
+        intermediate .db file.
+        
         Args:
             output_file: Path to save JSON result
             
         Returns:
             Parsed JSON data as a dictionary. If output_file is provided, also saves to that file.
         """
-        processed_file = self._execute_operations()
-        
-        # Convert to JSON
-        json_data = self._tools.to_json(processed_file, output_file)
-        
-        # Cleanup temp files
-        self._cleanup_temp_files()
+        plan = _plan_invocations(self._operations)
+        if not plan:
+            return self._tools.to_json(self._current_file, output_file)
         
-        return json_data
+        try:
+            source = self._current_file
+            if len(plan) > 1:
+                # Earlier groups must be applied first; the first of them
+                # writes the working file, so the input is not copied
+                source = self._working_path()
+                self._run_operations(self._current_file, source, plan[:-1])
+            
+            return self._tools._run_processors_to_json(source, output_file, plan[-1])
+        finally:
+            # Cleanup temp files
+            self._cleanup_temp_files()
     
     def __repr__(self) -> str:
-        """String representation of processor."""
-        ops = [f"{op}({kwargs})" for op, kwargs in self._operations]
-        return f"SaveFileProcessor(file={self._input_file}, operations={ops})"
+        """String representation of processor (see describe() for the queued operations)."""
+        return f"<SaveFileProcessor {self._input_file!r} ops={len(self._operations)}>"
+    
+    def describe(self) -> str:
+        """
+        Describe the queued operations, one per line.
+        
+        Returns:
+            Multi-line string listing each operation and its arguments
+        """
+        lines = [f"SaveFileProcessor({self._input_file!r})"]
+        lines.extend(f"  {op}({kwargs})" for op, kwargs in self._operations)
+        return "\n".join(lines)
     
     def __enter__(self) -> 'SaveFileProcessor':
         """
@@ -1048,14 +2129,8 @@ class SaveFileProcessor:
         """
         self._in_context = True
         
-        # Create temp directory for working files
-        self._temp_dir = tempfile.mkdtemp(prefix="valheim_processor_")
-        
-        # Copy input file to temp directory as working copy
-        working_file = os.path.join(self._temp_dir, os.path.basename(self._input_file))
-        shutil.copy2(self._input_file, working_file)
-        self._current_file = working_file
-        self._temp_files.append(working_file)
+        # Work on a copy in the processor's temp directory
+        self._current_file = self._make_working_copy(self._input_file)
         
         return self
     
@@ -1078,20 +2153,13 @@ class SaveFileProcessor:
             # If no exception and operations were queued, execute them
             if exc_type is None and self._operations:
                 # Execute operations on the working file
-                for operation, kwargs in self._operations:
-                    if operation == 'clean_structures':
-                        self._tools.clean_structures(self._current_file, **kwargs)
-                    elif operation == 'reset_world':
-                        self._tools.reset_world(self._current_file)
-                    elif operation == 'add_global_key':
-                        self._tools.add_global_key(self._current_file, **kwargs)
-                    elif operation == 'remove_global_key':
-                        self._tools.remove_global_key(self._current_file, **kwargs)
-                    elif operation == 'clear_all_global_keys':
-                        self._tools.clear_all_global_keys(self._current_file)
+                self._run_operations(self._current_file, self._current_file)
                 
-                # Copy result back to original file
-                shutil.copy2(self._current_file, self._input_file)
+                # Replace the original file atomically with the result,
+                # keeping its permission bits but not its old timestamps
+                shutil.copymode(self._input_file, self._current_file)
+                _atomic_move(self._current_file, self._input_file)
+                self._tools._invalidate(self._input_file)
         finally:
             # Always cleanup temp files
             self._cleanup_temp_files()
@@ -1101,18 +2169,13 @@ class SaveFileProcessor:
         return False
     
     def _cleanup_temp_files(self):
-        """Clean up temporary files and directory."""
-        for temp_file in self._temp_files:
-            try:
-                if os.path.exists(temp_file):
-                    os.remove(temp_file)
-            except (OSError, PermissionError):
-                pass  # Best effort cleanup
+        """
+        Remove the temp directory and every working copy in it (best effort).
         
-        # Try to remove temp directory
-        if self._temp_dir and os.path.exists(self._temp_dir):
-            try:
-                if not os.listdir(self._temp_dir):
-                    os.rmdir(self._temp_dir)
-            except (OSError, PermissionError):
-                pass  # Best effort cleanup
+        The removal runs in a background thread so callers of save(),
+        to_json() and the context manager do not wait for it.
+        """
+        if self._temp_dir is not None:
+            _remove_tree_later(self._temp_dir)
+        self._temp_dir = None
+        self._copies = 0
@@ -8,6 +8,7 @@ import subprocess
 import json
 
 from valheim_save_tools_py import ValheimSaveTools
+from valheim_save_tools_py.wrapper import _which_java
 
 
 @pytest.fixture
@@ -20,12 +21,15 @@ def mock_setup():
         mock_exists.return_value = True
         mock_which.return_value = "/usr/bin/java"
         mock_glob.return_value = []
+        # Java lookups are cached per process; don't share them across mocks
+        _which_java.cache_clear()
         
         yield {
             'which': mock_which,
             'exists': mock_exists,
             'glob': mock_glob
         }
+        _which_java.cache_clear()
 
 
 @pytest.fixture
@@ -111,6 +115,103 @@ class TestResolveInput:
             os.remove(path2)
 
 
+    def test_resolve_input_bytesio_from_position(self, vst):
+        """Test a BytesIO is written from its current position and stays usable."""
+        import os
+        bio = BytesIO(b"headerpayload")
+        bio.seek(6)
+        
+        path, is_temp = vst._resolve_input(bio, suffix=".db")
+        
+        with open(path, 'rb') as f:
+            assert f.read() == b"payload"
+        assert bio.tell() == 6
+        # Buffer export must be released so the BytesIO can still grow
+        bio.seek(0, 2)
+        bio.write(b"more")
+        os.remove(path)
+    
+    def test_resolve_input_with_open_file(self, vst, tmp_path):
+        """Test resolving an open binary file streams its content."""
+        import os
+        src = tmp_path / "world.db"
+        src.write_bytes(b"\x00\x01" * 100000)
+        
+        with open(src, "rb") as f:
+            path, is_temp = vst._resolve_input(f, suffix=".fwl")
+            assert f.tell() == 0
+        
+        assert is_temp is True
+        assert path.endswith(".db")
+        with open(path, 'rb') as f:
+            assert f.read() == src.read_bytes()
+        os.remove(path)
+    
+    def test_resolve_input_open_file_from_position(self, vst, tmp_path):
+        """Test an open file is copied from its logical position, despite read-ahead."""
+        import os
+        src = tmp_path / "world.db"
+        src.write_bytes(b"header" + b"\x07" * 100000)
+        
+        with open(src, "rb") as f:
+            f.read(6)
+            path, is_temp = vst._resolve_input(f, suffix=".db")
+            assert f.tell() == 6
+        
+        with open(path, 'rb') as f:
+            assert f.read() == b"\x07" * 100000
+        os.remove(path)
+    
+    def test_resolve_input_open_file_without_copy_file_range(self, vst, tmp_path):
+        """Test open files fall back to a streamed copy when the kernel copy fails."""
+        import os
+        src = tmp_path / "world.db"
+        src.write_bytes(b"payload")
+        
+        with patch('valheim_save_tools_py.wrapper.os.copy_file_range',
+                   side_effect=OSError(18, "Invalid cross-device link"), create=True):
+            with open(src, "rb") as f:
+                path, is_temp = vst._resolve_input(f, suffix=".db")
+        
+        with open(path, 'rb') as f:
+            assert f.read() == b"payload"
+        os.remove(path)
+
+
+    def test_resolve_input_direct_open_file(self, vst, tmp_path):
+        """Test unread read-only save files are used through their own path."""
+        src = tmp_path / "world.db"
+        src.write_bytes(b"payload")
+        
+        with open(src, "rb") as f:
+            assert vst._resolve_input(f, suffix=".db", direct=True) == (str(src), False)
+            f.read(3)
+            path, is_temp = vst._resolve_input(f, suffix=".db", direct=True)
+            assert is_temp and path != str(src)
+        
+        with open(src, "r+b") as f:
+            path, is_temp = vst._resolve_input(f, suffix=".db", direct=True)
+            assert is_temp
+        
+        with open(src, "rb") as f:
+            path, is_temp = vst._resolve_input(f, suffix=".db")
+            assert is_temp
+    
+    def test_resolve_input_direct_needs_matching_file(self, vst, tmp_path):
+        """Test a renamed or replaced path falls back to a temp copy."""
+        src = tmp_path / "world.db"
+        src.write_bytes(b"old")
+        
+        with open(src, "rb") as f:
+            src.unlink()
+            src.write_bytes(b"new")
+            path, is_temp = vst._resolve_input(f, suffix=".db", direct=True)
+        
+        assert is_temp
+        with open(path, "rb") as copy:
+            assert copy.read() == b"old"
+
+
 class TestToJsonWithFilelike:
     """Test to_json with file-like objects."""
     
@@ -345,6 +446,61 @@ class TestGlobalKeysWithFilelike:
         bio.seek(0)
         assert bio.read() == b"modified db content"
     
+    @patch('valheim_save_tools_py.wrapper.ValheimSaveTools.run_command')
+    def test_add_global_key_bytesio_inplace_shrinks(self, mock_run, vst):
+        """Test in-place write-back drops the tail of a longer original."""
+        bio = BytesIO(b"x" * 600000)
+        
+        def create_smaller_output(*args, **kwargs):
+            with open(args[1], 'wb') as f:
+                f.write(b"y" * 300000)
+            return MagicMock(returncode=0, stdout="", stderr="")
+        
+        mock_run.side_effect = create_smaller_output
+        
+        vst.add_global_key(bio, "defeated_eikthyr")
+        
+        assert bio.getvalue() == b"y" * 300000
+    
+    @patch('valheim_save_tools_py.wrapper.ValheimSaveTools.run_command')
+    def test_add_global_key_open_file_inplace(self, mock_run, vst, tmp_path):
+        """Test in-place write-back into a real file handle via sendfile."""
+        src = tmp_path / "world.db"
+        src.write_bytes(b"x" * 600000)
+        
+        def create_smaller_output(*args, **kwargs):
+            with open(args[1], 'wb') as f:
+                f.write(b"y" * 300000)
+            return MagicMock(returncode=0, stdout="", stderr="")
+        
+        mock_run.side_effect = create_smaller_output
+        
+        with open(src, "r+b") as f:
+            vst.add_global_key(f, "defeated_eikthyr")
+            assert f.tell() == 300000
+        
+        assert src.read_bytes() == b"y" * 300000
+    
+    @patch('valheim_save_tools_py.wrapper.ValheimSaveTools.run_command')
+    def test_add_global_key_open_file_without_sendfile(self, mock_run, vst, tmp_path):
+        """Test write-back falls back to a streamed copy when sendfile fails."""
+        src = tmp_path / "world.db"
+        src.write_bytes(b"original content")
+        
+        def create_output(*args, **kwargs):
+            with open(args[1], 'wb') as f:
+                f.write(b"modified")
+            return MagicMock(returncode=0, stdout="", stderr="")
+        
+        mock_run.side_effect = create_output
+        
+        with patch('valheim_save_tools_py.wrapper.os.sendfile',
+                   side_effect=OSError(22, "Invalid argument"), create=True):
+            with open(src, "r+b") as f:
+                vst.add_global_key(f, "defeated_eikthyr")
+        
+        assert src.read_bytes() == b"modified"
+    
     @patch('valheim_save_tools_py.wrapper.ValheimSaveTools.run_command')
     def test_add_global_key_bytesio_output(self, mock_run, vst, tmp_path):
         """Test add_global_key with BytesIO output."""
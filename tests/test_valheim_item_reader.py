@@ -4,7 +4,8 @@ import pytest
 import base64
 import struct
 
-from valheim_save_tools_py.valheimItemReader import ValheimItemReader, parse_items_from_base64
+from valheim_save_tools_py.valheimItemReader import ValheimItemReader, parse_items_from_base64, parse_many
+from valheim_save_tools_py import valheimItemReader
 
 
 class TestValheimItemReader:
@@ -57,6 +58,53 @@ class TestValheimItemReader:
         assert abs(result - value) < 0.0001  # Float comparison with tolerance
         assert reader.offset == 4
     
+    def test_read_mixed_fields_at_offset(self):
+        """Test scalar reads decode from the current offset."""
+        data = bytes([7]) + struct.pack('<iqf', -5, 2**40, 0.5)
+        reader = ValheimItemReader(data)
+        
+        assert reader.read_byte() == 7
+        assert reader.read_int32() == -5
+        assert reader.read_int64() == 2**40
+        assert reader.read_float() == 0.5
+        assert reader.offset == len(data)
+    
+    def test_read_from_memoryview(self):
+        """Test the reader accepts a memoryview and returns plain values."""
+        data = memoryview(bytes([5]) + "Trøll".encode('utf-8')[:5] + struct.pack('<i', 9))
+        reader = ValheimItemReader(data)
+        
+        name = reader.read_string()
+        assert isinstance(name, str)
+        assert name == "Trøl"
+        assert reader.read_int32() == 9
+    
+    def test_read_int32_truncated(self):
+        """Test reading past the end raises struct.error."""
+        reader = ValheimItemReader(b"\x01\x02")
+        
+        with pytest.raises(struct.error):
+            reader.read_int32()
+    
+    def test_from_bytes_readers_match_struct(self):
+        """Test the PyPy int.from_bytes readers agree with the struct readers."""
+        data = struct.pack('<iq', -9876, -(2 ** 40)) + b"\x01"
+        reader = ValheimItemReader(data)
+        
+        assert valheimItemReader._read_int32_from_bytes(reader) == -9876
+        assert valheimItemReader._read_int64_from_bytes(reader) == -(2 ** 40)
+        assert reader.offset == 12
+        with pytest.raises(struct.error):
+            valheimItemReader._read_int32_from_bytes(reader)
+    
+    def test_reader_has_no_instance_dict(self):
+        """Test the reader stores its state in slots."""
+        reader = ValheimItemReader(b"")
+        
+        assert not hasattr(reader, '__dict__')
+        with pytest.raises(AttributeError):
+            reader.extra = 1
+    
     def test_read_bool_true(self):
         """Test reading a boolean (true)."""
         data = bytes([1, 0, 255])
@@ -158,6 +206,57 @@ class TestValheimItemReader:
         assert item['variant'] == 0
         assert item['crafter_id'] == 123456789
         assert item['crafter_name'] == "Player1"
+    
+    def test_read_item_unknown_trailer(self):
+        """Test the unknown trailer bytes are exposed for the last item read."""
+        item_data = (bytes([1]) + b"A" + struct.pack('<ifii?iiq', 1, 1.0, 0, 0, False, 1, 0, 0)
+                     + bytes([0]) + bytes(range(1, 9)) + bytes([9]))
+        reader = ValheimItemReader(item_data)
+        assert reader.unknown_data is None
+        
+        reader.read_item()
+        
+        assert reader.unknown_data == bytes(range(1, 9))
+        assert reader.unknown_byte == 9
+    
+    def test_read_item_truncated_keeps_offset(self):
+        """Test a truncated item raises without moving the reader."""
+        item_data = bytes([1]) + b"A" + struct.pack('<ifii?iiq', 1, 1.0, 0, 0, False, 1, 0, 0) + bytes([0, 0])
+        reader = ValheimItemReader(item_data)
+        
+        with pytest.raises(IndexError):
+            reader.read_item()
+        assert reader.offset == 0
+        assert reader.unknown_data is None
+    
+    def test_read_item_matches_field_readers(self):
+        """Test the fixed-layout decode agrees with reading field by field."""
+        item_data = (bytes([3]) + b"Axe"
+                     + struct.pack('<ifii', -2, 0.25, 7, -1)
+                     + bytes([2])  # any non-zero byte is True
+                     + struct.pack('<iiq', 4, 1, -(2**40))
+                     + bytes([0])
+                     + bytes(9))
+        data = item_data * 2
+        
+        reader = ValheimItemReader(data)
+        items = [reader.read_item(), reader.read_item()]
+        assert reader.offset == len(data)
+        
+        manual = ValheimItemReader(data)
+        expected = {
+            'name': manual.read_string(),
+            'stack': manual.read_int32(),
+            'durability': manual.read_float(),
+            'pos_x': manual.read_int32(),
+            'pos_y': manual.read_int32(),
+            'equipped': manual.read_bool(),
+            'quality': manual.read_int32(),
+            'variant': manual.read_int32(),
+            'crafter_id': manual.read_int64(),
+            'crafter_name': manual.read_string(),
+        }
+        assert items == [expected, expected]
 
 
 class TestParseItemsFromBase64:
@@ -392,6 +491,65 @@ class TestParseItemsFromBase64:
         assert len(items) == 1
         assert items[0]['name'] == "Torch"
     
+    def test_parse_as_arrays(self):
+        """Test parsing items into per-field columns."""
+        data = bytearray()
+        data.extend(struct.pack('<i', 1))
+        data.extend(struct.pack('<i', 2))
+        data.extend(self.create_item_binary(name="Wood", stack=50))
+        data.extend(self.create_item_binary(
+            name="AxeBronze",
+            durability=42.0,
+            equipped=True,
+            quality=3,
+            crafter_id=555,
+            crafter_name="Smith"
+        ))
+        
+        b64_string = base64.b64encode(bytes(data)).decode('utf-8')
+        columns = parse_items_from_base64(b64_string, as_arrays=True)
+        
+        assert columns['name'] == ["Wood", "AxeBronze"]
+        assert list(columns['stack']) == [50, 1]
+        assert list(columns['durability']) == [100.0, 42.0]
+        assert list(columns['equipped']) == [0, 1]
+        assert list(columns['quality']) == [1, 3]
+        assert list(columns['crafter_id']) == [0, 555]
+        assert columns['crafter_name'] == ["", "Smith"]
+    
+    def test_parse_items_share_key_objects(self):
+        """Test every item dict reuses the same key strings."""
+        data = bytearray()
+        data.extend(struct.pack('<i', 1))
+        data.extend(struct.pack('<i', 2))
+        data.extend(self.create_item_binary(name="Wood"))
+        data.extend(self.create_item_binary(name="Stone"))
+
+        b64_string = base64.b64encode(bytes(data)).decode('utf-8')
+        first, second = parse_items_from_base64(b64_string)
+
+        assert all(a is b for a, b in zip(first, second))
+
+    def test_parse_as_arrays_truncated(self):
+        """Test truncated data yields empty columns."""
+        data = struct.pack('<i', 1) + struct.pack('<i', 1)
+        
+        b64_string = base64.b64encode(data).decode('utf-8')
+        columns = parse_items_from_base64(b64_string, as_arrays=True)
+        
+        assert all(len(column) == 0 for column in columns.values())
+    
+    def test_parse_uses_module_decoder(self):
+        """Test decoding goes through the selected base64 implementation."""
+        from unittest.mock import patch
+        from valheim_save_tools_py import valheimItemReader
+        
+        raw = struct.pack('<i', 1) + struct.pack('<i', 0)
+        with patch.object(valheimItemReader, '_b64decode', return_value=raw) as mock_decode:
+            assert parse_items_from_base64("ignored") == []
+        
+        mock_decode.assert_called_once_with("ignored")
+    
     def test_parse_invalid_base64(self):
         """Test parsing with invalid base64 string."""
         with pytest.raises(Exception):
@@ -414,6 +572,30 @@ class TestParseItemsFromBase64:
         
         # Should return empty list due to error handling
         assert items == []
+    
+    def test_parse_corrupt_item_count(self):
+        """Test an impossible item count keeps the items that are present."""
+        data = struct.pack('<ii', 1, 2**31 - 1) + self.create_item_binary("Wood", stack=50)
+        
+        b64_string = base64.b64encode(data).decode('utf-8')
+        items = parse_items_from_base64(b64_string)
+        
+        assert len(items) == 1
+        assert items[0]['name'] == "Wood"
+        assert items[0]['stack'] == 50
+    
+    def test_parse_many(self):
+        """Test parse_many parses each inventory in order, in or out of process."""
+        inventories = [
+            base64.b64encode(struct.pack('<ii', 1, 1) + self.create_item_binary(name)).decode('utf-8')
+            for name in ("Wood", "Stone", "Flint")
+        ]
+        
+        for workers in (1, 2):
+            results = parse_many(inventories, workers=workers)
+            assert [items[0]['name'] for items in results] == ["Wood", "Stone", "Flint"]
+        
+        assert parse_many([]) == []
 
 
 if __name__ == '__main__':
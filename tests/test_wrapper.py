@@ -4,8 +4,12 @@ import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock, call
 import subprocess
+import json
+import os
+import shutil
 
 from valheim_save_tools_py import ValheimSaveTools
+from valheim_save_tools_py.wrapper import _which_java, _flush_cleanup, _safe_unlink
 from valheim_save_tools_py.exceptions import (
     JarNotFoundError,
     JavaNotFoundError,
@@ -16,19 +20,24 @@ from valheim_save_tools_py.exceptions import (
 @pytest.fixture
 def mock_setup():
     """Setup common mocks for tests."""
+    # Tests mock json.load, so pin the stdlib decoder even if orjson is installed
     with patch('valheim_save_tools_py.wrapper.shutil.which') as mock_which, \
          patch('valheim_save_tools_py.wrapper.Path.exists') as mock_exists, \
-         patch('valheim_save_tools_py.wrapper.Path.glob') as mock_glob:
+         patch('valheim_save_tools_py.wrapper.Path.glob') as mock_glob, \
+         patch('valheim_save_tools_py.wrapper.orjson', None):
         
         mock_exists.return_value = True
         mock_which.return_value = "/usr/bin/java"
         mock_glob.return_value = []
+        # Java lookups are cached per process; don't share them across mocks
+        _which_java.cache_clear()
         
         yield {
             'which': mock_which,
             'exists': mock_exists,
             'glob': mock_glob
         }
+        _which_java.cache_clear()
 
 
 @pytest.fixture
@@ -61,6 +70,39 @@ class TestInitialization:
         assert vst.fail_on_unsupported_version is True
         assert vst.skip_resolve_names is True
     
+    @patch('valheim_save_tools_py.wrapper.subprocess.run')
+    def test_jvm_options_before_jar(self, mock_run, mock_setup):
+        """Test JVM options are passed to java ahead of -jar."""
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout="", stderr=""
+        )
+        vst = ValheimSaveTools(
+            jar_path="/path/to/tool.jar",
+            jvm_options=["-XX:TieredStopAtLevel=1", "-Xshare:auto"]
+        )
+        
+        vst.run_command("world.db", "--listGlobalKeys")
+        
+        cmd = mock_run.call_args[0][0]
+        assert cmd == [
+            "/usr/bin/java", "-XX:TieredStopAtLevel=1", "-Xshare:auto",
+            "-jar", "/path/to/tool.jar", "world.db", "--listGlobalKeys"
+        ]
+        # Each call gets a fresh list; the shared prefix is untouched
+        cmd.append("--extra")
+        assert vst._cmd_prefix[-1] == "/path/to/tool.jar"
+    
+    def test_fast_startup_options(self, mock_setup):
+        """Test fast_startup prepends the startup flags to user JVM options."""
+        vst = ValheimSaveTools(
+            jar_path="/path/to/tool.jar",
+            jvm_options=["-Xmx2g"],
+            fast_startup=True
+        )
+        
+        assert vst.jvm_options == [*ValheimSaveTools.FAST_STARTUP_JVM_OPTIONS, "-Xmx2g"]
+        assert vst._cmd_prefix[-3:] == ("-Xmx2g", "-jar", "/path/to/tool.jar")
+    
     @patch('valheim_save_tools_py.wrapper.Path')
     def test_jar_not_found(self, mock_path, mock_setup):
         """Test initialization fails when JAR not found."""
@@ -72,6 +114,63 @@ class TestInitialization:
         with pytest.raises(JarNotFoundError):
             ValheimSaveTools(jar_path="/nonexistent/tool.jar")
     
+    def test_bundled_jar_search_cached(self, tmp_path):
+        """Test the package directory is searched once per process."""
+        from valheim_save_tools_py.wrapper import _find_bundled_jar
+        
+        (tmp_path / "lib").mkdir()
+        jar = tmp_path / "lib" / "tool.jar"
+        jar.write_bytes(b"")
+        _find_bundled_jar.cache_clear()
+        try:
+            assert _find_bundled_jar(str(tmp_path)) == jar
+            jar.unlink()
+            assert _find_bundled_jar(str(tmp_path)) == jar
+            assert _find_bundled_jar.cache_info().hits == 1
+        finally:
+            _find_bundled_jar.cache_clear()
+    
+    def test_bundled_jar_prefers_top_level(self, tmp_path):
+        """Test a JAR next to the package wins over one in a subdirectory."""
+        from valheim_save_tools_py.wrapper import _find_bundled_jar
+        
+        (tmp_path / "a" / "b").mkdir(parents=True)
+        (tmp_path / "a" / "b" / "nested.jar").write_bytes(b"")
+        (tmp_path / "top.jar").write_bytes(b"")
+        _find_bundled_jar.cache_clear()
+        try:
+            assert _find_bundled_jar(str(tmp_path)) == tmp_path / "top.jar"
+            _find_bundled_jar.cache_clear()
+            (tmp_path / "top.jar").unlink()
+            (tmp_path / "a" / "sub.jar").write_bytes(b"")
+            assert _find_bundled_jar(str(tmp_path)) == tmp_path / "a" / "sub.jar"
+        finally:
+            _find_bundled_jar.cache_clear()
+    
+    def test_bundled_jar_search_depth_bounded(self, tmp_path):
+        """Test JARs more than one directory below the package are ignored."""
+        from valheim_save_tools_py.wrapper import _find_bundled_jar
+        
+        (tmp_path / "a" / "b").mkdir(parents=True)
+        (tmp_path / "a" / "b" / "nested.jar").write_bytes(b"")
+        _find_bundled_jar.cache_clear()
+        try:
+            assert _find_bundled_jar(str(tmp_path)) is None
+        finally:
+            _find_bundled_jar.cache_clear()
+    
+    def test_java_lookup_cached(self, mock_setup):
+        """Test Java is looked up once per PATH, not once per instance."""
+        ValheimSaveTools(jar_path="/path/to/tool.jar")
+        vst = ValheimSaveTools(jar_path="/path/to/tool.jar")
+        
+        assert vst.java_path == "/usr/bin/java"
+        assert mock_setup['which'].call_count == 1
+        
+        with patch.dict(os.environ, {"PATH": "/opt/jdk/bin"}):
+            ValheimSaveTools(jar_path="/path/to/tool.jar")
+        assert mock_setup['which'].call_count == 2
+    
     def test_java_not_found(self, mock_setup):
         """Test initialization fails when Java not found."""
         mock_setup['which'].return_value = None
@@ -79,13 +178,33 @@ class TestInitialization:
             ValheimSaveTools(jar_path="/path/to/tool.jar")
 
 
+class TestPackageExports:
+    """Test lazily resolved package attributes."""
+    
+    def test_lazy_exports(self):
+        """Test public names resolve to the submodule objects."""
+        import valheim_save_tools_py as pkg
+        from valheim_save_tools_py.valheimItemReader import ValheimItemReader
+        
+        assert pkg.ValheimSaveTools is ValheimSaveTools
+        assert pkg.ValheimItemReader is ValheimItemReader
+        assert set(pkg.__all__) <= set(dir(pkg))
+    
+    def test_unknown_attribute(self):
+        """Test unknown attributes still raise AttributeError."""
+        import valheim_save_tools_py as pkg
+        
+        with pytest.raises(AttributeError):
+            pkg.does_not_exist
+
+
 class TestCommonFlags:
     """Test common flags building."""
     
     def test_build_common_flags_none(self, vst):
         """Test no flags when all disabled."""
         flags = vst._build_common_flags()
-        assert flags == []
+        assert flags == ()
     
     def test_build_common_flags_verbose(self, mock_setup):
         """Test verbose flag."""
@@ -105,6 +224,26 @@ class TestCommonFlags:
         assert "-v" in flags
         assert "--failOnUnsupportedVersion" in flags
         assert "--skipResolveNames" in flags
+    
+    def test_build_common_flags_follows_settings(self, vst):
+        """Test flags are reused until a setting changes."""
+        assert vst._build_common_flags() is vst._build_common_flags()
+        
+        vst.verbose = True
+        assert vst._build_common_flags() == ("-v",)
+    
+    @patch('valheim_save_tools_py.wrapper.subprocess.run')
+    def test_changed_setting_reaches_commands(self, mock_run, vst):
+        """Test commands pick up a setting changed after construction."""
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout=None, stderr=""
+        )
+        
+        vst.skip_resolve_names = True
+        vst.from_json("world.json")
+        
+        assert vst.skip_resolve_names is True
+        assert mock_run.call_args[0][0][-1] == "--skipResolveNames"
 
 
 class TestAutoOutputPath:
@@ -124,13 +263,19 @@ class TestAutoOutputPath:
         """Test auto-generating with full path."""
         output = vst._auto_output_path("/path/to/world.db", ".json")
         assert output == "/path/to/world.json"
+    
+    def test_auto_output_only_swaps_extension(self, vst):
+        """Test dots in directories and names before the extension are kept."""
+        assert vst._auto_output_path("/saves.v2/world.json", ".db") == "/saves.v2/world.db"
+        assert vst._auto_output_path("saves/world", ".db") == "saves/world.db"
+        assert vst._auto_output_path("world.backup.json", ".db") == "world.backup.db"
 
 
 class TestFileConversion:
     """Test file conversion methods."""
     
     @patch('builtins.open', create=True)
-    @patch('valheim_save_tools_py.wrapper.tempfile.NamedTemporaryFile')
+    @patch('valheim_save_tools_py.wrapper.ValheimSaveTools._temp_path')
     @patch('valheim_save_tools_py.wrapper.os.path.exists')
     @patch('valheim_save_tools_py.wrapper.os.remove')
     @patch('valheim_save_tools_py.wrapper.subprocess.run')
@@ -142,9 +287,7 @@ class TestFileConversion:
         )
         
         # Mock temporary file
-        mock_tmp = Mock()
-        mock_tmp.name = "/tmp/tmpfile.json"
-        mock_temp.return_value = mock_tmp
+        mock_temp.return_value = "/tmp/tmpfile.json"
         mock_exists.return_value = True
         
         # Mock JSON data to be returned
@@ -164,7 +307,184 @@ class TestFileConversion:
         assert "world.db" in args
         
         # Verify temp file was removed
-        mock_remove.assert_called()
+        mock_remove.assert_called_with("/tmp/tmpfile.json")
+    
+    def test_fast_copy(self, tmp_path):
+        """Test _fast_copy copies with and without copy_file_range."""
+        from valheim_save_tools_py.wrapper import _fast_copy
+        
+        src = tmp_path / "src.json"
+        src.write_bytes(b"{}" * 1000)
+        _fast_copy(str(src), str(tmp_path / "a.json"))
+        with patch('valheim_save_tools_py.wrapper.os.copy_file_range',
+                   side_effect=OSError(38, "Function not implemented"), create=True):
+            _fast_copy(str(src), str(tmp_path / "b.json"))
+        
+        assert (tmp_path / "a.json").read_bytes() == src.read_bytes()
+        assert (tmp_path / "b.json").read_bytes() == src.read_bytes()
+        with pytest.raises(shutil.SameFileError):
+            _fast_copy(str(src), str(src))
+        assert src.read_bytes() == b"{}" * 1000
+    
+    def test_atomic_copy(self, tmp_path):
+        """Test _atomic_copy replaces the target and leaves it intact on failure."""
+        from valheim_save_tools_py.wrapper import _atomic_copy
+        src = tmp_path / "work.db"
+        src.write_bytes(b"processed")
+        dst = tmp_path / "world.db"
+        dst.write_bytes(b"original")
+        
+        with patch('valheim_save_tools_py.wrapper.os.replace', side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                _atomic_copy(str(src), str(dst))
+        assert dst.read_bytes() == b"original"
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["work.db", "world.db"]
+        
+        _atomic_copy(str(src), str(dst))
+        assert dst.read_bytes() == b"processed"
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["work.db", "world.db"]
+    
+    def test_atomic_publish_follows_symlink(self, tmp_path):
+        """Test _atomic_copy and _atomic_move update a symlink's target and keep the link."""
+        from valheim_save_tools_py.wrapper import _atomic_copy, _atomic_move
+        target = tmp_path / "w.db"
+        target.write_bytes(b"original")
+        link = tmp_path / "link.db"
+        link.symlink_to(target)
+        src = tmp_path / "work.db"
+        src.write_bytes(b"copied")
+        
+        _atomic_copy(str(src), str(link))
+        assert link.is_symlink()
+        assert target.read_bytes() == b"copied"
+        
+        src.write_bytes(b"moved")
+        _atomic_move(str(src), str(link))
+        assert link.is_symlink()
+        assert target.read_bytes() == b"moved"
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["link.db", "w.db"]
+    
+    def test_atomic_copy_unique_staging_files(self, tmp_path):
+        """Test each _atomic_copy stages through its own temp file next to the target."""
+        from valheim_save_tools_py.wrapper import _atomic_copy, _fast_copy2
+        src = tmp_path / "work.db"
+        src.write_bytes(b"processed")
+        dst = tmp_path / "world.db"
+        staged = []
+        
+        def record(a, b):
+            staged.append(b)
+            _fast_copy2(a, b)
+        
+        with patch('valheim_save_tools_py.wrapper._fast_copy2', side_effect=record):
+            _atomic_copy(str(src), str(dst))
+            _atomic_copy(str(src), str(dst))
+        
+        assert len(set(staged)) == 2
+        assert all(os.path.dirname(path) == str(tmp_path) for path in staged)
+        assert dst.read_bytes() == b"processed"
+    
+    def test_atomic_move_across_filesystems(self, tmp_path):
+        """Test _atomic_move renames, and copies when the rename crosses filesystems."""
+        import errno
+        from valheim_save_tools_py.wrapper import _atomic_move
+        src = tmp_path / "work.db"
+        src.write_bytes(b"processed")
+        dst = tmp_path / "world.db"
+        dst.write_bytes(b"original")
+        
+        real_replace = os.replace
+        
+        def cross_device(a, b):
+            if a == str(src):
+                raise OSError(errno.EXDEV, "Invalid cross-device link")
+            real_replace(a, b)
+        
+        with patch('valheim_save_tools_py.wrapper.os.replace', side_effect=cross_device):
+            _atomic_move(str(src), str(dst))
+        assert dst.read_bytes() == b"processed"
+        assert src.exists()
+        
+        src.write_bytes(b"renamed")
+        _atomic_move(str(src), str(dst))
+        assert dst.read_bytes() == b"renamed"
+        assert not src.exists()
+    
+    def test_fast_copy2_keeps_mtime(self, tmp_path):
+        """Test _fast_copy2 copies timestamps like shutil.copy2."""
+        from valheim_save_tools_py.wrapper import _fast_copy2
+        src = tmp_path / "world.db"
+        src.write_bytes(b"world data")
+        os.utime(src, (1_000_000_000, 1_000_000_000))
+        
+        _fast_copy2(str(src), str(tmp_path / "copy.db"))
+        
+        copy = tmp_path / "copy.db"
+        assert copy.read_bytes() == b"world data"
+        assert copy.stat().st_mtime == 1_000_000_000
+    
+    def test_temp_paths_share_workdir(self, mock_setup):
+        """Test intermediate files are numbered slots in one working directory."""
+        import gc
+        vst = ValheimSaveTools(jar_path="/fake/path.jar")
+        
+        first = vst._temp_path(".json")
+        second = vst._temp_path(".db")
+        
+        assert first != second
+        assert os.path.dirname(first) == os.path.dirname(second)
+        assert second.endswith(".db")
+        workdir = os.path.dirname(first)
+        assert os.path.isdir(workdir)
+        
+        # The directory goes away with the instance, leftovers included
+        open(second, "wb").close()
+        del vst
+        gc.collect()
+        assert not os.path.isdir(workdir)
+    
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_cleanup_thread_reset_in_forked_child(self, tmp_path):
+        """Test a forked child gets its own removal thread instead of hanging on the parent's."""
+        from valheim_save_tools_py.wrapper import _remove_tree_later
+        
+        # Start the parent's removal thread before forking
+        parent_dir = tmp_path / "parent"
+        parent_dir.mkdir()
+        _remove_tree_later(str(parent_dir))
+        _flush_cleanup()
+        
+        child_dir = tmp_path / "child"
+        child_dir.mkdir()
+        pid = os.fork()
+        if pid == 0:
+            import signal
+            signal.alarm(10)  # fail instead of hanging the test run
+            try:
+                _remove_tree_later(str(child_dir))
+                _flush_cleanup()
+                os._exit(0 if not child_dir.exists() else 1)
+            except BaseException:
+                os._exit(2)
+        _, status = os.waitpid(pid, 0)
+        
+        assert os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0
+        assert not parent_dir.exists()
+        assert not child_dir.exists()
+    
+    def test_context_manager_removes_workdir(self, mock_setup):
+        """Test leaving the with block removes the working directory."""
+        with ValheimSaveTools(jar_path="/fake/path.jar") as vst:
+            path = vst._temp_path(".db")
+            open(path, "wb").close()
+            workdir = os.path.dirname(path)
+        
+        assert not os.path.isdir(workdir)
+        
+        # The instance stays usable after close()
+        assert os.path.dirname(vst._temp_path(".db")) != workdir
+        vst.close()
+        vst.close()
     
     @patch('builtins.open', create=True)
     @patch('valheim_save_tools_py.wrapper.subprocess.run')
@@ -203,6 +523,312 @@ class TestFileConversion:
         args = mock_run.call_args[0][0]
         assert "world.json" in args
         assert "world.db" in args
+    
+    @patch('valheim_save_tools_py.wrapper.ValheimSaveTools.run_command')
+    def test_to_json_batch(self, mock_run, vst, tmp_path):
+        """Test batch conversion keeps input order and honours outputs."""
+        inputs = []
+        for name in ("a.db", "b.fwl", "c.fch"):
+            (tmp_path / name).write_bytes(name.encode())
+            inputs.append(tmp_path / name)
+        outputs = [None, tmp_path / "b.json", None]
+        mock_run.side_effect = TestResultCache._fake_convert
+        
+        results = vst.to_json_batch(inputs, outputs, workers=2)
+        
+        assert [r["source"] for r in results] == [str(p) for p in inputs]
+        assert json.loads((tmp_path / "b.json").read_text(encoding="utf-8")) == results[1]
+        assert mock_run.call_count == 3
+    
+    @patch('valheim_save_tools_py.wrapper.subprocess.run')
+    def test_batch_conversions_validate_before_running(self, mock_run, vst):
+        """Test batch conversions reject bad inputs before any JAR process starts."""
+        with pytest.raises(ValueError):
+            vst.to_json_batch(["a.db", "b.json"])
+        with pytest.raises(ValueError):
+            vst.from_json_batch(["a.json", "b.db"])
+        with pytest.raises(ValueError):
+            vst.from_json_batch(["a.json", "b.json"], ["a.db"])
+        
+        mock_run.assert_not_called()
+    
+    @patch('valheim_save_tools_py.wrapper.subprocess.run')
+    def test_from_json_batch(self, mock_run, vst):
+        """Test batch conversion back to save files derives missing outputs."""
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout=None, stderr=""
+        )
+        
+        results = vst.from_json_batch(["a.json", "b.json"], [None, "out.db"])
+        
+        assert results == ["a.db", "out.db"]
+        assert mock_run.call_count == 2
+    
+    @patch('valheim_save_tools_py.wrapper.subprocess.run')
+    def test_file_output_discards_stdout(self, mock_run, vst):
+        """Test conversions writing to a file do not capture the JAR's stdout."""
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout=None, stderr=""
+        )
+        
+        vst.from_json("world.json")
+        
+        kwargs = mock_run.call_args[1]
+        assert kwargs["stdout"] is subprocess.DEVNULL
+        assert kwargs["stderr"] is subprocess.PIPE
+        assert kwargs["text"] is False
+    
+    @patch('valheim_save_tools_py.wrapper.subprocess.run')
+    def test_uncaptured_stderr_decoded_on_error(self, mock_run, vst):
+        """Test byte stderr is decoded for the error message only on failure."""
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=[], returncode=1, stdout=None, stderr="Bad file \u00e9".encode("utf-8")
+        )
+        
+        with pytest.raises(CommandExecutionError) as exc_info:
+            vst.run_command("world.json", "world.db", capture=False)
+        
+        assert "Bad file \u00e9" in str(exc_info.value)
+
+
+class TestResultCache:
+    """Test caching of conversion results."""
+    
+    @staticmethod
+    def _fake_convert(*args, **kwargs):
+        """Write a JSON document to the requested output path."""
+        with open(args[1], "w", encoding="utf-8") as f:
+            json.dump({"source": args[0]}, f)
+        return subprocess.CompletedProcess(args=[], returncode=0, stdout="", stderr="")
+    
+    @patch('valheim_save_tools_py.wrapper.ValheimSaveTools.run_command')
+    def test_to_json_reuses_cached_result(self, mock_run, vst, tmp_path):
+        """Test repeated conversion of an unchanged file runs the JAR once."""
+        db_file = tmp_path / "world.db"
+        db_file.write_bytes(b"world data")
+        mock_run.side_effect = self._fake_convert
+        
+        first = vst.to_json(str(db_file))
+        second = vst.to_json(str(db_file))
+        
+        assert first == second
+        assert first is not second
+        assert mock_run.call_count == 1
+    
+    @patch('valheim_save_tools_py.wrapper.ValheimSaveTools.run_command')
+    def test_cached_result_written_to_output(self, mock_run, vst, tmp_path):
+        """Test a cache hit still writes the requested output file."""
+        db_file = tmp_path / "world.db"
+        db_file.write_bytes(b"world data")
+        out_file = tmp_path / "out.json"
+        mock_run.side_effect = self._fake_convert
+        
+        vst.to_json(str(db_file))
+        data = vst.to_json(str(db_file), str(out_file))
+        
+        assert mock_run.call_count == 1
+        assert json.loads(out_file.read_text(encoding="utf-8")) == data
+    
+    @patch('valheim_save_tools_py.wrapper.ValheimSaveTools.run_command')
+    def test_conversion_output_read_once(self, mock_run, vst, tmp_path):
+        """Test parsing, caching and file-like output share one read of the result."""
+        from io import BytesIO
+        db_file = tmp_path / "world.db"
+        db_file.write_bytes(b"world data")
+        mock_run.side_effect = self._fake_convert
+        out = BytesIO()
+        
+        with patch('valheim_save_tools_py.wrapper.open', create=True, wraps=open) as mock_open:
+            data = vst.to_json(str(db_file), out)
+        
+        assert mock_open.call_count == 1
+        assert json.loads(out.getvalue()) == data
+        assert vst.to_json(str(db_file)) == data
+        assert mock_run.call_count == 1
+    
+    @patch('valheim_save_tools_py.wrapper.ValheimSaveTools.run_command')
+    def test_file_like_output_without_cache(self, mock_run, mock_setup, tmp_path):
+        """Test an uncached conversion to a file-like output reads its result once."""
+        from io import BytesIO
+        vst = ValheimSaveTools(jar_path="/fake/path.jar", cache_size=0)
+        db_file = tmp_path / "world.db"
+        db_file.write_bytes(b"world data")
+        mock_run.side_effect = self._fake_convert
+        out = BytesIO()
+        
+        with patch('valheim_save_tools_py.wrapper.open', create=True, wraps=open) as mock_open:
+            data = vst.to_json(str(db_file), out)
+        
+        assert mock_open.call_count == 1
+        assert json.loads(out.getvalue()) == data
+        assert os.listdir(os.path.dirname(mock_run.call_args[0][1])) == []
+    
+    @patch('valheim_save_tools_py.wrapper.ValheimSaveTools.run_command')
+    def test_cache_hit_stats_input_once(self, mock_run, vst, tmp_path):
+        """Test a cached conversion checks the input file with a single stat."""
+        db_file = tmp_path / "world.db"
+        db_file.write_bytes(b"world data")
+        mock_run.side_effect = self._fake_convert
+        vst.to_json(str(db_file))
+        
+        with patch('valheim_save_tools_py.wrapper.os.stat', wraps=os.stat) as mock_stat:
+            vst.to_json(str(db_file))
+        
+        assert mock_run.call_count == 1
+        assert mock_stat.call_count == 1
+    
+    @patch('valheim_save_tools_py.wrapper.ValheimSaveTools.run_command')
+    def test_mutation_invalidates_cache(self, mock_run, vst, tmp_path):
+        """Test modifying the file causes a fresh conversion."""
+        db_file = tmp_path / "world.db"
+        db_file.write_bytes(b"world data")
+        mock_run.side_effect = self._fake_convert
+        
+        vst.to_json(str(db_file))
+        vst.add_global_key(str(db_file), "defeated_eikthyr")
+        vst.to_json(str(db_file))
+        
+        assert mock_run.call_count == 3
+    
+    @patch('valheim_save_tools_py.wrapper.ValheimSaveTools.run_command')
+    def test_list_global_keys_cached(self, mock_run, vst, tmp_path):
+        """Test global keys of an unchanged file are listed once."""
+        db_file = tmp_path / "world.db"
+        db_file.write_bytes(b"world data")
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout="defeated_eikthyr\nKilledTroll\n", stderr=""
+        )
+        
+        first = vst.list_global_keys(str(db_file))
+        first.append("mutated")
+        second = vst.list_global_keys(str(db_file))
+        
+        assert second == ["defeated_eikthyr", "KilledTroll"]
+        assert mock_run.call_count == 1
+        
+        vst.remove_global_key(str(db_file), "KilledTroll")
+        vst.list_global_keys(str(db_file))
+        assert mock_run.call_count == 3
+    
+    @patch('valheim_save_tools_py.wrapper.ValheimSaveTools.run_command')
+    def test_processor_save_invalidates_keys(self, mock_run, vst, tmp_path):
+        """Test saving a processor result drops cached keys for the output."""
+        db_file = tmp_path / "world.db"
+        db_file.write_bytes(b"world data")
+        
+        def fake_run(*args, **kwargs):
+            if args[1] != "--listGlobalKeys":
+                shutil.copyfile(args[0], args[1])
+            return subprocess.CompletedProcess(
+                args=[], returncode=0, stdout="defeated_eikthyr\n", stderr=""
+            )
+        
+        mock_run.side_effect = fake_run
+        
+        vst.list_global_keys(str(db_file))
+        vst.process(str(db_file)).add_global_key("defeated_bonemass").save()
+        vst.list_global_keys(str(db_file))
+        
+        # Saving drops the cached keys, so the second list runs the JAR again
+        assert mock_run.call_count == 3
+    
+    @patch('valheim_save_tools_py.wrapper.ValheimSaveTools.run_command')
+    def test_processor_invalidates_only_saved_file(self, mock_run, vst, tmp_path):
+        """Test working files are not invalidated, only the file that is saved."""
+        db_file = tmp_path / "world.db"
+        db_file.write_bytes(b"world data")
+        mock_run.side_effect = lambda *args, **kwargs: (
+            None if args[0] == args[1] else shutil.copyfile(args[0], args[1])
+        )
+        
+        with patch.object(vst, '_invalidate', wraps=vst._invalidate) as spy:
+            vst.process(str(db_file)).reset_world().clean_structures().save()
+        
+        spy.assert_called_once_with(str(db_file))
+        assert mock_run.call_count == 2
+    
+    @patch('valheim_save_tools_py.wrapper.ValheimSaveTools.run_command')
+    def test_clear_cache(self, mock_run, vst, tmp_path):
+        """Test clear_cache forces a fresh conversion."""
+        db_file = tmp_path / "world.db"
+        db_file.write_bytes(b"world data")
+        mock_run.side_effect = self._fake_convert
+        
+        vst.to_json(str(db_file))
+        vst.clear_cache()
+        vst.to_json(str(db_file))
+        
+        assert mock_run.call_count == 2
+    
+    @patch('valheim_save_tools_py.wrapper.ValheimSaveTools.run_command')
+    def test_cache_size_bound(self, mock_run, mock_setup, tmp_path):
+        """Test least recently used entries are evicted."""
+        vst = ValheimSaveTools(jar_path="/fake/path.jar", cache_size=1)
+        mock_run.side_effect = self._fake_convert
+        worlds = []
+        for name in ("a.db", "b.db"):
+            db_file = tmp_path / name
+            db_file.write_bytes(name.encode())
+            worlds.append(str(db_file))
+        
+        vst.to_json(worlds[0])
+        vst.to_json(worlds[1])
+        vst.to_json(worlds[0])
+        
+        assert mock_run.call_count == 3
+
+
+    @patch('valheim_save_tools_py.wrapper.ValheimSaveTools.run_command')
+    def test_cache_max_bytes_bound(self, mock_run, mock_setup, tmp_path):
+        """Test the cache evicts by total size and skips results over the limit."""
+        mock_run.side_effect = self._fake_convert
+        worlds = []
+        for name in ("a.db", "b.db"):
+            db_file = tmp_path / name
+            db_file.write_bytes(name.encode())
+            worlds.append(str(db_file))
+        # Room for one result but not two
+        entry_size = len(json.dumps({"source": worlds[0]}))
+        vst = ValheimSaveTools(jar_path="/fake/path.jar", cache_max_bytes=entry_size + 1)
+        
+        vst.to_json(worlds[0])
+        vst.to_json(worlds[1])
+        
+        assert len(vst._cache) == 1
+        assert vst._cache_bytes == entry_size
+        vst.to_json(worlds[1])
+        assert mock_run.call_count == 2
+        
+        vst._cache_max_bytes = 1
+        vst.clear_cache()
+        vst.to_json(worlds[0])
+        assert len(vst._cache) == 0
+        assert vst._cache_bytes == 0
+
+
+class TestJsonBackend:
+    """Test optional orjson decoding."""
+    
+    def test_loads_falls_back_to_json(self):
+        """Test decoding works without orjson installed."""
+        from valheim_save_tools_py import wrapper
+        
+        with patch.object(wrapper, 'orjson', None):
+            assert wrapper._loads(b'{"version": 1}') == {"version": 1}
+    
+    def test_read_json_uses_orjson(self, tmp_path):
+        """Test orjson is used for decoding when available."""
+        from valheim_save_tools_py import wrapper
+        
+        json_file = tmp_path / "world.json"
+        json_file.write_bytes(b'{"version": 1}')
+        fake_orjson = Mock()
+        fake_orjson.loads.return_value = {"decoded": "orjson"}
+        
+        with patch.object(wrapper, 'orjson', fake_orjson):
+            assert wrapper._read_json(str(json_file)) == {"decoded": "orjson"}
+        
+        fake_orjson.loads.assert_called_once_with(b'{"version": 1}')
 
 
 class TestGlobalKeys:
@@ -225,6 +851,18 @@ class TestGlobalKeys:
         assert "world.db" in args
         assert "--listGlobalKeys" in args
     
+    @patch('valheim_save_tools_py.wrapper.subprocess.run')
+    def test_peek_global_keys(self, mock_run, vst):
+        """Test peeking returns a frozenset of keys."""
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout="defeated_eikthyr\nKilledTroll\n", stderr=""
+        )
+        
+        keys = vst.peek_global_keys("world.db")
+        
+        assert keys == frozenset({"defeated_eikthyr", "KilledTroll"})
+        assert "--listGlobalKeys" in mock_run.call_args[0][0]
+    
     @patch('valheim_save_tools_py.wrapper.subprocess.run')
     def test_add_global_key(self, mock_run, vst):
         """Test adding a global key."""
@@ -268,6 +906,45 @@ class TestGlobalKeys:
         args = mock_run.call_args[0][0]
         assert "--removeGlobalKey" in args
         assert "all" in args
+    
+    @patch('valheim_save_tools_py.wrapper.subprocess.run')
+    def test_add_global_keys_single_invocation(self, mock_run, vst):
+        """Test adding several keys runs the JAR once with repeated options."""
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout="", stderr=""
+        )
+        
+        result = vst.add_global_keys(
+            "world.db", ["defeated_eikthyr", "defeated_gdking", "defeated_eikthyr"]
+        )
+        
+        assert result == "world.db"
+        mock_run.assert_called_once()
+        args = mock_run.call_args[0][0]
+        assert args.count("--addGlobalKey") == 2
+        assert "defeated_eikthyr" in args
+        assert "defeated_gdking" in args
+    
+    @patch('valheim_save_tools_py.wrapper.subprocess.run')
+    def test_remove_global_keys_single_invocation(self, mock_run, vst):
+        """Test removing several keys runs the JAR once."""
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout="", stderr=""
+        )
+        
+        vst.remove_global_keys("world.db", ["defeated_bonemass", "defeated_dragon"])
+        
+        mock_run.assert_called_once()
+        args = mock_run.call_args[0][0]
+        assert args.count("--removeGlobalKey") == 2
+    
+    @patch('valheim_save_tools_py.wrapper.subprocess.run')
+    def test_add_global_keys_empty(self, mock_run, vst):
+        """Test an empty key list is rejected."""
+        with pytest.raises(ValueError):
+            vst.add_global_keys("world.db", [])
+        
+        mock_run.assert_not_called()
 
 
 class TestStructureProcessing:
@@ -326,18 +1003,139 @@ class TestStructureProcessing:
         
         result = vst.reset_world("world.db", clean_first=True, clean_threshold=30)
         
-        # Should be called twice: once for clean, once for reset
+        # Clean and reset are fused into a single invocation
+        assert mock_run.call_count == 1
+        
+        args = mock_run.call_args[0][0]
+        assert "--cleanStructures" in args
+        assert "--cleanStructuresThreshold" in args
+        assert "30" in args
+        assert "--resetWorld" in args
+    
+    @patch('valheim_save_tools_py.wrapper.subprocess.run')
+    def test_clean_and_reset(self, mock_run, vst):
+        """Test clean_and_reset runs both steps in one invocation."""
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout="", stderr=""
+        )
+        
+        result = vst.clean_and_reset("world.db", "out.db", threshold=40)
+        
+        assert result == "out.db"
+        mock_run.assert_called_once()
+        args = mock_run.call_args[0][0]
+        assert "world.db" in args
+        assert "out.db" in args
+        assert "--cleanStructures" in args
+        assert "40" in args
+        assert "--resetWorld" in args
+    
+    @patch('valheim_save_tools_py.wrapper.subprocess.run')
+    def test_transform_single_invocation(self, mock_run, vst):
+        """Test transform applies every operation in one invocation."""
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout="", stderr=""
+        )
+        
+        result = vst.transform(
+            "src.db", "dst.db",
+            clean=30, reset=True,
+            add_keys=["defeated_eikthyr", "defeated_eikthyr"],
+            remove_keys="all"
+        )
+        
+        assert result == "dst.db"
+        mock_run.assert_called_once()
+        args = mock_run.call_args[0][0]
+        assert args[args.index("src.db") + 1] == "dst.db"
+        assert args.count("--addGlobalKey") == 1
+        assert args[args.index("--removeGlobalKey") + 1] == "all"
+        assert args[args.index("--cleanStructuresThreshold") + 1] == "30"
+        assert "--resetWorld" in args
+    
+    def test_transform_invalid_input(self, vst):
+        """Test transform rejects non-.db sources."""
+        with pytest.raises(ValueError):
+            vst.transform("world.fwl", "out.db", clean=25)
+
+
+class TestIncrementalClean:
+    """Test skipping redundant clean_structures runs."""
+    
+    @patch('valheim_save_tools_py.wrapper.ValheimSaveTools.run_command')
+    def test_skips_when_cleaned_at_higher_threshold(self, mock_run, vst, tmp_path):
+        """Test a lower-threshold clean of an unchanged file is skipped."""
+        db_file = tmp_path / "world.db"
+        db_file.write_bytes(b"world data")
+        
+        vst.clean_structures(str(db_file), threshold=50)
+        result = vst.clean_structures(str(db_file), threshold=25, incremental=True)
+        
+        assert result == str(db_file)
+        assert mock_run.call_count == 1
+    
+    @patch('valheim_save_tools_py.wrapper.ValheimSaveTools.run_command')
+    def test_runs_for_higher_threshold(self, mock_run, vst, tmp_path):
+        """Test a higher threshold still runs the clean."""
+        db_file = tmp_path / "world.db"
+        db_file.write_bytes(b"world data")
+        
+        vst.clean_structures(str(db_file), threshold=25)
+        vst.clean_structures(str(db_file), threshold=50, incremental=True)
+        
         assert mock_run.call_count == 2
+    
+    @patch('valheim_save_tools_py.wrapper.ValheimSaveTools.run_command')
+    def test_runs_after_file_changes(self, mock_run, vst, tmp_path):
+        """Test a modified file is cleaned again."""
+        db_file = tmp_path / "world.db"
+        db_file.write_bytes(b"world data")
         
-        # First call should be clean_structures
-        first_call_args = mock_run.call_args_list[0][0][0]
-        assert "--cleanStructures" in first_call_args
-        assert "--cleanStructuresThreshold" in first_call_args
-        assert "30" in first_call_args
+        vst.clean_structures(str(db_file), threshold=50)
+        db_file.write_bytes(b"new world data")
+        vst.clean_structures(str(db_file), threshold=25, incremental=True)
         
-        # Second call should be reset_world
-        second_call_args = mock_run.call_args_list[1][0][0]
-        assert "--resetWorld" in second_call_args
+        assert mock_run.call_count == 2
+    
+    @patch('valheim_save_tools_py.wrapper.ValheimSaveTools.run_command')
+    def test_not_incremental_by_default(self, mock_run, vst, tmp_path):
+        """Test cleaning always runs unless incremental is requested."""
+        db_file = tmp_path / "world.db"
+        db_file.write_bytes(b"world data")
+        
+        vst.clean_structures(str(db_file), threshold=50)
+        vst.clean_structures(str(db_file), threshold=25)
+        
+        assert mock_run.call_count == 2
+
+
+class TestBatchClean:
+    """Test parallel batch cleaning."""
+    
+    @patch('valheim_save_tools_py.wrapper.subprocess.run')
+    def test_batch_clean_runs_each_file(self, mock_run, vst):
+        """Test every file is cleaned and results keep input order."""
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout="", stderr=""
+        )
+        files = ["a.db", "b.db", "c.db"]
+        
+        results = vst.batch_clean(files, threshold=40, workers=2)
+        
+        assert results == files
+        assert mock_run.call_count == 3
+        for c in mock_run.call_args_list:
+            args = c[0][0]
+            assert "--cleanStructures" in args
+            assert "40" in args
+    
+    @patch('valheim_save_tools_py.wrapper.subprocess.run')
+    def test_batch_clean_validates_before_running(self, mock_run, vst):
+        """Test invalid files are rejected before any JAR process starts."""
+        with pytest.raises(ValueError):
+            vst.batch_clean(["a.db", "notes.txt"])
+        
+        mock_run.assert_not_called()
 
 
 class TestFlagsIntegration:
@@ -414,6 +1212,7 @@ class TestFileDetection:
         assert ValheimSaveTools.is_db_file("world.db") is True
         assert ValheimSaveTools.is_db_file("world.DB") is True
         assert ValheimSaveTools.is_db_file("/path/to/world.db") is True
+        assert ValheimSaveTools.is_db_file(Path("saves/world.db")) is True
         assert ValheimSaveTools.is_db_file("world.json") is False
     
     def test_is_fwl_file(self):
@@ -454,6 +1253,18 @@ class TestFileDetection:
         assert ValheimSaveTools.is_valheim_file("world.json") is True
         assert ValheimSaveTools.is_valheim_file("world.txt") is False
         assert ValheimSaveTools.is_valheim_file("readme.md") is False
+    
+    def test_file_type_lookups_cached(self):
+        """Test the helpers share one cached lookup per path."""
+        from valheim_save_tools_py.wrapper import _file_type
+        
+        _file_type.cache_clear()
+        assert ValheimSaveTools.is_db_file("/saves/world.db") is True
+        assert ValheimSaveTools.is_json_file("/saves/world.db") is False
+        assert ValheimSaveTools.detect_file_type("/saves/world.db") == "db"
+        
+        info = _file_type.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
 
 
 class TestInputValidation:
@@ -467,6 +1278,14 @@ class TestInputValidation:
         
         assert "not a valid Valheim save file" in str(exc_info.value)
     
+    @patch('valheim_save_tools_py.wrapper.subprocess.run')
+    def test_to_json_rejects_json_input(self, mock_run, vst):
+        """Test to_json rejects .json input without running the JAR."""
+        with pytest.raises(ValueError):
+            vst.to_json("world.json")
+        
+        mock_run.assert_not_called()
+    
     @patch('builtins.open', create=True)
     @patch('valheim_save_tools_py.wrapper.subprocess.run')
     def test_to_json_accepts_db(self, mock_run, mock_open, vst):
@@ -576,10 +1395,11 @@ class TestSaveFileProcessor:
         assert "not a valid .db file" in str(exc_info.value)
     
     @patch('valheim_save_tools_py.wrapper.subprocess.run')
-    @patch('valheim_save_tools_py.wrapper.shutil.copy2')
+    @patch('valheim_save_tools_py.wrapper._fast_copy2')
     @patch('valheim_save_tools_py.wrapper.os.path.exists')
     @patch('valheim_save_tools_py.wrapper.os.remove')
-    def test_single_operation_chain(self, mock_remove, mock_exists, mock_copy, mock_run, vst):
+    @patch('valheim_save_tools_py.wrapper.shutil.copymode')
+    def test_single_operation_chain(self, mock_copymode, mock_remove, mock_exists, mock_copy, mock_run, vst):
         """Test chaining a single operation."""
         mock_run.return_value = subprocess.CompletedProcess(
             args=[], returncode=0, stdout="", stderr=""
@@ -593,10 +1413,11 @@ class TestSaveFileProcessor:
         assert any("--cleanStructures" in str(call) for call in mock_run.call_args_list)
     
     @patch('valheim_save_tools_py.wrapper.subprocess.run')
-    @patch('valheim_save_tools_py.wrapper.shutil.copy2')
+    @patch('valheim_save_tools_py.wrapper._fast_copy2')
     @patch('valheim_save_tools_py.wrapper.os.path.exists')
     @patch('valheim_save_tools_py.wrapper.os.remove')
-    def test_multiple_operations_chain(self, mock_remove, mock_exists, mock_copy, mock_run, vst):
+    @patch('valheim_save_tools_py.wrapper.shutil.copymode')
+    def test_multiple_operations_chain(self, mock_copymode, mock_remove, mock_exists, mock_copy, mock_run, vst):
         """Test chaining multiple operations."""
         mock_run.return_value = subprocess.CompletedProcess(
             args=[], returncode=0, stdout="", stderr=""
@@ -614,10 +1435,50 @@ class TestSaveFileProcessor:
         assert any("--resetWorld" in str(call) for call in mock_run.call_args_list)
     
     @patch('valheim_save_tools_py.wrapper.subprocess.run')
-    @patch('valheim_save_tools_py.wrapper.shutil.copy2')
+    @patch('valheim_save_tools_py.wrapper._fast_copy2')
+    @patch('valheim_save_tools_py.wrapper.os.path.exists')
+    @patch('valheim_save_tools_py.wrapper.os.remove')
+    @patch('valheim_save_tools_py.wrapper.shutil.copymode')
+    def test_reset_world_clean_first_chain(self, mock_copymode, mock_remove, mock_exists, mock_copy, mock_run, vst):
+        """Test reset_world(clean_first=True) cleans and resets in one invocation."""
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout="", stderr=""
+        )
+        mock_exists.return_value = True
+        
+        vst.process("world.db").reset_world(clean_first=True, clean_threshold=40).save("output.db")
+        
+        mock_run.assert_called_once()
+        args = mock_run.call_args[0][0]
+        assert args[args.index("--cleanStructuresThreshold") + 1] == "40"
+        assert args.index("--cleanStructures") < args.index("--resetWorld")
+    
+    @patch('valheim_save_tools_py.wrapper.subprocess.run')
+    @patch('valheim_save_tools_py.wrapper._fast_copy2')
+    @patch('valheim_save_tools_py.wrapper.shutil.copymode')
+    def test_save_to_new_path_skips_working_copy(self, mock_copymode, mock_copy, mock_run, vst, tmp_path):
+        """Test saving to another file lets the JAR write it without staging a copy."""
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout="", stderr=""
+        )
+        db_file = tmp_path / "world.db"
+        db_file.write_bytes(b"world data")
+        output = str(tmp_path / "output.db")
+        
+        processor = vst.process(str(db_file)).clean_structures()
+        assert processor.save(output) == output
+        
+        mock_copy.assert_not_called()
+        args = mock_run.call_args[0][0]
+        assert args[args.index(str(db_file)) + 1] == output
+        assert processor._temp_dir is None
+    
+    @patch('valheim_save_tools_py.wrapper.subprocess.run')
+    @patch('valheim_save_tools_py.wrapper._fast_copy2')
     @patch('valheim_save_tools_py.wrapper.os.path.exists')
     @patch('valheim_save_tools_py.wrapper.os.remove')
-    def test_global_keys_in_chain(self, mock_remove, mock_exists, mock_copy, mock_run, vst):
+    @patch('valheim_save_tools_py.wrapper.shutil.copymode')
+    def test_global_keys_in_chain(self, mock_copymode, mock_remove, mock_exists, mock_copy, mock_run, vst):
         """Test chaining global key operations."""
         mock_run.return_value = subprocess.CompletedProcess(
             args=[], returncode=0, stdout="", stderr=""
@@ -630,29 +1491,115 @@ class TestSaveFileProcessor:
                      .save("output.db"))
         
         assert result == "output.db"
-        # Both add operations should be called
+        # Both keys are added in a single invocation
         add_calls = [call for call in mock_run.call_args_list 
                      if "--addGlobalKey" in str(call)]
-        assert len(add_calls) == 2
+        assert len(add_calls) == 1
+        args = add_calls[0][0][0]
+        assert args.count("--addGlobalKey") == 2
+        assert "defeated_eikthyr" in args
+        assert "defeated_elder" in args
     
-    @patch('valheim_save_tools_py.wrapper.subprocess.run')
-    @patch('valheim_save_tools_py.wrapper.shutil.copy2')
-    @patch('valheim_save_tools_py.wrapper.os.path.exists')
-    @patch('valheim_save_tools_py.wrapper.os.remove')
-    def test_save_without_output_overwrites(self, mock_remove, mock_exists, mock_copy, mock_run, vst):
+    @staticmethod
+    def _fake_process(*args, **kwargs):
+        """Write a new result file the way the JAR does, with the default mode."""
+        _safe_unlink(args[1])
+        with open(args[1], "wb") as f:
+            f.write(b"processed")
+        return subprocess.CompletedProcess(args=[], returncode=0, stdout="", stderr="")
+    
+    @patch('valheim_save_tools_py.wrapper.ValheimSaveTools.run_command')
+    def test_save_without_output_overwrites(self, mock_run, vst, tmp_path):
         """Test save() without output file overwrites original."""
-        mock_run.return_value = subprocess.CompletedProcess(
-            args=[], returncode=0, stdout="", stderr=""
-        )
-        mock_exists.return_value = True
+        db_file = tmp_path / "world.db"
+        db_file.write_bytes(b"world data")
+        mock_run.side_effect = self._fake_process
         
-        result = vst.process("world.db").clean_structures().save()
+        result = vst.process(str(db_file)).clean_structures().save()
         
-        assert result == "world.db"
+        assert result == str(db_file)
+        assert db_file.read_bytes() == b"processed"
+    
+    @patch('valheim_save_tools_py.wrapper.ValheimSaveTools.run_command')
+    def test_overwrite_keeps_input_mode(self, mock_run, vst, tmp_path):
+        """Test overwriting a save through save() or a with block keeps its mode."""
+        db_file = tmp_path / "world.db"
+        db_file.write_bytes(b"world data")
+        os.chmod(db_file, 0o600)
+        mock_run.side_effect = self._fake_process
+        
+        vst.process(str(db_file)).clean_structures().save()
+        assert db_file.stat().st_mode & 0o777 == 0o600
+        
+        with vst.process(str(db_file)) as processor:
+            processor.reset_world()
+        assert db_file.stat().st_mode & 0o777 == 0o600
+        assert db_file.read_bytes() == b"processed"
+    
+    @staticmethod
+    def _fake_keys_jar(*args, **kwargs):
+        """Keep a world's global keys as lines of text, like a tiny JAR."""
+        if "--listGlobalKeys" in args:
+            with open(args[0], encoding="utf-8") as f:
+                keys = f.read()
+            return subprocess.CompletedProcess(args=[], returncode=0, stdout=keys, stderr="")
+        with open(args[0], encoding="utf-8") as f:
+            keys = f.read().split()
+        for option, value in zip(args, args[1:]):
+            if option == "--removeGlobalKey":
+                keys.remove(value)
+            elif option == "--addGlobalKey":
+                keys.append(value)
+        _safe_unlink(args[1])
+        with open(args[1], "w", encoding="utf-8") as f:
+            f.write("\n".join(keys))
+        return subprocess.CompletedProcess(args=[], returncode=0, stdout="", stderr="")
+    
+    @patch('valheim_save_tools_py.wrapper.ValheimSaveTools.run_command')
+    def test_overwrite_advances_mtime(self, mock_run, vst, tmp_path):
+        """Test overwriting a save gives it a new mtime, so no cache serves stale keys."""
+        db_file = tmp_path / "world.db"
+        db_file.write_text("aaa", encoding="utf-8")
+        mock_run.side_effect = self._fake_keys_jar
+        
+        def backdate():
+            # Leave room for the rewrite to land on a later mtime
+            old = db_file.stat().st_mtime_ns - 10**9
+            os.utime(db_file, ns=(old, old))
+            return old
+        
+        old_mtime = backdate()
+        assert vst.list_global_keys(str(db_file)) == ["aaa"]
+        vst.process(str(db_file)).remove_global_key("aaa").add_global_key("bbb").save()
+        assert db_file.stat().st_mtime_ns > old_mtime
+        assert ValheimSaveTools(jar_path="/fake/path.jar").list_global_keys(str(db_file)) == ["bbb"]
+        
+        old_mtime = backdate()
+        other = ValheimSaveTools(jar_path="/fake/path.jar")
+        assert other.list_global_keys(str(db_file)) == ["bbb"]
+        with vst.process(str(db_file)) as processor:
+            processor.remove_global_key("bbb").add_global_key("ccc")
+        assert db_file.stat().st_mtime_ns > old_mtime
+        assert other.list_global_keys(str(db_file)) == ["ccc"]
+    
+    @patch('valheim_save_tools_py.wrapper.ValheimSaveTools.run_command')
+    def test_save_to_new_path_keeps_input_mode(self, mock_run, vst, tmp_path):
+        """Test a result the JAR writes straight to a new output gets the input's mode."""
+        db_file = tmp_path / "world.db"
+        db_file.write_bytes(b"world data")
+        os.chmod(db_file, 0o600)
+        out_file = tmp_path / "out.db"
+        mock_run.side_effect = self._fake_process
+        
+        result = vst.process(str(db_file)).add_global_key("defeated_eikthyr").save(str(out_file))
+        
+        assert result == str(out_file)
+        assert out_file.read_bytes() == b"processed"
+        assert out_file.stat().st_mode & 0o777 == 0o600
     
     @patch('builtins.open', create=True)
     @patch('valheim_save_tools_py.wrapper.subprocess.run')
-    @patch('valheim_save_tools_py.wrapper.shutil.copy2')
+    @patch('valheim_save_tools_py.wrapper._fast_copy2')
     @patch('valheim_save_tools_py.wrapper.os.path.exists')
     @patch('valheim_save_tools_py.wrapper.os.remove')
     def test_to_json_after_operations(self, mock_remove, mock_exists, mock_copy, mock_run, mock_open, vst):
@@ -680,8 +1627,50 @@ class TestSaveFileProcessor:
         last_call_args = str(mock_run.call_args_list[-1])
         assert "output.json" in last_call_args
     
+    @patch('valheim_save_tools_py.wrapper.ValheimSaveTools.run_command')
+    def test_to_json_fuses_conversion(self, mock_run, vst, tmp_path):
+        """Test the last operations and the JSON conversion share one invocation."""
+        db_file = tmp_path / "world.db"
+        db_file.write_bytes(b"world data")
+        out_file = tmp_path / "out.json"
+        mock_run.side_effect = TestResultCache._fake_convert
+        
+        data = (vst.process(str(db_file))
+                   .clean_structures(threshold=30)
+                   .reset_world()
+                   .to_json(str(out_file)))
+        
+        assert data == {"source": str(db_file)}
+        mock_run.assert_called_once()
+        args = mock_run.call_args[0]
+        assert args[:2] == (str(db_file), str(out_file))
+        assert "--cleanStructures" in args
+        assert "--resetWorld" in args
+        assert db_file.read_bytes() == b"world data"
+    
+    @patch('valheim_save_tools_py.wrapper.ValheimSaveTools.run_command')
+    def test_to_json_applies_earlier_groups_first(self, mock_run, vst, tmp_path):
+        """Test operations needing separate runs go through a working file."""
+        db_file = tmp_path / "world.db"
+        db_file.write_bytes(b"world data")
+        mock_run.side_effect = lambda *args, **kwargs: (
+            TestResultCache._fake_convert(*args) if args[1].endswith(".json") else None
+        )
+        
+        vst.process(str(db_file)).reset_world().clean_structures().to_json()
+        
+        assert mock_run.call_count == 2
+        first, second = (c[0] for c in mock_run.call_args_list)
+        # The first run reads the input and writes the working file itself
+        assert first[0] == str(db_file)
+        assert first[1] != str(db_file)
+        assert "--resetWorld" in first
+        assert second[0] == first[1]
+        assert second[1].endswith(".json")
+        assert "--cleanStructures" in second
+    
     @patch('valheim_save_tools_py.wrapper.subprocess.run')
-    @patch('valheim_save_tools_py.wrapper.shutil.copy2')
+    @patch('valheim_save_tools_py.wrapper._fast_copy2')
     @patch('valheim_save_tools_py.wrapper.os.path.exists')
     def test_no_operations_save(self, mock_exists, mock_copy, mock_run, vst):
         """Test save() with no operations queued."""
@@ -696,6 +1685,97 @@ class TestSaveFileProcessor:
         # Should just copy the file
         mock_copy.assert_called()
     
+    @patch('valheim_save_tools_py.wrapper.subprocess.run')
+    @patch('valheim_save_tools_py.wrapper._fast_copy2')
+    @patch('valheim_save_tools_py.wrapper.os.path.exists')
+    @patch('valheim_save_tools_py.wrapper.os.remove')
+    @patch('valheim_save_tools_py.wrapper.shutil.copymode')
+    def test_chain_runs_single_invocation(self, mock_copymode, mock_remove, mock_exists, mock_copy, mock_run, vst):
+        """Test an in-order chain is executed by one JAR invocation."""
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout="", stderr=""
+        )
+        mock_exists.return_value = True
+        
+        (vst.process("world.db")
+            .remove_global_key("defeated_dragon")
+            .add_global_key("defeated_eikthyr")
+            .clean_structures(threshold=30)
+            .reset_world()
+            .save("output.db"))
+        
+        mock_run.assert_called_once()
+        args = mock_run.call_args[0][0]
+        for option in ("--removeGlobalKey", "--addGlobalKey", "--cleanStructures", "--resetWorld"):
+            assert option in args
+    
+    def test_plan_invocations_splits_out_of_order(self):
+        """Test structural operations are split where the JAR order would change results."""
+        from valheim_save_tools_py.wrapper import _plan_invocations
+        
+        plan = _plan_invocations([
+            ('reset_world', {}),
+            ('clean_structures', {'threshold': 10}),
+            ('clean_structures', {'threshold': 50}),
+            ('add_global_key', {'key': 'a'}),
+        ])
+        
+        assert plan == [
+            ["--addGlobalKey", "a", "--resetWorld"],
+            ["--cleanStructures", "--cleanStructuresThreshold", "10"],
+            ["--cleanStructures", "--cleanStructuresThreshold", "50"],
+        ]
+    
+    def test_plan_invocations_rejects_unknown_operation(self):
+        """Test an unknown queued operation is reported instead of ignored."""
+        from valheim_save_tools_py.wrapper import _plan_invocations
+        
+        with pytest.raises(ValueError, match="Unknown operation: compact"):
+            _plan_invocations([('compact', {})])
+    
+    def test_plan_invocations_drops_repeated_reset(self):
+        """Test back-to-back resets run once, while a clean in between keeps both."""
+        from valheim_save_tools_py.wrapper import _plan_invocations
+        
+        plan = _plan_invocations([
+            ('clean_structures', {'threshold': 25}),
+            ('reset_world', {}),
+            ('reset_world', {}),
+        ])
+        assert plan == [["--cleanStructures", "--cleanStructuresThreshold", "25", "--resetWorld"]]
+        
+        plan = _plan_invocations([
+            ('reset_world', {}),
+            ('clean_structures', {'threshold': 25}),
+            ('reset_world', {}),
+        ])
+        assert plan == [
+            ["--resetWorld"],
+            ["--cleanStructures", "--cleanStructuresThreshold", "25", "--resetWorld"],
+        ]
+    
+    def test_plan_invocations_normalizes_keys(self):
+        """Test only the net effect of key operations reaches the JAR."""
+        from valheim_save_tools_py.wrapper import _plan_invocations
+        
+        plan = _plan_invocations([
+            ('add_global_key', {'key': 'a'}),
+            ('add_global_key', {'key': 'a'}),
+            ('add_global_key', {'key': 'b'}),
+            ('remove_global_key', {'key': 'b'}),
+            ('remove_global_key', {'key': 'c'}),
+            ('add_global_key', {'key': 'c'}),
+        ])
+        assert plan == [["--addGlobalKey", "a", "--removeGlobalKey", "b", "--addGlobalKey", "c"]]
+        
+        plan = _plan_invocations([
+            ('add_global_key', {'key': 'a'}),
+            ('clear_all_global_keys', {}),
+            ('remove_global_key', {'key': 'b'}),
+            ('add_global_key', {'key': 'c'}),
+        ])
+        assert plan == [["--removeGlobalKey", "all", "--addGlobalKey", "c"]]
+    
     @patch('valheim_save_tools_py.wrapper.subprocess.run')
     def test_processor_repr(self, mock_run, vst):
         """Test SaveFileProcessor string representation."""
@@ -704,20 +1784,61 @@ class TestSaveFileProcessor:
         repr_str = repr(processor)
         assert "SaveFileProcessor" in repr_str
         assert "world.db" in repr_str
-        assert "clean_structures" in repr_str
-        assert "reset_world" in repr_str
+        assert "ops=2" in repr_str
+        
+        description = processor.describe()
+        assert "world.db" in description
+        assert "clean_structures" in description
+        assert "reset_world" in description
 
 
 class TestContextManager:
     """Test context manager functionality."""
     
+    @patch('valheim_save_tools_py.wrapper.ValheimSaveTools.run_command')
+    def test_working_copies_share_temp_dir(self, mock_run, vst, tmp_path):
+        """Test working copies live in one temp directory removed on exit."""
+        db_file = tmp_path / "world.db"
+        db_file.write_bytes(b"world data")
+        
+        with vst.process(str(db_file)) as processor:
+            temp_dir = processor._temp_dir
+            processor.clean_structures()
+            extra_copy = processor._make_working_copy(str(db_file))
+            assert str(Path(extra_copy).parent) == temp_dir
+            assert extra_copy != processor._current_file
+        
+        assert mock_run.call_count == 1
+        _flush_cleanup()
+        assert not os.path.exists(temp_dir)
+        assert processor._temp_dir is None
+        
+        # Later processors reuse the instance's working directory
+        with vst.process(str(db_file)) as processor:
+            assert os.path.dirname(processor._temp_dir) == os.path.dirname(temp_dir)
+    
+    @patch('valheim_save_tools_py.wrapper.ValheimSaveTools.run_command')
+    def test_scratch_dir_override(self, mock_run, vst, tmp_path):
+        """Test VALHEIM_SCRATCH_DIR chooses where working copies are made."""
+        db_file = tmp_path / "world.db"
+        db_file.write_bytes(b"world data")
+        scratch = tmp_path / "ramdisk"
+        scratch.mkdir()
+        
+        with patch.dict(os.environ, {"VALHEIM_SCRATCH_DIR": str(scratch)}):
+            with vst.process(str(db_file)) as processor:
+                assert processor._temp_dir.startswith(str(scratch))
+            assert os.path.dirname(vst._temp_path(".db")).startswith(str(scratch))
+    
     @patch('valheim_save_tools_py.wrapper.subprocess.run')
-    @patch('valheim_save_tools_py.wrapper.shutil.copy2')
+    @patch('valheim_save_tools_py.wrapper._fast_copy2')
     @patch('valheim_save_tools_py.wrapper.os.path.exists')
     @patch('valheim_save_tools_py.wrapper.os.remove')
     @patch('valheim_save_tools_py.wrapper.os.rmdir')
     @patch('valheim_save_tools_py.wrapper.os.listdir')
-    def test_context_manager_basic(self, mock_listdir, mock_rmdir, mock_remove, 
+    @patch('valheim_save_tools_py.wrapper.os.replace')
+    @patch('valheim_save_tools_py.wrapper.shutil.copymode')
+    def test_context_manager_basic(self, mock_copymode, mock_replace, mock_listdir, mock_rmdir, mock_remove, 
                                    mock_exists, mock_copy, mock_run, vst):
         """Test basic context manager usage."""
         mock_run.return_value = subprocess.CompletedProcess(
@@ -734,12 +1855,14 @@ class TestContextManager:
         assert mock_copy.called
     
     @patch('valheim_save_tools_py.wrapper.subprocess.run')
-    @patch('valheim_save_tools_py.wrapper.shutil.copy2')
+    @patch('valheim_save_tools_py.wrapper._fast_copy2')
     @patch('valheim_save_tools_py.wrapper.os.path.exists')
     @patch('valheim_save_tools_py.wrapper.os.remove')
     @patch('valheim_save_tools_py.wrapper.os.rmdir')
     @patch('valheim_save_tools_py.wrapper.os.listdir')
-    def test_context_manager_multiple_operations(self, mock_listdir, mock_rmdir, 
+    @patch('valheim_save_tools_py.wrapper.os.replace')
+    @patch('valheim_save_tools_py.wrapper.shutil.copymode')
+    def test_context_manager_multiple_operations(self, mock_copymode, mock_replace, mock_listdir, mock_rmdir, 
                                                   mock_remove, mock_exists, mock_copy, 
                                                   mock_run, vst):
         """Test context manager with multiple operations."""
@@ -760,12 +1883,14 @@ class TestContextManager:
         assert any("--addGlobalKey" in str(call) for call in mock_run.call_args_list)
     
     @patch('valheim_save_tools_py.wrapper.subprocess.run')
-    @patch('valheim_save_tools_py.wrapper.shutil.copy2')
+    @patch('valheim_save_tools_py.wrapper._fast_copy2')
     @patch('valheim_save_tools_py.wrapper.os.path.exists')
     @patch('valheim_save_tools_py.wrapper.os.remove')
     @patch('valheim_save_tools_py.wrapper.os.rmdir')
     @patch('valheim_save_tools_py.wrapper.os.listdir')
-    def test_context_manager_chaining(self, mock_listdir, mock_rmdir, mock_remove, 
+    @patch('valheim_save_tools_py.wrapper.os.replace')
+    @patch('valheim_save_tools_py.wrapper.shutil.copymode')
+    def test_context_manager_chaining(self, mock_copymode, mock_replace, mock_listdir, mock_rmdir, mock_remove, 
                                       mock_exists, mock_copy, mock_run, vst):
         """Test context manager with method chaining."""
         mock_run.return_value = subprocess.CompletedProcess(
@@ -777,12 +1902,17 @@ class TestContextManager:
         with vst.process("world.db") as processor:
             processor.clean_structures().reset_world().add_global_key("defeated_elder")
         
-        # All chained operations should execute
+        # Key changes don't interact with clean or reset, so everything
+        # runs in one invocation
         call_count = len(mock_run.call_args_list)
-        assert call_count >= 3
+        assert call_count == 1
+        args = mock_run.call_args_list[0][0][0]
+        assert "--cleanStructures" in args
+        assert "--resetWorld" in args
+        assert "--addGlobalKey" in args
     
     @patch('valheim_save_tools_py.wrapper.subprocess.run')
-    @patch('valheim_save_tools_py.wrapper.shutil.copy2')
+    @patch('valheim_save_tools_py.wrapper._fast_copy2')
     @patch('valheim_save_tools_py.wrapper.os.path.exists')
     @patch('valheim_save_tools_py.wrapper.os.remove')
     @patch('valheim_save_tools_py.wrapper.os.rmdir')
@@ -804,7 +1934,7 @@ class TestContextManager:
         assert mock_copy.called
     
     @patch('valheim_save_tools_py.wrapper.subprocess.run')
-    @patch('valheim_save_tools_py.wrapper.shutil.copy2')
+    @patch('valheim_save_tools_py.wrapper._fast_copy2')
     @patch('valheim_save_tools_py.wrapper.os.path.exists')
     @patch('valheim_save_tools_py.wrapper.os.remove')
     @patch('valheim_save_tools_py.wrapper.os.rmdir')
@@ -817,21 +1947,25 @@ class TestContextManager:
         mock_exists.return_value = True
         mock_listdir.return_value = []
         
-        with pytest.raises(Exception) as exc_info:
-            with vst.process("world.db") as processor:
-                processor.clean_structures()
+        with patch('valheim_save_tools_py.wrapper._remove_tree_later') as mock_cleanup:
+            with pytest.raises(Exception) as exc_info:
+                with vst.process("world.db") as processor:
+                    temp_dir = processor._temp_dir
+                    processor.clean_structures()
         
         assert "Test error" in str(exc_info.value)
-        # Cleanup should still be called
-        assert mock_remove.called or mock_rmdir.called
+        # Cleanup should still be queued
+        mock_cleanup.assert_called_once_with(temp_dir)
     
     @patch('valheim_save_tools_py.wrapper.subprocess.run')
-    @patch('valheim_save_tools_py.wrapper.shutil.copy2')
+    @patch('valheim_save_tools_py.wrapper._fast_copy2')
     @patch('valheim_save_tools_py.wrapper.os.path.exists')
     @patch('valheim_save_tools_py.wrapper.os.remove')
     @patch('valheim_save_tools_py.wrapper.os.rmdir')
     @patch('valheim_save_tools_py.wrapper.os.listdir')
-    def test_context_manager_overwrites_original(self, mock_listdir, mock_rmdir, 
+    @patch('valheim_save_tools_py.wrapper.os.replace')
+    @patch('valheim_save_tools_py.wrapper.shutil.copymode')
+    def test_context_manager_overwrites_original(self, mock_copymode, mock_replace, mock_listdir, mock_rmdir, 
                                                   mock_remove, mock_exists, mock_copy, 
                                                   mock_run, vst):
         """Test context manager overwrites original file."""
@@ -844,7 +1978,6 @@ class TestContextManager:
         with vst.process("world.db") as processor:
             processor.clean_structures()
         
-        # Should copy the processed file back to the original
-        copy_calls = mock_copy.call_args_list
-        # At least one call should copy to world.db
-        assert any("world.db" in str(call) for call in copy_calls)
+        # Should rename the processed working copy over the original
+        working_copy = mock_copy.call_args_list[-1][0][1]
+        mock_replace.assert_called_once_with(working_copy, os.path.realpath("world.db"))